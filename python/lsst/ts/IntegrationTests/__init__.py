@@ -27,54 +27,234 @@ try:
 except ImportError:
     __version__ = "?"
 
-from .base_script import *  # isort: skip
-from .base_point_azel import *  # isort: skip
-from .auxtel_daytime_atpneumatics import *
-from .auxtel_daytime_latiss import *
-from .auxtel_daytime_slew_and_take_image import *
-from .auxtel_daytime_telescope_and_dome import *
-from .auxtel_disabled_enabled import *
-from .auxtel_enable_atcs import *
-from .auxtel_housekeeping import *
-from .auxtel_latiss_acquire import *
-from .auxtel_latiss_calibrations import *
-from .auxtel_latiss_take_sequence import *
-from .auxtel_latiss_wep_align import *
-from .auxtel_offline_standby import *
-from .auxtel_point_azel import *
-from .auxtel_prepare_for_flat import *
-from .auxtel_prepare_for_onsky import *
-from .auxtel_reset_offsets import *
-from .auxtel_shutdown import *
-from .auxtel_standby_disabled import *
-from .auxtel_stop import *
-from .auxtel_track_target import *
-from .auxtel_visit import *
-from .comcam_calibrations import *
-from .csc_state_transition import *
-from .eas_disabled_enabled import *
-from .eas_standby_disabled import *
-from .enabled_offline import *
-from .failing_script_queue_controller import *
-from .gencam_disabled_enabled import *
-from .gencam_standby_disabled import *
-from .image_taking_verification import *
-from .load_camera_playlist import *
-from .love_stress_test import *
-from .lsstcam_calibrations import *
-from .maintel_csc_end_of_night import *
-from .maintel_disabled_enabled import *
-from .maintel_housekeeping import *
-from .maintel_lower_m1m3 import *
-from .maintel_move_rotator import *
-from .maintel_open_mirror_covers import *
-from .maintel_point_azel import *
-from .maintel_slew_dome import *
-from .maintel_standby_disabled import *
-from .obssys_disabled_enabled import *
-from .obssys_standby_disabled import *
-from .run_command import *
-from .script_queue_controller import *
-from .testutils import *
-from .utils import *
-from .yaml_test_strings import *
+import importlib
+import sys
+import types
+from typing import Any
+
+# The public names of the package, keyed by the module defining them.
+# A module is only imported when one of its names is first accessed (see
+# __getattr__), so each console script imports just the modules it uses.
+_module_names: dict[str, tuple[str, ...]] = {
+    "base_script": ("BaseScript",),
+    "base_point_azel": ("BasePointAzEl",),
+    "auxtel_daytime_atpneumatics": (
+        "ATPneumaticsCheckout",
+        "run_atpneumatics_checkout",
+    ),
+    "auxtel_daytime_latiss": ("AuxTelLatissCheckout", "run_auxtel_latiss_checkout"),
+    "auxtel_daytime_slew_and_take_image": (
+        "SlewAndTakeImageCheckout",
+        "run_auxtel_slew_and_take_image_checkout",
+    ),
+    "auxtel_daytime_telescope_and_dome": (
+        "AuxTelTelescopeAndDomeCheckout",
+        "run_auxtel_telescope_and_dome_checkout",
+    ),
+    "auxtel_disabled_enabled": ("AuxTelDisabledEnabled", "run_auxtel_disabled_enabled"),
+    "auxtel_enable_atcs": ("AuxTelEnableATCS", "run_auxtel_enable_atcs"),
+    "auxtel_housekeeping": ("AuxTelHousekeeping", "run_auxtel_housekeeping"),
+    "auxtel_latiss_acquire": ("AuxTelLatissAcquire", "run_auxtel_latiss_acquire"),
+    "auxtel_latiss_calibrations": (
+        "AuxTelLatissCalibrations",
+        "run_auxtel_latiss_calibrations",
+    ),
+    "auxtel_latiss_take_sequence": (
+        "AuxTelLatissTakeSequence",
+        "run_auxtel_latiss_take_sequence",
+    ),
+    "auxtel_latiss_wep_align": ("AuxTelLatissWEPAlign", "run_auxtel_latiss_wep_align"),
+    "auxtel_offline_standby": ("AuxTelOfflineStandby", "run_auxtel_offline_standby"),
+    "auxtel_point_azel": ("AuxTelPointAzEl", "run_auxtel_point_azel"),
+    "auxtel_prepare_for_flat": ("AuxTelPrepareFlat", "run_auxtel_prepare_for_flat"),
+    "auxtel_prepare_for_onsky": ("AuxTelPrepareOnSky", "run_auxtel_prepare_for_onsky"),
+    "auxtel_reset_offsets": ("AuxTelResetOffsets", "run_auxtel_reset_offsets"),
+    "auxtel_shutdown": ("AuxTelShutdown", "run_auxtel_shutdown"),
+    "auxtel_standby_disabled": ("AuxTelStandbyDisabled", "run_auxtel_standby_disabled"),
+    "auxtel_stop": ("AuxTelStop", "run_auxtel_stop"),
+    "auxtel_track_target": ("AuxTelTrackTarget", "run_auxtel_track_target"),
+    "auxtel_visit": ("AuxTelVisit", "run_auxtel_visit"),
+    "campaign": (
+        "CampaignNode",
+        "Campaign",
+        "CampaignReport",
+        "run_campaign",
+        "run_campaign_file",
+    ),
+    "clock": ("Clock", "VirtualClock", "get_default_clock", "set_default_clock"),
+    "comcam_calibrations": ("ComCamCalibrations", "run_comcam_calibrations"),
+    "command_parameters": (
+        "split_parameters",
+        "ParameterParser",
+        "get_command_fields",
+        "get_parameter_parser",
+    ),
+    "config_validation": (
+        "ConfigValidation",
+        "RegistryValidationReport",
+        "get_config_script",
+        "validate_config",
+        "validate_registry",
+        "run_validate_configs",
+    ),
+    "csc_state_transition": (
+        "expand_csc_patterns",
+        "CSCStateTransition",
+        "csc_state_transition",
+    ),
+    "daemon": ("IntegrationTestsDaemon", "run_daemon"),
+    "daemon_client": ("get_socket_path", "send_request", "run_client"),
+    "dispatcher": (
+        "commands",
+        "get_entry_point",
+        "read_batch_file",
+        "redirect_output",
+        "collect_scripts",
+        "run_invocations",
+        "run_integration_tests",
+    ),
+    "eas_disabled_enabled": ("EasDisabledEnabled", "run_eas_disabled_enabled"),
+    "eas_standby_disabled": ("EasStandbyDisabled", "run_eas_standby_disabled"),
+    "enabled_offline": ("EnabledOffline", "run_enabled_offline"),
+    "failing_script_queue_controller": ("FailingScriptQueueController",),
+    "gencam_disabled_enabled": ("GenCamDisabledEnabled", "run_gencam_disabled_enabled"),
+    "gencam_standby_disabled": ("GenCamStandbyDisabled", "run_gencam_standby_disabled"),
+    "image_taking_verification": (
+        "AuxTelImageTaking",
+        "ComCamImageTaking",
+        "LsstCamImageTaking",
+        "run_auxtel_image_taking",
+        "run_comcam_image_taking",
+        "run_lsstcam_image_taking",
+    ),
+    "load_camera_playlist": ("LoadCameraPlaylist", "load_camera_playlist"),
+    "love_stress_test": ("LoveStressTest", "run_love_stress_test"),
+    "lsstcam_calibrations": ("LsstCamCalibrations", "run_lsstcam_calibrations"),
+    "maintel_csc_end_of_night": ("MainTelCscEndOfNight", "maintel_csc_end_of_night"),
+    "maintel_disabled_enabled": (
+        "MainTelDisabledEnabled",
+        "run_maintel_disabled_enabled",
+    ),
+    "maintel_housekeeping": (
+        "ComCamHousekeeping",
+        "LsstCamHousekeeping",
+        "MainTelHousekeeping",
+        "run_comcam_housekeeping",
+        "run_lsstcam_housekeeping",
+        "run_maintel_housekeeping",
+    ),
+    "maintel_lower_m1m3": ("MainTelLowerM1M3", "maintel_lower_m1m3"),
+    "maintel_move_rotator": ("MainTelMoveRotator", "maintel_move_rotator"),
+    "maintel_open_mirror_covers": (
+        "MainTelOpenMirrorCovers",
+        "maintel_open_mirror_covers",
+    ),
+    "maintel_point_azel": ("MainTelPointAzEl", "run_maintel_point_azel"),
+    "maintel_slew_dome": ("MainTelSlewDome", "maintel_slew_dome"),
+    "maintel_standby_disabled": (
+        "MainTelStandbyDisabled",
+        "run_maintel_standby_disabled",
+    ),
+    "obssys_disabled_enabled": ("ObsSysDisabledEnabled", "run_obssys_disabled_enabled"),
+    "obssys_standby_disabled": ("ObsSysStandbyDisabled", "run_obssys_standby_disabled"),
+    "orchestrator": (
+        "ScriptRunReport",
+        "OrchestratorReport",
+        "get_script_class",
+        "run_script",
+        "run_in_parallel",
+        "run_parallel_checkout",
+    ),
+    "results_db": (
+        "PhaseStats",
+        "PhaseRegression",
+        "ResultsDatabase",
+        "get_results_db_path",
+        "query_results",
+    ),
+    "run_command": ("RunCommand", "read_commands_file", "run_command"),
+    "script_log": (
+        "JsonFormatter",
+        "ProgressRateLimiter",
+        "configure_logging",
+        "stop_logging",
+        "ensure_logging_configured",
+    ),
+    "script_queue_controller": ("ScriptQueueController",),
+    "script_queue_session": ("ScriptQueueSession",),
+    "script_queue_simulator": (
+        "ScriptDurations",
+        "TimingModel",
+        "FixedTimingModel",
+        "NormalTimingModel",
+        "ReplayTimingModel",
+        "SimulatedScriptQueueController",
+    ),
+    "script_timing": ("ScriptTiming", "RunTiming", "get_config_hash"),
+    "testutils": (
+        "lint_yaml",
+        "assert_yaml_formatted",
+        "assert_all_yaml_formatted",
+        "logging_statement",
+    ),
+    "utils": (
+        "cscs",
+        "csc_states",
+        "processing_states",
+        "terminal_states",
+        "get_test_env_arg",
+    ),
+    "yaml_test_strings": ("yaml_test_string1", "bad_yaml"),
+}
+_exports: dict[str, str] = {
+    name: module_name for module_name, names in _module_names.items() for name in names
+}
+
+__all__ = list(_exports)
+
+
+def __getattr__(name: str) -> Any:
+    """Import the module defining the given public name, and return it.
+
+    Parameters
+    ----------
+    name : `str`
+        The public name, e.g. AuxTelStop.
+
+    Raises
+    ------
+    AttributeError
+        If the name is not a public name of the package.
+    """
+    try:
+        module_name = _exports[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{module_name}", __name__)
+    value = getattr(module, name)
+    # Cache the value, so __getattr__ is only called once per name.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
+class _Package(types.ModuleType):
+    """The package module, which keeps a public name bound to the object it
+    exports when the submodule of the same name is imported, e.g. the
+    run_command function rather than the run_command module.
+    """
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if (
+            isinstance(value, types.ModuleType)
+            and _exports.get(name) == name
+            and value.__name__ == f"{__name__}.{name}"
+        ):
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _Package
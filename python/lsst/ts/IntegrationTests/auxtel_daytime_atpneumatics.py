@@ -20,7 +20,6 @@
 
 __all__ = ["ATPneumaticsCheckout", "run_atpneumatics_checkout"]
 
-import asyncio
 
 from lsst.ts.IntegrationTests import BaseScript
 
@@ -55,4 +54,4 @@ def run_atpneumatics_checkout() -> None:
     script_class = ATPneumaticsCheckout()
     num_scripts = len(script_class.scripts)
     print(f"\nATPneumatics Daytime Checkout; running {num_scripts} scripts")
-    asyncio.run(script_class.run())
+    script_class.execute()
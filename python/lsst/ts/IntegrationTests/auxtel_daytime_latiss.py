@@ -22,7 +22,6 @@
 
 __all__ = ["AuxTelLatissCheckout", "run_auxtel_latiss_checkout"]
 
-import asyncio
 
 from lsst.ts.IntegrationTests import BaseScript
 
@@ -50,4 +49,4 @@ def run_auxtel_latiss_checkout() -> None:
     script_class = AuxTelLatissCheckout()
     num_scripts = len(script_class.scripts)
     print(f"\nLATISS Daytime Checkout; running {num_scripts} scripts")
-    asyncio.run(script_class.run())
+    script_class.execute()
@@ -22,7 +22,6 @@
 
 __all__ = ["SlewAndTakeImageCheckout", "run_auxtel_slew_and_take_image_checkout"]
 
-import asyncio
 
 from lsst.ts.IntegrationTests import BaseScript
 
@@ -50,4 +49,4 @@ def run_auxtel_slew_and_take_image_checkout() -> None:
     script_class = SlewAndTakeImageCheckout()
     num_scripts = len(script_class.scripts)
     print(f"\nSlew and Take Image Daytime Checkout; running {num_scripts} scripts")
-    asyncio.run(script_class.run())
+    script_class.execute()
@@ -22,7 +22,6 @@
 
 __all__ = ["AuxTelTelescopeAndDomeCheckout", "run_auxtel_telescope_and_dome_checkout"]
 
-import asyncio
 
 from lsst.ts.IntegrationTests import BaseScript
 
@@ -52,4 +51,4 @@ def run_auxtel_telescope_and_dome_checkout() -> None:
     print(
         f"\nAuxTel Telescope and Dome Daytime Checkout; running {num_scripts} scripts"
     )
-    asyncio.run(script_class.run())
+    script_class.execute()
@@ -22,7 +22,6 @@
 
 __all__ = ["AuxTelDisabledEnabled", "run_auxtel_disabled_enabled"]
 
-import asyncio
 
 from lsst.ts.IntegrationTests import BaseScript
 
@@ -54,4 +53,4 @@ def run_auxtel_disabled_enabled() -> None:
     script_class = AuxTelDisabledEnabled()
     num_scripts = len(script_class.scripts)
     print(f"\nAuxTel Disabled to Enabled; running {num_scripts} scripts")
-    asyncio.run(script_class.run())
+    script_class.execute()
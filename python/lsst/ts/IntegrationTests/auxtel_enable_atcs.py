@@ -22,7 +22,6 @@
 
 __all__ = ["AuxTelEnableATCS", "run_auxtel_enable_atcs"]
 
-import asyncio
 
 from lsst.ts.IntegrationTests import BaseScript
 
@@ -48,4 +47,4 @@ def run_auxtel_enable_atcs() -> None:
     script_class = AuxTelEnableATCS()
     num_scripts = len(script_class.scripts)
     print(f"\nAuxTel Enable ATCS; running {num_scripts} scripts")
-    asyncio.run(script_class.run())
+    script_class.execute()
@@ -22,7 +22,6 @@
 
 __all__ = ["AuxTelHousekeeping", "run_auxtel_housekeeping"]
 
-import asyncio
 
 from lsst.ts.IntegrationTests import BaseScript
 
@@ -62,4 +61,4 @@ def run_auxtel_housekeeping() -> None:
     script_class = AuxTelHousekeeping()
     num_scripts = len(script_class.scripts)
     print(f"\nAuxTel Housekeeping; running {num_scripts} scripts")
-    asyncio.run(script_class.run())
+    script_class.execute()
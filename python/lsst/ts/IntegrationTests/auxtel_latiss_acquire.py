@@ -26,7 +26,6 @@ __all__ = [
 ]
 
 import argparse
-import asyncio
 
 from lsst.ts.IntegrationTests import BaseScript
 
@@ -73,4 +72,4 @@ def run_auxtel_latiss_acquire() -> None:
         f"for the {script_class.sequence} sequence, "
         f"with configuration;\n{script_class.configs}"
     )
-    asyncio.run(script_class.run())
+    script_class.execute()
@@ -23,7 +23,6 @@
 __all__ = ["AuxTelLatissCalibrations", "run_auxtel_latiss_calibrations"]
 
 import argparse
-import asyncio
 
 import yaml
 from lsst.ts.IntegrationTests import BaseScript
@@ -95,4 +94,4 @@ def run_auxtel_latiss_calibrations() -> None:
         f"master_{script_class.calib_type} calibrations,"
         f"\nwith configuration;\n{script_class.configs}"
     )
-    asyncio.run(script_class.run())
+    script_class.execute()
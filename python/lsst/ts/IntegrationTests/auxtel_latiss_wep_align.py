@@ -22,7 +22,6 @@
 
 __all__ = ["AuxTelLatissWEPAlign", "run_auxtel_latiss_wep_align"]
 
-import asyncio
 
 from lsst.ts.IntegrationTests import BaseScript
 
@@ -51,4 +50,4 @@ def run_auxtel_latiss_wep_align() -> None:
         f"\nAuxTel Latiss WEP Align; running the {script_class.scripts[0][0]} script,"
         f"\nwith configuration;\n{script_class.configs}"
     )
-    asyncio.run(script_class.run())
+    script_class.execute()
@@ -22,7 +22,6 @@
 
 __all__ = ["AuxTelOfflineStandby", "run_auxtel_offline_standby"]
 
-import asyncio
 
 from lsst.ts.IntegrationTests import BaseScript
 
@@ -50,4 +49,4 @@ def run_auxtel_offline_standby() -> None:
     script_class = AuxTelOfflineStandby()
     num_scripts = len(script_class.scripts)
     print(f"\nAuxTel Offline to Standby; running {num_scripts} scripts")
-    asyncio.run(script_class.run())
+    script_class.execute()
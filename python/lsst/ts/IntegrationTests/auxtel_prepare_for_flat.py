@@ -22,7 +22,6 @@
 
 __all__ = ["AuxTelPrepareFlat", "run_auxtel_prepare_for_flat"]
 
-import asyncio
 
 from lsst.ts.IntegrationTests import BaseScript
 
@@ -48,4 +47,4 @@ def run_auxtel_prepare_for_flat() -> None:
     script_class = AuxTelPrepareFlat()
     num_scripts = len(script_class.scripts)
     print(f"\nAuxTel Prepare for Flat; running {num_scripts} scripts")
-    asyncio.run(script_class.run())
+    script_class.execute()
@@ -22,7 +22,6 @@
 
 __all__ = ["AuxTelPrepareOnSky", "run_auxtel_prepare_for_onsky"]
 
-import asyncio
 
 from lsst.ts.IntegrationTests import BaseScript
 
@@ -48,4 +47,4 @@ def run_auxtel_prepare_for_onsky() -> None:
     script_class = AuxTelPrepareOnSky()
     num_scripts = len(script_class.scripts)
     print(f"\nAuxTel Prepare for OnSky; running {num_scripts} scripts")
-    asyncio.run(script_class.run())
+    script_class.execute()
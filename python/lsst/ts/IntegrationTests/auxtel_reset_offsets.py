@@ -22,7 +22,6 @@
 
 __all__ = ["AuxTelResetOffsets", "run_auxtel_reset_offsets"]
 
-import asyncio
 
 from lsst.ts.IntegrationTests import BaseScript
 
@@ -58,4 +57,4 @@ def run_auxtel_reset_offsets() -> None:
     script_class = AuxTelResetOffsets()
     num_scripts = len(script_class.scripts)
     print(f"\nAuxTel Reset Offsets; running {num_scripts} scripts")
-    asyncio.run(script_class.run())
+    script_class.execute()
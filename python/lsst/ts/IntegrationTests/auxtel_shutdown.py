@@ -22,7 +22,6 @@
 
 __all__ = ["AuxTelShutdown", "run_auxtel_shutdown"]
 
-import asyncio
 
 from lsst.ts.IntegrationTests import BaseScript
 
@@ -48,4 +47,4 @@ def run_auxtel_shutdown() -> None:
     script_class = AuxTelShutdown()
     num_scripts = len(script_class.scripts)
     print(f"\nAuxTel Shutdown; running {num_scripts} scripts")
-    asyncio.run(script_class.run())
+    script_class.execute()
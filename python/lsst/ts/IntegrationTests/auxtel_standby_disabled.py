@@ -22,7 +22,6 @@
 
 __all__ = ["AuxTelStandbyDisabled", "run_auxtel_standby_disabled"]
 
-import asyncio
 
 from lsst.ts.IntegrationTests import BaseScript
 
@@ -54,4 +53,4 @@ def run_auxtel_standby_disabled() -> None:
     script_class = AuxTelStandbyDisabled()
     num_scripts = len(script_class.scripts)
     print(f"\nAuxTel Standby to Disabled; running {num_scripts} scripts")
-    asyncio.run(script_class.run())
+    script_class.execute()
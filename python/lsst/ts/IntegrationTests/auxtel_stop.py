@@ -22,7 +22,6 @@
 
 __all__ = ["AuxTelStop", "run_auxtel_stop"]
 
-import asyncio
 
 from lsst.ts.IntegrationTests import BaseScript
 
@@ -48,4 +47,4 @@ def run_auxtel_stop() -> None:
     script_class = AuxTelStop()
     num_scripts = len(script_class.scripts)
     print(f"\nAuxTel Stop; running {num_scripts} scripts")
-    asyncio.run(script_class.run())
+    script_class.execute()
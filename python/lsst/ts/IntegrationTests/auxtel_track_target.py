@@ -23,7 +23,6 @@
 __all__ = ["AuxTelTrackTarget", "run_auxtel_track_target"]
 
 import argparse
-import asyncio
 
 import yaml
 from lsst.ts.IntegrationTests import BaseScript
@@ -76,4 +75,4 @@ def run_auxtel_track_target() -> None:
         f"\nAuxTel Track Target; running {num_scripts} scripts "
         f"for target configuration:\n{script_class.configs[0]}"
     )
-    asyncio.run(script_class.run())
+    script_class.execute()
@@ -22,7 +22,6 @@
 
 __all__ = ["AuxTelVisit", "run_auxtel_visit"]
 
-import asyncio
 
 from lsst.ts.IntegrationTests import BaseScript
 
@@ -62,4 +61,4 @@ def run_auxtel_visit() -> None:
     script_class = AuxTelVisit()
     num_scripts = len(script_class.scripts)
     print(f"\nAuxTel Visit; running {num_scripts} scripts")
-    asyncio.run(script_class.run())
+    script_class.execute()
@@ -23,14 +23,29 @@
 __all__ = ["BaseScript"]
 
 import asyncio
-import copy
+import logging
+import os
+import sqlite3
+import sys
 from datetime import date
 
 from lsst.ts import salobj
 from lsst.ts.IntegrationTests import utils
+from lsst.ts.utils import current_tai
 from lsst.ts.xml.enums.Script import ScriptState
 from lsst.ts.xml.enums.ScriptQueue import Location, ScriptProcessState
 
+from .clock import Clock, get_default_clock
+from .results_db import ResultsDatabase, get_results_db_path
+from .script_log import PACKAGE_LOGGER_NAME, ensure_logging_configured
+from .script_queue_session import ScriptQueueSession
+from .script_timing import RunTiming, ScriptTiming, get_config_hash
+
+# The list to which execute() appends the scripts, rather than running
+# them, if not None. The integration_tests dispatcher sets it, to run the
+# scripts of several invocations in one event loop and salobj Domain.
+script_collector: list["BaseScript"] | None = None
+
 
 class BaseScript:
     """Defines the common attributes and functions for an
@@ -62,6 +77,33 @@ class BaseScript:
         A list of tuples. The tuple is the script name and a boolean.
         The boolean specifies the script as Standard (True)
         or External (False).
+    bulk_add : `bool`
+        Issue the ScriptQueue add commands concurrently, rather than waiting
+        for each acknowledgement in turn. The default is False.
+    max_in_flight : `int`
+        The maximum number of add commands awaiting acknowledgement,
+        when bulk_add is True.
+    timeout : `float` or `None`
+        The maximum time, in seconds, to wait for all the scripts to finish.
+        The default, None, waits indefinitely.
+    script_timeout : `float` or `None`
+        The maximum time, in seconds, to wait for the next script to finish.
+        The timer restarts each time a script finishes. The default, None,
+        waits indefinitely.
+    timing_file : `str` or `None`
+        The JSON lines file to which the timing of each run is appended,
+        one line per script. If None, the TS_INTEGRATION_TESTS_TIMING_FILE
+        environment variable is used, if set.
+    results_db : `str` or `None`
+        The SQLite results database to which each run is added; see
+        ResultsDatabase. If None, the TS_INTEGRATION_TESTS_RESULTS_DB
+        environment variable is used, if set.
+    clock : `Clock` or `None`
+        The clock measuring the timeout and script_timeout. If None, the
+        default clock; see get_default_clock(). The unit tests use a
+        VirtualClock, shared with the ScriptQueue controllers, so the
+        timeouts follow the virtual time of the scripts rather than the
+        wall clock.
     """
 
     # See Attributes for the definition.
@@ -70,8 +112,20 @@ class BaseScript:
     is_external: bool = False
     configs: tuple = ()
     scripts: list = []
+    bulk_add: bool = False
+    max_in_flight: int = 10
+    timeout: float | None = None
+    script_timeout: float | None = None
+    timing_file: str | None = None
+    results_db: str | None = None
+    clock: Clock | None = None
 
-    def __init__(self, queue_placement: str = "LAST") -> None:
+    def __init__(
+        self,
+        queue_placement: str = "LAST",
+        inject: bool = False,
+        location_index: int = 0,
+    ) -> None:
         """Initialize the given Standard or External
            script, with the given Yaml configuration, placed in the
            given ScriptQueue location.
@@ -81,28 +135,86 @@ class BaseScript:
         remote : `salobj.Remote`
             A listener for the ScriptQueue CSC. Defined as an instance
             variable, in order to call it from mulitple methods.
+            It is provided by the ScriptQueueSession.
         queue_placement : `str`
             Options are "FIRST" "LAST" "BEFORE" or "AFTER" and are
             case insensistive ("FIRST" is the default, for convenience).
             The BaseScript Class will convert to the appropriate
             ScriptQueue.Location enum object.
+        inject : `bool`
+            Add the scripts to the running ScriptQueue, without pausing it.
+            Use this to run scripts on a busy ScriptQueue without stalling
+            the scripts queued by the Scheduler or other operators.
+            The default is False, which pauses the ScriptQueue while
+            the scripts are added.
+        location_index : `int`
+            The index of the script in the ScriptQueue before or after
+            which the scripts are placed, if queue_placement is
+            "BEFORE" or "AFTER".
+        script_indexes : `list`
+            The list of script indexes returned by the ScriptQueue, in the
+            same order as the scripts list.
+        added_indexes : `list`
+            The script index of each script in the scripts list, or None
+            if its add command failed. Set by the add_scripts() function.
         script_states : `list`
-            The list of script states as integers. This list is used by
-            both the run() and wait_for_done() functions, so must be
-            defined as an instance variable.
-        temp_script_indexes : `list`
-            A temporary copy of the script_indexes list. This list is reduced
-            by the wait_for_done() function until all the scripts are complete.
-            This maintains the integrity of the real script_indexes list.
+            The final script states as integers, in the same order as the
+            script_indexes list. Set by the run() function from final_states.
+        pending_indexes : `set`
+            The indexes of the scripts added to the ScriptQueue that are not
+            yet complete. The wait_for_done() function removes each script
+            as it completes, in whatever order the ScriptQueue reports them.
+        final_states : `dict`
+            The final script states as integers, keyed by script index.
+        adding : `bool`
+            True while the scripts are being added. A script can complete
+            before its add command is acknowledged, so the terminal states
+            of unknown scripts are kept until the adding is complete.
         all_scripts_done : `bool`
             A simple boolean variable, defaulting to False, that is set to
             True once all the scripts are complete.
+        script_done : `asyncio.Event`
+            Set by the wait_for_done() function each time a script is
+            complete. The run() function awaits this event, rather than
+            polling the all_scripts_done flag.
+        log : `logging.Logger`
+            The logger of the script progress. Unless the application
+            configures the lsst.ts.IntegrationTests logger, run() calls
+            configure_logging(), so the output follows the
+            TS_INTEGRATION_TESTS_LOG_FORMAT, TS_INTEGRATION_TESTS_LOG_QUIET
+            and TS_INTEGRATION_TESTS_PROGRESS_INTERVAL environment variables.
+        timing : `RunTiming`
+            The timeline of the last run, including the ScriptTiming
+            of each script.
+        early_states : `dict`
+            The (ScriptProcessState, time) of each event seen before the
+            add command of the script was acknowledged, keyed by script
+            index. The ScriptQueue can report a state before acknowledging
+            the add command; add_script() moves these states into the
+            ScriptTiming.
+        entry_point : `str`
+            The command that started the run, recorded in the results_db.
+            Set by the execute() function; the class name if the scripts
+            are run from Python.
         """
         self.remote: salobj.Remote
         self.queue_placement: str = queue_placement
+        self.inject: bool = inject
+        self.location_index: int = location_index
+        self.script_indexes: list[int] = []
+        self.added_indexes: list[int | None] = []
         self.script_states: list[int] = []
-        self.temp_script_indexes: list[int] = []
+        self.pending_indexes: set[int] = set()
+        self.final_states: dict[int, int] = {}
+        self.adding: bool = False
         self.all_scripts_done: bool = False
+        self.script_done: asyncio.Event = asyncio.Event()
+        self.log: logging.Logger = logging.getLogger(
+            f"{PACKAGE_LOGGER_NAME}.{type(self).__name__}"
+        )
+        self.timing: RunTiming = RunTiming(name=type(self).__name__, index=self.index)
+        self.early_states: dict[int, list[tuple[int, float]]] = {}
+        self.entry_point: str = type(self).__name__
 
     @classmethod
     def get_current_date(cls, date_format: str = "%Y-%m-%d") -> str:
@@ -138,90 +250,377 @@ class BaseScript:
         data : ``lsst.ts.salobj.BaseMsgType``
             The object returned by the ScriptQueue Script Event (evt_script).
         """
+        self.record_process_state(data)
+        process_state = ScriptProcessState(data.processState).name
         if data.processState in utils.processing_states:
             # Script initial, configuration and running states.
-            print(
-                f"Script processing state: "
-                f"{ScriptProcessState(data.processState).name}"
+            self.log.info(
+                "Script %s processing state: %s",
+                data.scriptSalIndex,
+                process_state,
+                extra=dict(
+                    progress=True,
+                    script_index=data.scriptSalIndex,
+                    process_state=process_state,
+                ),
             )
             return
-        if self.temp_script_indexes:
-            print(f"Waiting for script ID {self.temp_script_indexes[0]} to finish...")
-        else:
-            print("No scripts to wait for")
+        if (
+            data.processState not in utils.terminal_states
+            or data.timestampProcessEnd <= 0
+        ):
             return
-        if data.processState in utils.terminal_states and data.timestampProcessEnd > 0:
-            print(
-                f"Script {data.scriptSalIndex} terminal processing state: "
-                f"{ScriptProcessState(data.processState).name}\n"
-                f"Final ScriptState: {ScriptState(data.scriptState).name}"
+        script_index = data.scriptSalIndex
+        if script_index not in self.pending_indexes:
+            if self.adding and script_index not in self.final_states:
+                # The script may be ours, but its add command
+                # is not acknowledged yet; see add_script().
+                self.final_states[script_index] = int(data.scriptState)
+            else:
+                # A script added by others, or a repeated event.
+                self.log.debug("Ignoring script %s", script_index)
+            return
+        script_state = ScriptState(data.scriptState).name
+        self.log.info(
+            "Script %s terminal processing state: %s; Final ScriptState: %s",
+            script_index,
+            process_state,
+            script_state,
+            extra=dict(
+                script_index=script_index,
+                process_state=process_state,
+                script_state=script_state,
+            ),
+        )
+        self.finish_script(script_index, int(data.scriptState))
+        if self.pending_indexes:
+            self.log.info(
+                "Waiting for %s scripts to finish...",
+                len(self.pending_indexes),
+                extra=dict(progress=True, pending=len(self.pending_indexes)),
             )
-            # Store the final Script.ScriptState enum
-            # in the script_states list.
-            self.script_states.append(int(data.scriptState))
-            # Scripts run sequentially and FIFO.
-            # When done, remove the leading script.
-            self.temp_script_indexes.pop(0)
-            # Set the all_scripts_done flag to True when all the
-            # scripts are complete.
-            self.all_scripts_done = len(self.temp_script_indexes) == 0
-            # Resume the ScriptQueue, if a script failed,
-            # to continue processing any remaining scripts.
-            # NOTE: This MUST be done LAST. Otherwise, the resume triggers an
-            # additional set of callbacks, but the self.temp_script_indexes
-            # list is empty and the .pop(0) method fails with an IndexError.
-            if data.scriptState == ScriptState.FAILED:
-                print("Resuming the ScriptQueue after a script FAILED.")
-                await self.remote.cmd_resume.set_start(timeout=10)
+        # Resume the ScriptQueue, if a script failed,
+        # to continue processing any remaining scripts.
+        # Completed scripts are no longer pending, so the events
+        # repeated after the resume are ignored.
+        if data.scriptState == ScriptState.FAILED:
+            self.log.warning(
+                "Resuming the ScriptQueue after script %s FAILED.",
+                script_index,
+                extra=dict(script_index=script_index),
+            )
+            await self.remote.cmd_resume.set_start(timeout=10)
+
+    def finish_script(self, script_index: int, script_state: int) -> None:
+        """Record the final state of the given script.
+
+        Parameters
+        ----------
+        script_index : `int`
+            The script index returned by the ScriptQueue.
+        script_state : `int`
+            The final Script.ScriptState enum, as an integer.
+        """
+        self.final_states[script_index] = script_state
+        self.pending_indexes.discard(script_index)
+        # Set the all_scripts_done flag to True when all the
+        # scripts are added and complete.
+        self.all_scripts_done = not self.adding and not self.pending_indexes
+        # Wake up the run() function to check the all_scripts_done flag.
+        self.script_done.set()
+
+    def record_process_state(self, data: salobj.BaseMsgType) -> None:
+        """Record the first time the ScriptProcessState of a script is seen.
+
+        Parameters
+        ----------
+        data : ``lsst.ts.salobj.BaseMsgType``
+            The object returned by the ScriptQueue Script Event (evt_script).
+        """
+        timing = self.timing_by_index.get(data.scriptSalIndex)
+        if timing is not None:
+            timing.record(data.processState, current_tai())
+        elif self.adding:
+            # The script may be one of ours, not yet acknowledged.
+            self.early_states.setdefault(data.scriptSalIndex, []).append(
+                (data.processState, current_tai())
+            )
+
+    @property
+    def timing_by_index(self) -> dict[int, ScriptTiming]:
+        """The ScriptTiming of the scripts of the last run,
+        keyed by script index.
+        """
+        return {timing.script_index: timing for timing in self.timing.scripts}
+
+    async def wait_for_all_scripts(self) -> None:
+        """Wait for all the scripts to finish.
+
+        The wait is driven by the script_done event, so waiting costs
+        nothing until the ScriptQueue reports a script is complete.
+
+        Raises
+        ------
+        asyncio.TimeoutError
+            If the next script does not finish within script_timeout seconds,
+            or all the scripts do not finish within timeout seconds.
+        """
+        clock = self.clock or get_default_clock()
+        deadline = None if self.timeout is None else clock.time() + self.timeout
+        while not self.all_scripts_done:
+            self.script_done.clear()
+            wait_time = self.script_timeout
+            if deadline is not None:
+                remaining = deadline - clock.time()
+                if wait_time is None or remaining < wait_time:
+                    wait_time = remaining
+            try:
+                await clock.wait_for(self.script_done.wait(), timeout=wait_time)
+            except asyncio.TimeoutError:
+                raise asyncio.TimeoutError(
+                    f"Timed out waiting for script IDs "
+                    f"{sorted(self.pending_indexes)} to finish."
+                )
+
+    async def add_script(
+        self,
+        script: tuple,
+        config: str,
+        location: Location,
+        location_index: int = 0,
+    ) -> int | None:
+        """Add the given script to the ScriptQueue.
+
+        Parameters
+        ----------
+        script : `tuple`
+            The script name and the is_standard boolean.
+        config : `str`
+            The Yaml-formatted script configuration.
+        location : ``lsst.ts.xml.enums.ScriptQueue.Location``
+            The location in the ScriptQueue to place the script.
+        location_index : `int`
+            The index of the script before or after which the script
+            is placed, if location is BEFORE or AFTER.
+
+        Returns
+        -------
+        script_index : `int` or `None`
+            The script index returned by the ScriptQueue, or None if the
+            ScriptQueue did not return a valid index.
+        """
+        # Use a separate message for each command, so concurrent commands
+        # do not overwrite each other's fields.
+        data = self.remote.cmd_add.DataType()
+        data.isStandard = script[1]
+        data.path = script[0]
+        data.config = config
+        data.logLevel = self.log_level if hasattr(self, "log_level") else 10
+        data.location = location
+        data.locationSalIndex = location_index
+        add_time = current_tai()
+        ack = await self.remote.cmd_add.start(data, timeout=10)
+        ack_time = current_tai()
+        try:
+            script_index = int(ack.result)
+        except Exception:
+            self.log.error("Failed to add %s: %s", script[0], ack.result)
+            return None
+        # Track the script, unless it completed before the acknowledgement.
+        if script_index not in self.final_states:
+            self.pending_indexes.add(script_index)
+        timing = ScriptTiming(
+            script_index=script_index,
+            path=script[0],
+            is_standard=script[1],
+            add_time=add_time,
+            ack_time=ack_time,
+            config_hash=get_config_hash(config),
+        )
+        # Record the states seen before the acknowledgement.
+        for process_state, time in self.early_states.pop(script_index, []):
+            timing.record(process_state, time)
+        self.timing.scripts.append(timing)
+        return script_index
+
+    async def add_scripts(self, location: Location) -> list[int]:
+        """Add all the scripts to the ScriptQueue.
+
+        Parameters
+        ----------
+        location : ``lsst.ts.xml.enums.ScriptQueue.Location``
+            The location in the ScriptQueue to place the scripts.
+
+        Returns
+        -------
+        script_indexes : `list`
+            The script indexes, in the same order as the scripts list.
+
+        Notes
+        -----
+        By default, each add command waits for the previous acknowledgement.
+        If bulk_add is True, up to max_in_flight add commands are issued
+        without waiting, so loading N scripts costs roughly one command
+        round-trip. The commands are still issued in the order of the
+        scripts list, and the script indexes are returned in that order,
+        regardless of the order in which the acknowledgements arrive.
+
+        In inject mode, unless the location is LAST, each script after the
+        first is placed AFTER the previous one, so the scripts keep their
+        order in the running ScriptQueue. The add commands are then issued
+        one at a time.
+        """
+        if self.inject and location != Location.LAST:
+            results = []
+            location_index = self.location_index
+            for script, config in zip(self.scripts, self.configs):
+                script_index = await self.add_script(
+                    script, config, location, location_index
+                )
+                if script_index is not None:
+                    location, location_index = Location.AFTER, script_index
+                results.append(script_index)
+        elif self.bulk_add:
+            window = asyncio.Semaphore(max(1, self.max_in_flight))
+
+            async def add_in_window(script: tuple, config: str) -> int | None:
+                async with window:
+                    return await self.add_script(
+                        script, config, location, self.location_index
+                    )
+
+            results = await asyncio.gather(
+                *[
+                    add_in_window(script, config)
+                    for script, config in zip(self.scripts, self.configs)
+                ]
+            )
+        else:
+            results = [
+                await self.add_script(script, config, location, self.location_index)
+                for script, config in zip(self.scripts, self.configs)
+            ]
+        self.added_indexes = list(results)
+        script_indexes = [index for index in results if index is not None]
+        # Order the script timings as the scripts list.
+        self.timing.scripts.sort(
+            key=lambda timing: script_indexes.index(timing.script_index)
+        )
+        return script_indexes
 
-    async def run(self) -> None:
+    async def run(self, session: ScriptQueueSession | None = None) -> None:
         """Run the specified standard or external scripts.
         Wait for the scripts to finish and print the lists of
         script indexes and script states.
+
+        Parameters
+        ----------
+        session : `ScriptQueueSession` or `None`
+            The session holding the salobj Domain and ScriptQueue Remote.
+            Share a session to run several scripts without reconnecting.
+            If None, a session is created for, and closed after, this run.
         """
-        async with salobj.Domain() as domain, salobj.Remote(
-            domain=domain, name="ScriptQueue", index=self.index
-        ) as self.remote:
-            # Since `async with` is used,
-            # you do NOT have to wait for the remote to start
-
-            # Convert the queue_placement parameter to the approprirate
-            # ScriptQueue.Location Enum object.
-            queue_placement = getattr(Location, self.queue_placement.upper())
-
-            # Wait for the next ScriptQueue heartbeat to ensure it is running.
-            await self.remote.evt_heartbeat.next(flush=True, timeout=30)
-            # Pause the ScriptQueue to load the scripts into the queue.
-            await self.remote.cmd_pause.start(timeout=10)
+        if session is None:
+            async with ScriptQueueSession() as session:
+                await self.run(session=session)
+            return
+        ensure_logging_configured()
+        # Get the ScriptQueue Remote. The session waits for the
+        # ScriptQueue heartbeat to ensure it is running.
+        self.remote = await session.get_remote(self.index)
+        self.timing = RunTiming(name=type(self).__name__, index=self.index)
+        self.timing.start_time = current_tai()
+        self.script_indexes = []
+        self.added_indexes = []
+        self.script_states = []
+        self.pending_indexes = set()
+        self.final_states = {}
+        self.early_states = {}
+        self.adding = True
+        self.all_scripts_done = False
+
+        # Convert the queue_placement parameter to the approprirate
+        # ScriptQueue.Location Enum object.
+        queue_placement = getattr(Location, self.queue_placement.upper())
+
+        # Register the callback to the ScriptQueue Script Event that
+        # will wait for all the scripts to complete. Register it before
+        # adding the scripts, to see them load and configure.
+        session.add_script_callback(self.index, self.wait_for_done)
+        try:
+            # Pause the ScriptQueue to load the scripts into the queue,
+            # unless injecting them into the running ScriptQueue.
+            if not self.inject:
+                start_time = current_tai()
+                await self.remote.cmd_pause.start(timeout=10)
+                self.timing.pause_duration = current_tai() - start_time
             # Add scripts to the queue.
-            script_indexes = []
-            for script, config in zip(self.scripts, self.configs):
-                ack = await self.remote.cmd_add.set_start(
-                    timeout=10,
-                    isStandard=script[1],
-                    path=script[0],
-                    config=config,
-                    logLevel=self.log_level if hasattr(self, "log_level") else 10,
-                    location=queue_placement,
-                )
-                try:
-                    script_indexes.append(int(ack.result))
-                except Exception:
-                    print(f"Something went wrong: {ack.result}")
-            # Copy the script_indexes list to use in the Script Event callback.
-            # This maintains the integrity of the real script_indexes list.
-            self.temp_script_indexes = copy.deepcopy(script_indexes)
-            # Create the callback to the ScriptQueue Script Event that
-            # will wait for all the scripts to complete.
-            self.remote.evt_script.callback = self.wait_for_done
+            script_indexes = await self.add_scripts(queue_placement)
+            self.script_indexes = script_indexes
+            # Forget the terminal states of the scripts added by others.
+            self.final_states = {
+                index: self.final_states[index]
+                for index in script_indexes
+                if index in self.final_states
+            }
+            self.adding = False
+            self.all_scripts_done = not self.pending_indexes
             # Resume the ScriptQueue to begin script execution.
-            await self.remote.cmd_resume.set_start(timeout=10)
+            if not self.inject:
+                start_time = current_tai()
+                await self.remote.cmd_resume.set_start(timeout=10)
+                self.timing.resume_duration = current_tai() - start_time
             # Wait for the scripts to complete.
-            while not self.all_scripts_done:
-                await asyncio.sleep(0)
-            # Print the script indexes and states.
-            print(
-                f"All scripts complete.\n"
-                f"Script Indexes ; Script States:\n"
-                f"{script_indexes}\n{self.script_states}"
-            )
+            await self.wait_for_all_scripts()
+        finally:
+            session.remove_script_callback(self.index, self.wait_for_done)
+            self.adding = False
+            # Report the final states in the scripts order.
+            self.script_states = [
+                self.final_states[index]
+                for index in self.script_indexes
+                if index in self.final_states
+            ]
+            for timing in self.timing.scripts:
+                timing.script_state = self.final_states.get(timing.script_index)
+            self.timing.end_time = current_tai()
+            # Never let recording the results mask the outcome of the run.
+            try:
+                self.write_timing()
+            except (OSError, sqlite3.Error) as e:
+                self.log.warning("Failed to record the run timing: %r", e)
+        # Log the script indexes and states.
+        self.log.info(
+            "All scripts complete. Script Indexes: %s; Script States: %s",
+            script_indexes,
+            self.script_states,
+            extra=dict(script_indexes=script_indexes, script_states=self.script_states),
+        )
+
+    def execute(self) -> None:
+        """Run the scripts from a command-line entry point.
+
+        If the entry point is invoked by the integration_tests dispatcher,
+        the dispatcher runs this BaseScript instead; see script_collector.
+        """
+        # The dispatcher sets sys.argv to the invocation of the command,
+        # so this is the command name whichever way it is invoked.
+        self.entry_point = os.path.basename(sys.argv[0])
+        if script_collector is not None:
+            script_collector.append(self)
+        else:
+            asyncio.run(self.run())
+
+    def write_timing(self) -> None:
+        """Append the timing of the last run to the timing_file,
+        and add it to the results_db, if any.
+        """
+        timing_file = self.timing_file or os.environ.get(
+            "TS_INTEGRATION_TESTS_TIMING_FILE"
+        )
+        if timing_file:
+            self.timing.write_json_lines(timing_file)
+        results_db_path = self.results_db or get_results_db_path()
+        if results_db_path:
+            with ResultsDatabase(results_db_path) as results_db:
+                results_db.add_run(self.timing, entry_point=self.entry_point)
@@ -0,0 +1,313 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# This file is part of ts_IntegrationTests.
+#
+# Developed for the Vera C. Rubin Observatory Telescope & Site Software system.
+# This product includes software developed by the Vera C. Rubin Observatory
+# Project (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+__all__ = [
+    "CampaignNode",
+    "Campaign",
+    "CampaignReport",
+    "run_campaign",
+    "run_campaign_file",
+]
+
+import argparse
+import asyncio
+import dataclasses
+import functools
+import time
+from collections.abc import Callable, Iterable
+
+import yaml
+from lsst.ts.IntegrationTests import BaseScript
+
+from .orchestrator import ScriptRunReport, get_script_class, run_script
+from .script_queue_session import ScriptQueueSession
+
+
+@dataclasses.dataclass
+class CampaignNode:
+    """A step of an integration test campaign.
+
+    Attributes
+    ----------
+    name : `str`
+        The unique name of the step.
+    script : ``callable``
+        A BaseScript subclass taking no arguments, or any function
+        returning a BaseScript instance. It is called when the step starts.
+    requires : `tuple`
+        The names of the steps that must succeed before this step starts.
+    """
+
+    name: str
+    script: Callable[[], BaseScript]
+    requires: tuple[str, ...] = ()
+
+
+class Campaign:
+    """A set of integration test scripts and their prerequisites.
+
+    Parameters
+    ----------
+    nodes : ``iterable``
+        The CampaignNode steps of the campaign.
+
+    Raises
+    ------
+    ValueError
+        If a step name is repeated, a prerequisite is not a step of the
+        campaign, or the prerequisites form a cycle.
+
+    Notes
+    -----
+    A campaign can be declared in Yaml; see from_yaml().
+    """
+
+    def __init__(self, nodes: Iterable[CampaignNode]) -> None:
+        self.nodes: dict[str, CampaignNode] = {}
+        for node in nodes:
+            if node.name in self.nodes:
+                raise ValueError(f"{node.name} already present")
+            self.nodes[node.name] = node
+        for node in self.nodes.values():
+            for name in node.requires:
+                if name not in self.nodes:
+                    raise ValueError(f"{node.name} requires unknown step {name}")
+        self.order: list[str] = self._sort()
+
+    def _sort(self) -> list[str]:
+        """Return the step names with every step after its prerequisites.
+
+        Raises
+        ------
+        ValueError
+            If the prerequisites form a cycle.
+        """
+        order: list[str] = []
+        remaining = {name: set(node.requires) for name, node in self.nodes.items()}
+        while remaining:
+            ready = [name for name, requires in remaining.items() if not requires]
+            if not ready:
+                raise ValueError(f"Prerequisite cycle among {sorted(remaining)}")
+            for name in ready:
+                del remaining[name]
+                order.append(name)
+            for requires in remaining.values():
+                requires.difference_update(ready)
+        return order
+
+    @classmethod
+    def from_yaml(cls, campaign_yaml: str) -> "Campaign":
+        """Create a campaign from its Yaml definition.
+
+        Parameters
+        ----------
+        campaign_yaml : `str`
+            The Yaml definition. Each step names a BaseScript subclass,
+            and optionally its keyword arguments and prerequisites::
+
+                steps:
+                  - name: auxtel_offline_standby
+                    script: AuxTelOfflineStandby
+                  - name: auxtel_standby_disabled
+                    script: AuxTelStandbyDisabled
+                    requires: [auxtel_offline_standby]
+                  - name: latiss_flats
+                    script: AuxTelLatissCalibrations
+                    kwargs: {calib_type: flat}
+                    requires: [auxtel_standby_disabled]
+
+        Raises
+        ------
+        KeyError
+            If a script is not an integration test script class.
+        TypeError
+            If the steps are not a list of mappings.
+        ValueError
+            If the steps are not a valid campaign.
+        yaml.YAMLError
+            If the definition is not valid Yaml.
+        """
+        definition = yaml.safe_load(campaign_yaml)
+        return cls(
+            CampaignNode(
+                name=step["name"],
+                script=functools.partial(
+                    get_script_class(step["script"]), **step.get("kwargs", {})
+                ),
+                requires=tuple(step.get("requires", ())),
+            )
+            for step in definition["steps"]
+        )
+
+
+@dataclasses.dataclass
+class CampaignReport:
+    """The outcome of an integration test campaign.
+
+    Attributes
+    ----------
+    runs : `dict`
+        The ScriptRunReport of each step that ran, keyed by step name.
+    skipped : `list`
+        The names of the steps skipped because a prerequisite failed.
+    duration : `float`
+        The time, in seconds, taken by the campaign.
+    """
+
+    runs: dict[str, ScriptRunReport] = dataclasses.field(default_factory=dict)
+    skipped: list[str] = dataclasses.field(default_factory=list)
+    duration: float = 0.0
+
+    @property
+    def succeeded(self) -> bool:
+        """True if every step ran and succeeded."""
+        return not self.skipped and all(run.succeeded for run in self.runs.values())
+
+    def format(self) -> str:
+        """Format the report as text, one line per step."""
+        lines = [
+            f"Ran {len(self.runs)} campaign steps, skipped {len(self.skipped)}, "
+            f"in {self.duration:.1f} s."
+        ]
+        for name, run in self.runs.items():
+            outcome = "PASSED" if run.succeeded else "FAILED"
+            line = (
+                f"  {name} ({run.name} on ScriptQueue {run.index}): "
+                f"{outcome} in {run.duration:.1f} s; "
+                f"Script States {run.script_states}"
+            )
+            if run.error is not None:
+                line += f"; Error: {run.error}"
+            lines.append(line)
+        for name in self.skipped:
+            lines.append(f"  {name}: SKIPPED")
+        return "\n".join(lines)
+
+
+async def run_campaign(
+    campaign: Campaign, session: ScriptQueueSession | None = None
+) -> CampaignReport:
+    """Run the campaign, starting each step as soon as its prerequisites
+    succeed.
+
+    Parameters
+    ----------
+    campaign : `Campaign`
+        The campaign to run.
+    session : `ScriptQueueSession` or `None`
+        The session holding the ScriptQueue Remotes. If None, a session
+        is created for, and closed after, the campaign.
+
+    Returns
+    -------
+    report : `CampaignReport`
+        The outcome of the campaign.
+
+    Notes
+    -----
+    Steps whose prerequisites are met run concurrently, one at a time per
+    ScriptQueue. If a step fails, every step depending on it, directly or
+    not, is skipped; independent steps still run.
+    """
+    if session is None:
+        async with ScriptQueueSession() as session:
+            return await run_campaign(campaign, session=session)
+
+    report = CampaignReport()
+    loop = asyncio.get_running_loop()
+    succeeded: dict[str, asyncio.Future] = {
+        name: loop.create_future() for name in campaign.order
+    }
+
+    async def run_step(node: CampaignNode) -> None:
+        prerequisites = [await succeeded[name] for name in node.requires]
+        if not all(prerequisites):
+            report.skipped.append(node.name)
+            succeeded[node.name].set_result(False)
+            return
+        try:
+            script = node.script()
+        except Exception as e:
+            run = ScriptRunReport(
+                name=node.name,
+                index=0,
+                num_scripts=0,
+                error=repr(e),
+            )
+        else:
+            run = await run_script(script, session)
+        report.runs[node.name] = run
+        succeeded[node.name].set_result(run.succeeded)
+
+    start_time = time.monotonic()
+    # Create the tasks in dependency order, so that steps waiting on the
+    # same ScriptQueue take the queue in that order.
+    await asyncio.gather(*[run_step(campaign.nodes[name]) for name in campaign.order])
+    report.duration = time.monotonic() - start_time
+    return report
+
+
+def run_campaign_file() -> None:
+    # Define the script arguments.
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "campaign_file",
+        metavar="campaign_file",
+        nargs="?",
+        type=str,
+        help="Specify the Yaml file defining the campaign steps.",
+    )
+    parser.add_argument(
+        "-i",
+        "--info",
+        action="store_true",
+        help="Print the allowed options.",
+    )
+    args = parser.parse_args()
+    # Print the help if the campaign file is not defined.
+    if args.info or not args.campaign_file:
+        parser.print_help()
+        exit()
+    main(args)
+
+
+def main(opts: argparse.Namespace) -> None:
+    # Ensure the campaign is valid.
+    # If not, raise KeyError, TypeError, ValueError or yaml.YAMLError.
+    # If it is valid, run the campaign.
+    # Exit with an error if the campaign is not valid or did not succeed.
+    try:
+        with open(opts.campaign_file) as campaign_file:
+            campaign = Campaign.from_yaml(campaign_file.read())
+    except (OSError, KeyError, TypeError, ValueError, yaml.YAMLError) as e:
+        print(repr(e))
+        exit(1)
+    else:
+        print(
+            f"\nRunning the {opts.campaign_file} campaign; "
+            f"{len(campaign.nodes)} steps."
+        )
+        report = asyncio.run(run_campaign(campaign))
+        print(report.format())
+        if not report.succeeded:
+            exit(1)
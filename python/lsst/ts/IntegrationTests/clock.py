@@ -0,0 +1,341 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# This file is part of ts_IntegrationTests.
+#
+# Developed for the Vera C. Rubin Observatory Telescope & Site Software system.
+# This product includes software developed by the Vera C. Rubin Observatory
+# Project (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+__all__ = ["Clock", "VirtualClock", "get_default_clock", "set_default_clock"]
+
+import asyncio
+import heapq
+import itertools
+import threading
+import time
+from collections.abc import Awaitable
+from typing import Any
+
+from lsst.ts.utils import current_tai
+
+# The clock used when none is given; see get_default_clock().
+default_clock: "Clock | None" = None
+
+
+class Clock:
+    """The time seen by the simulated ScriptQueue, optionally accelerated.
+
+    Parameters
+    ----------
+    time_scale : `float`
+        The number of simulated seconds per real second. The default, 1,
+        follows the wall clock; 3600 runs a simulated hour in a second.
+
+    Raises
+    ------
+    ValueError
+        If time_scale is not positive.
+    """
+
+    def __init__(self, time_scale: float = 1.0) -> None:
+        if time_scale <= 0:
+            raise ValueError(f"time_scale={time_scale} must be positive")
+        self.time_scale: float = time_scale
+        self.start_tai: float = current_tai()
+        self._start_monotonic: float = time.monotonic()
+
+    def time(self) -> float:
+        """Return the simulated time, as TAI unix seconds."""
+        elapsed = time.monotonic() - self._start_monotonic
+        return self.start_tai + elapsed * self.time_scale
+
+    async def sleep(self, duration: float) -> None:
+        """Sleep for the given simulated duration, in seconds."""
+        await asyncio.sleep(max(0.0, duration) / self.time_scale)
+
+    async def wait_for(self, awaitable: Awaitable, timeout: float | None) -> Any:
+        """Wait for the awaitable, with a timeout in simulated seconds.
+
+        Parameters
+        ----------
+        awaitable : ``awaitable``
+            The coroutine or future to wait for.
+        timeout : `float` or `None`
+            The timeout, in simulated seconds. None waits indefinitely.
+
+        Raises
+        ------
+        asyncio.TimeoutError
+            If the awaitable does not finish within the timeout.
+        """
+        if timeout is None:
+            return await awaitable
+        task = asyncio.ensure_future(awaitable)
+        timer = asyncio.ensure_future(self.sleep(timeout))
+        try:
+            await asyncio.wait({task, timer}, return_when=asyncio.FIRST_COMPLETED)
+        except asyncio.CancelledError:
+            task.cancel()
+            raise
+        finally:
+            timer.cancel()
+        if not task.done():
+            task.cancel()
+            raise asyncio.TimeoutError()
+        return task.result()
+
+
+class VirtualClock(Clock):
+    """A deterministic clock whose time only advances through its sleeps.
+
+    Parameters
+    ----------
+    start_tai : `float` or `None`
+        The initial time, as TAI unix seconds. If None, the current time.
+    step_delay : `float`
+        The real time, in seconds, given to the other tasks before the
+        clock advances to the next wake-up time. The default, 0, advances
+        as soon as the event loop has run the tasks that are ready.
+    idle_delay : `float`
+        The real time, in seconds, without a pending sleep after which
+        the clock advances to the next timeout; see Notes.
+
+    Attributes
+    ----------
+    settle_iterations : `int`
+        The number of event loop iterations given to the other tasks,
+        to react to a wake-up, before the clock advances again.
+
+    Notes
+    -----
+    A sleep never waits for the wall clock. Instead, the clock advances
+    to the earliest wake-up time of the pending sleeps, and wakes up the
+    sleepers in the order of their wake-up times. A simulated night thus
+    runs at CPU speed, and the order of the sleeps does not depend on the
+    load of the machine.
+
+    The timeouts of wait_for() do not advance the clock: a timeout expires
+    when the sleeps advance the clock past it, so it measures virtual time,
+    however long the messages between the sleeps take. Only if no sleep
+    is pending for idle_delay real seconds, e.g. a script hangs, does the
+    clock advance to the next timeout.
+
+    The clock can be shared by event loops in different threads, e.g. the
+    unit tests and the ScriptQueue controllers they talk to. Each sleeper
+    is woken up in its own event loop; the other tasks are given
+    settle_iterations in the event loop of the sleeps, and step_delay
+    in the other threads, to react to each wake-up.
+    """
+
+    # See Attributes for the definition.
+    settle_iterations: int = 10
+
+    def __init__(
+        self,
+        start_tai: float | None = None,
+        step_delay: float = 0.0,
+        idle_delay: float = 1.0,
+    ) -> None:
+        super().__init__()
+        if start_tai is not None:
+            self.start_tai = start_tai
+        self.now: float = self.start_tai
+        self.step_delay: float = step_delay
+        self.idle_delay: float = idle_delay
+        # The pending sleeps and timeouts, as (wake-up time, count, future),
+        # shared by the threads using the clock.
+        self._sleepers: list[tuple[float, int, asyncio.Future]] = []
+        self._timeouts: list[tuple[float, int, asyncio.Future]] = []
+        self._lock = threading.Lock()
+        self._counter = itertools.count()
+        self._advance_task: asyncio.Task | None = None
+
+    def time(self) -> float:
+        """Return the virtual time, as TAI unix seconds."""
+        return self.now
+
+    async def sleep(self, duration: float) -> None:
+        """Sleep for the given virtual duration, in seconds."""
+        if duration <= 0:
+            await asyncio.sleep(0)
+            return
+        future = asyncio.get_running_loop().create_future()
+        with self._lock:
+            heapq.heappush(
+                self._sleepers, (self.now + duration, next(self._counter), future)
+            )
+        self._start_advancing()
+        await future
+
+    async def wait_for(self, awaitable: Awaitable, timeout: float | None) -> Any:
+        """Wait for the awaitable, with a timeout in virtual seconds.
+
+        Parameters
+        ----------
+        awaitable : ``awaitable``
+            The coroutine or future to wait for.
+        timeout : `float` or `None`
+            The timeout, in virtual seconds. None waits indefinitely.
+
+        Raises
+        ------
+        asyncio.TimeoutError
+            If the awaitable does not finish before the clock reaches
+            the timeout.
+        """
+        if timeout is None:
+            return await awaitable
+        task = asyncio.ensure_future(awaitable)
+        expired = asyncio.get_running_loop().create_future()
+        with self._lock:
+            heapq.heappush(
+                self._timeouts,
+                (self.now + max(0.0, timeout), next(self._counter), expired),
+            )
+            idle_now: float | None = self.now
+        try:
+            while not (task.done() or expired.done()):
+                await asyncio.wait(
+                    {task, expired},
+                    timeout=self.idle_delay,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                with self._lock:
+                    if self._sleepers or idle_now != self.now:
+                        # The clock is not idle, or has just become idle.
+                        idle_now = None if self._sleepers else self.now
+                        continue
+                    # No sleep is pending, so advance to the next timeout.
+                    deadline = self._next_timeout()
+                    if deadline is not None:
+                        self.now = max(self.now, deadline)
+                        self._expire_timeouts()
+        except asyncio.CancelledError:
+            task.cancel()
+            raise
+        finally:
+            expired.cancel()
+        if not task.done():
+            task.cancel()
+            raise asyncio.TimeoutError()
+        return task.result()
+
+    def _start_advancing(self) -> None:
+        """Start advancing the time in the running event loop,
+        unless it is already advancing.
+        """
+        with self._lock:
+            if self._advance_task is None or self._advance_task.done():
+                self._advance_task = asyncio.create_task(self._advance())
+
+    async def _advance(self) -> None:
+        """Advance the time to each wake-up time in turn,
+        until no sleep is pending.
+        """
+        try:
+            while True:
+                for _ in range(self.settle_iterations):
+                    await asyncio.sleep(0)
+                if self.step_delay > 0:
+                    await asyncio.sleep(self.step_delay)
+                with self._lock:
+                    deadline = self._next_timeout()
+                    if not self._sleepers:
+                        # Expire the timeouts reached by the last sleep.
+                        self._expire_timeouts()
+                        self._advance_task = None
+                        return
+                    wake_time, _, future = self._sleepers[0]
+                    if deadline is not None and deadline < wake_time:
+                        # The timeout is reached before the next wake-up.
+                        self.now = max(self.now, deadline)
+                        self._expire_timeouts()
+                        continue
+                    heapq.heappop(self._sleepers)
+                    if not future.done():
+                        # The sleep was not cancelled.
+                        self.now = max(self.now, wake_time)
+                        wake_up(future)
+        except asyncio.CancelledError:
+            # The event loop is stopping, e.g. at the end of a unit test,
+            # so go on advancing in the event loop of another sleeper.
+            with self._lock:
+                self._advance_task = None
+                loops = {future.get_loop() for _, _, future in self._sleepers}
+            for loop in loops - {asyncio.get_running_loop()}:
+                if not loop.is_closed():
+                    loop.call_soon_threadsafe(self._start_advancing)
+                    break
+            raise
+
+    def _next_timeout(self) -> float | None:
+        """Return the time of the next timeout, if any, dropping the
+        cancelled ones. Call with the lock held.
+        """
+        while self._timeouts and self._timeouts[0][2].done():
+            heapq.heappop(self._timeouts)
+        return self._timeouts[0][0] if self._timeouts else None
+
+    def _expire_timeouts(self) -> None:
+        """Expire the timeouts up to the current time.
+        Call with the lock held.
+        """
+        while self._timeouts and self._timeouts[0][0] <= self.now:
+            _, _, future = heapq.heappop(self._timeouts)
+            wake_up(future)
+
+
+def wake_up(future: asyncio.Future) -> None:
+    """Set the result of the future, from any thread, unless it is done."""
+
+    def set_result() -> None:
+        if not future.done():
+            future.set_result(None)
+
+    loop = future.get_loop()
+    if not loop.is_closed():
+        loop.call_soon_threadsafe(set_result)
+
+
+def get_default_clock() -> Clock:
+    """Get the clock used by the ScriptQueue controllers and the
+    BaseScript timeouts, when they are not given one.
+
+    Returns
+    -------
+    clock : `Clock`
+        The clock set by set_default_clock(), or else the wall clock.
+    """
+    global default_clock
+    if default_clock is None:
+        default_clock = Clock()
+    return default_clock
+
+
+def set_default_clock(clock: Clock | None) -> None:
+    """Set the clock used by the ScriptQueue controllers and the
+    BaseScript timeouts, when they are not given one.
+
+    Parameters
+    ----------
+    clock : `Clock` or `None`
+        The clock, e.g. a VirtualClock for the unit tests.
+        If None, go back to the wall clock.
+    """
+    global default_clock
+    default_clock = clock
@@ -23,7 +23,6 @@
 __all__ = ["ComCamCalibrations", "run_comcam_calibrations"]
 
 import argparse
-import asyncio
 
 import yaml
 from lsst.ts.IntegrationTests import BaseScript
@@ -92,4 +91,4 @@ def run_comcam_calibrations() -> None:
         f"master_{script_class.calib_type} calibrations"
         f"\nwith configuration;\n{script_class.configs}"
     )
-    asyncio.run(script_class.run())
+    script_class.execute()
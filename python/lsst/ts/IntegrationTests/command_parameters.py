@@ -0,0 +1,375 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# This file is part of ts_IntegrationTests.
+#
+# Developed for the Vera C. Rubin Observatory Telescope & Site Software system.
+# This product includes software developed by the Vera C. Rubin Observatory
+# Project (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+__all__ = [
+    "split_parameters",
+    "ParameterParser",
+    "get_command_fields",
+    "get_parameter_parser",
+]
+
+import functools
+from collections.abc import Callable
+from typing import Any
+
+# The quote characters of the parameter values.
+QUOTES = "'\""
+
+
+def parse_bool(value: str) -> bool:
+    """Convert the value to a boolean, regardless of capitalization.
+
+    Raises
+    ------
+    ValueError
+        If the value is not true or false.
+    """
+    if value.lower() == "true":
+        return True
+    if value.lower() == "false":
+        return False
+    raise ValueError(f"{value!r} is not a boolean.")
+
+
+# The converter of the values of each SAL type.
+SAL_TYPE_CONVERTERS: dict[str, Callable[[str], Any]] = {
+    "boolean": parse_bool,
+    "byte": int,
+    "short": int,
+    "int": int,
+    "long": int,
+    "long long": int,
+    "unsigned short": int,
+    "unsigned int": int,
+    "unsigned long": int,
+    "unsigned long long": int,
+    "float": float,
+    "double": float,
+    "string": str,
+}
+
+
+def split_values(text: str, separator: str = ",") -> list[str]:
+    """Split the text at the separators outside quotes and brackets.
+
+    Parameters
+    ----------
+    text : `str`
+        The text to split.
+    separator : `str`
+        The separator character.
+
+    Returns
+    -------
+    values : `list`
+        The stripped values, with their quotes.
+
+    Raises
+    ------
+    ValueError
+        If a quote or bracket is not closed.
+    """
+    values: list[str] = []
+    current: list[str] = []
+    quote = ""
+    depth = 0
+    for char in text:
+        if quote:
+            if char == quote:
+                quote = ""
+        elif char in QUOTES:
+            quote = char
+        elif char == "[":
+            depth += 1
+        elif char == "]":
+            depth -= 1
+        elif char == separator and depth == 0:
+            values.append("".join(current).strip())
+            current = []
+            continue
+        current.append(char)
+    if quote or depth != 0:
+        raise ValueError(f"Unbalanced quote or bracket in {text!r}.")
+    values.append("".join(current).strip())
+    return values
+
+
+def unquote(value: str) -> tuple[str, bool]:
+    """Remove the quotes around the value.
+
+    Returns
+    -------
+    value : `str`
+        The value, without its quotes.
+    quoted : `bool`
+        True if the value was quoted.
+    """
+    if len(value) >= 2 and value[0] in QUOTES and value[-1] == value[0]:
+        return value[1:-1], True
+    return value, False
+
+
+def split_array(value: str) -> list[tuple[str, bool]]:
+    """Split a bracketed array into its unquoted items.
+
+    Raises
+    ------
+    ValueError
+        If the value is not bracketed.
+    """
+    if not (value.startswith("[") and value.endswith("]")):
+        raise ValueError(f"{value!r} is not an [array].")
+    items = split_values(value[1:-1])
+    if items == [""]:
+        return []
+    return [unquote(item) for item in items]
+
+
+def split_parameters(parameters: str) -> list[tuple[str, str, bool]]:
+    """Split the parameters string into key and value pairs.
+
+    Parameters
+    ----------
+    parameters : `str`
+        The parameters, in comma-separated key:value format. Quote a
+        value holding commas or colons, e.g. ``name:'a, b:c'``, and
+        bracket an array, e.g. ``values:[1, 2, 3]``.
+
+    Returns
+    -------
+    pairs : `list`
+        The key, unquoted value and True if the value was quoted,
+        of each parameter.
+
+    Raises
+    ------
+    ValueError
+        If a parameter is not in key:value format.
+    """
+    pairs = []
+    for pair in split_values(parameters):
+        key, colon, value = pair.partition(":")
+        key = key.strip()
+        if not (key and colon):
+            raise ValueError(f"Parameter {pair!r} is not in key:value format.")
+        pairs.append((key, *unquote(value.strip())))
+    return pairs
+
+
+def convert_guess(value: str, quoted: bool) -> Any:
+    """Convert a value of unknown type: a quoted value is a string;
+    otherwise, try an array, a boolean, an integer and a float in turn.
+    """
+    if quoted:
+        return value
+    if value.startswith("[") and value.endswith("]"):
+        return [convert_guess(*item) for item in split_array(value)]
+    try:
+        return parse_bool(value)
+    except ValueError:
+        pass
+    try:
+        return int(value)
+    except ValueError:
+        pass
+    try:
+        return float(value)
+    except ValueError:
+        return value
+
+
+class ParameterParser:
+    """Convert the parameters of a command to their field types.
+
+    Parameters
+    ----------
+    name : `str`
+        The CSC and command, for the error messages.
+    fields : `dict` or `None`
+        The (SAL type, count) of each command field, keyed by field name.
+        If None, the fields are not known, and the type of each value is
+        guessed from its text.
+
+    Notes
+    -----
+    The converter of each field is chosen once, when the parser is
+    created; get_parameter_parser() caches a parser per CSC and command.
+    """
+
+    def __init__(
+        self, name: str, fields: dict[str, tuple[str, int]] | None = None
+    ) -> None:
+        self.name = name
+        self.converters: dict[str, Callable[[str, bool], Any]] | None = None
+        if fields is not None:
+            self.converters = {
+                key: self.make_converter(sal_type, count)
+                for key, (sal_type, count) in fields.items()
+            }
+
+    @staticmethod
+    def make_converter(sal_type: str, count: int) -> Callable[[str, bool], Any]:
+        """Make the converter of a field.
+
+        Parameters
+        ----------
+        sal_type : `str`
+            The SAL type of the field, e.g. "double".
+        count : `int`
+            The number of elements; more than 1 for an array.
+
+        Returns
+        -------
+        converter : ``callable``
+            A function taking the value and True if it was quoted,
+            and returning the converted value.
+        """
+        convert = SAL_TYPE_CONVERTERS.get(sal_type)
+        if convert is None:
+            return convert_guess
+        if count <= 1 or sal_type == "string":
+            return lambda value, quoted: convert(value)
+
+        def convert_array(value: str, quoted: bool) -> list:
+            items = split_array(value)
+            if len(items) > count:
+                raise ValueError(f"{value!r} has more than {count} elements.")
+            return [convert(item) for item, _ in items]
+
+        return convert_array
+
+    def parse(self, parameters: str | dict[str, Any] | None) -> dict[str, Any]:
+        """Convert the parameters.
+
+        Parameters
+        ----------
+        parameters : `str`, `dict` or `None`
+            The parameters, in the format of split_parameters(), or
+            already as a dictionary, which is returned unchanged.
+
+        Returns
+        -------
+        parameters_dict : `dict`
+            The converted parameters, keyed by field name.
+
+        Raises
+        ------
+        ValueError
+            If a parameter is malformed, is not a field of the command,
+            or cannot be converted to the type of its field.
+        """
+        if not parameters:
+            return {}
+        if isinstance(parameters, dict):
+            return dict(parameters)
+        parameters_dict = {}
+        for key, value, quoted in split_parameters(parameters):
+            if self.converters is None:
+                converter = convert_guess
+            elif key in self.converters:
+                converter = self.converters[key]
+            else:
+                raise ValueError(
+                    f"{self.name} has no parameter {key}; "
+                    f"expected one of {sorted(self.converters)}."
+                )
+            try:
+                parameters_dict[key] = converter(value, quoted)
+            except ValueError as e:
+                raise ValueError(f"Invalid {self.name} parameter {key}: {e}") from e
+        return parameters_dict
+
+
+@functools.cache
+def get_component_topics(name: str) -> dict | None:
+    """Get the topics of the given CSC from its XML definition.
+
+    Parameters
+    ----------
+    name : `str`
+        The CSC name, without index.
+
+    Returns
+    -------
+    topics : `dict` or `None`
+        The ``lsst.ts.xml.component_info.TopicInfo`` of each topic, keyed
+        by topic attribute name, e.g. cmd_setScalars; or None if the
+        XML definition is not available.
+    """
+    # Fall back to guessing the types if ts_xml or the CSC XML
+    # definition is not available, rather than failing the command.
+    try:
+        from lsst.ts.xml.component_info import ComponentInfo
+
+        return ComponentInfo(name=name, topic_subname="").topics
+    except Exception:
+        return None
+
+
+def get_command_fields(csc: str, command: str) -> dict[str, tuple[str, int]] | None:
+    """Get the fields of the given command from the XML definition.
+
+    Parameters
+    ----------
+    csc : `str`
+        The CSC[:index].
+    command : `str`
+        The command, e.g. setScalars.
+
+    Returns
+    -------
+    fields : `dict` or `None`
+        The (SAL type, count) of each field set by the user, keyed by
+        field name; or None if the command is not known.
+    """
+    topics = get_component_topics(csc.split(":")[0])
+    topic = topics.get(f"cmd_{command}") if topics is not None else None
+    if topic is None:
+        return None
+    return {
+        key: (field.sal_type, field.count)
+        for key, field in topic.fields.items()
+        if not key.startswith("private_") and key != "salIndex"
+    }
+
+
+@functools.cache
+def get_parameter_parser(csc: str, command: str) -> ParameterParser:
+    """Get the parameter parser of the given command.
+
+    Parameters
+    ----------
+    csc : `str`
+        The CSC[:index].
+    command : `str`
+        The command, e.g. setScalars.
+
+    Returns
+    -------
+    parser : `ParameterParser`
+        The parser converting each parameter to the type of its field,
+        or, if the command is not known, guessing the types.
+    """
+    return ParameterParser(
+        name=f"{csc} {command}", fields=get_command_fields(csc, command)
+    )
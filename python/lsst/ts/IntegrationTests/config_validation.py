@@ -0,0 +1,259 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# This file is part of ts_IntegrationTests.
+#
+# Developed for the Vera C. Rubin Observatory Telescope & Site Software system.
+# This product includes software developed by the Vera C. Rubin Observatory
+# Project (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+__all__ = [
+    "ConfigValidation",
+    "RegistryValidationReport",
+    "get_config_script",
+    "validate_config",
+    "validate_registry",
+    "run_validate_configs",
+]
+
+import argparse
+import concurrent.futures
+import dataclasses
+import fnmatch
+import functools
+import time
+from collections.abc import Mapping
+
+import jsonschema
+import yaml
+
+from .configs.config_registry import registry
+from .configs.config_schemas import config_scripts, script_schemas
+
+
+@dataclasses.dataclass
+class ConfigValidation:
+    """The outcome of checking one registry configuration.
+
+    Attributes
+    ----------
+    name : `str`
+        The name of the configuration in the registry.
+    script : `str` or `None`
+        The path of the script run with the configuration, or None if no
+        script is known to use it.
+    errors : `list`
+        The problems found in the configuration.
+    duration : `float`
+        The time, in seconds, taken by the check.
+    """
+
+    name: str
+    script: str | None
+    errors: list[str] = dataclasses.field(default_factory=list)
+    duration: float = 0.0
+
+    @property
+    def valid(self) -> bool:
+        """True if no problem was found."""
+        return not self.errors
+
+
+@dataclasses.dataclass
+class RegistryValidationReport:
+    """The outcome of checking every registry configuration.
+
+    Attributes
+    ----------
+    results : `list`
+        The ConfigValidation of each configuration, in registry order.
+    duration : `float`
+        The time, in seconds, taken by all the checks.
+    """
+
+    results: list[ConfigValidation] = dataclasses.field(default_factory=list)
+    duration: float = 0.0
+
+    @property
+    def valid(self) -> bool:
+        """True if every configuration is valid."""
+        return all(result.valid for result in self.results)
+
+    @property
+    def invalid(self) -> list[ConfigValidation]:
+        """The results of the invalid configurations."""
+        return [result for result in self.results if not result.valid]
+
+    def format(self) -> str:
+        """Format the report as text, one line per invalid configuration."""
+        lines = [
+            f"Checked {len(self.results)} configurations in "
+            f"{self.duration:.2f} s; {len(self.invalid)} invalid."
+        ]
+        for result in self.invalid:
+            lines.append(f"  {result.name} ({result.script}):")
+            lines.extend(f"    {error}" for error in result.errors)
+        return "\n".join(lines)
+
+
+def get_config_script(name: str) -> str | None:
+    """Get the path of the script run with the named configuration.
+
+    Parameters
+    ----------
+    name : `str`
+        The name of the configuration in the registry.
+
+    Returns
+    -------
+    script : `str` or `None`
+        The script path, or None if no script is known to use the
+        configuration.
+    """
+    for pattern, script in config_scripts.items():
+        if fnmatch.fnmatchcase(name, pattern):
+            return script
+    return None
+
+
+@functools.cache
+def get_validator(script: str) -> jsonschema.Draft7Validator:
+    """Get the validator of the configurations of the given script.
+
+    Parameters
+    ----------
+    script : `str`
+        The script path.
+
+    Raises
+    ------
+    KeyError
+        If there is no schema for the script.
+    """
+    schema = yaml.safe_load(script_schemas[script])
+    return jsonschema.Draft7Validator(schema)
+
+
+def validate_config(
+    name: str, script: str | None, config_yaml: str
+) -> ConfigValidation:
+    """Check the given configuration against the schema of its script.
+
+    Parameters
+    ----------
+    name : `str`
+        The name of the configuration in the registry.
+    script : `str` or `None`
+        The path of the script run with the configuration.
+    config_yaml : `str`
+        The YAML formatted configuration.
+
+    Returns
+    -------
+    result : `ConfigValidation`
+        The outcome of the check.
+    """
+    start_time = time.monotonic()
+    result = ConfigValidation(name=name, script=script)
+    try:
+        config = yaml.safe_load(config_yaml)
+    except yaml.YAMLError as e:
+        result.errors.append(f"Invalid YAML: {e}")
+    else:
+        if script is None:
+            result.errors.append("No script is known to use this configuration.")
+        elif script not in script_schemas:
+            result.errors.append(f"No schema for {script}.")
+        else:
+            errors = get_validator(script).iter_errors(config)
+            for error in sorted(errors, key=lambda error: list(error.path)):
+                path = "/".join(str(item) for item in error.path) or "<root>"
+                result.errors.append(f"{path}: {error.message}")
+    result.duration = time.monotonic() - start_time
+    return result
+
+
+def validate_registry(
+    configs: Mapping[str, str] | None = None, max_workers: int | None = None
+) -> RegistryValidationReport:
+    """Check every registry configuration against the schema of its script.
+
+    Parameters
+    ----------
+    configs : ``mapping`` or `None`
+        The YAML formatted configurations to check, keyed by name.
+        If None, check every configuration of the registry.
+    max_workers : `int` or `None`
+        The number of worker processes. If None, use one per CPU.
+        If 1, check the configurations in this process.
+
+    Returns
+    -------
+    report : `RegistryValidationReport`
+        The outcome of every check.
+    """
+    if configs is None:
+        # The camera playlist configuration is only added to the registry
+        # when this module is imported.
+        from .configs import camera_playlist_configs  # noqa: F401
+
+        configs = registry
+    start_time = time.monotonic()
+    names = list(configs)
+    scripts = [get_config_script(name) for name in names]
+    config_yamls = [configs[name] for name in names]
+    if max_workers == 1:
+        results = list(map(validate_config, names, scripts, config_yamls))
+    else:
+        with concurrent.futures.ProcessPoolExecutor(max_workers) as executor:
+            results = list(executor.map(validate_config, names, scripts, config_yamls))
+    return RegistryValidationReport(
+        results=results, duration=time.monotonic() - start_time
+    )
+
+
+def run_validate_configs() -> None:
+    # Define the script arguments.
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="Specify the number of worker processes (default: one per CPU).",
+    )
+    parser.add_argument(
+        "-i",
+        "--info",
+        action="store_true",
+        help="Print the allowed options.",
+    )
+    args = parser.parse_args()
+    # Print the help if requested.
+    if args.info:
+        parser.print_help()
+        exit()
+    main(args)
+
+
+def main(opts: argparse.Namespace) -> None:
+    # Check the configurations, and exit with an error
+    # if any of them is invalid.
+    report = validate_registry(max_workers=opts.jobs)
+    print(report.format())
+    if not report.valid:
+        exit(1)
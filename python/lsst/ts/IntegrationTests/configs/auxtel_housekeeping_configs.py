@@ -21,28 +21,20 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import yaml
-
 from .config_registry import registry
 
 # Add the script configurations to the configuration registry.
 
 # ATDome homed config
-yaml_string = yaml.safe_load(
+registry["atdome_home"] = (
     """
     component: "ATDome"
     cmd: "homeAzimuth"
     """
 )
 
-registry["atdome_home"] = yaml.safe_dump(
-    yaml_string,
-    explicit_start=True,
-    canonical=True,
-)
-
 # ATPtg park
-yaml_string = yaml.safe_load(
+registry["atptg_park"] = (
     """
     az: 0.0
     el: 80
@@ -50,41 +42,23 @@ yaml_string = yaml.safe_load(
     """
 )
 
-registry["atptg_park"] = yaml.safe_dump(
-    yaml_string,
-    explicit_start=True,
-    canonical=True,
-)
-
 # ATDome park configs
-yaml_string = yaml.safe_load(
+registry["atdome_park"] = (
     """
     az: 285
     """
 )
 
-registry["atdome_park"] = yaml.safe_dump(
-    yaml_string,
-    explicit_start=True,
-    canonical=True,
-)
-
 # ATPtg stop tracking
-yaml_string = yaml.safe_load(
+registry["atptg_stop_tracking"] = (
     """
     component: "ATPtg"
     cmd: stopTracking
     """
 )
 
-registry["atptg_stop_tracking"] = yaml.safe_dump(
-    yaml_string,
-    explicit_start=True,
-    canonical=True,
-)
-
 # ATMCS setInstrumentPort configs
-yaml_string = yaml.safe_load(
+registry["atmcs_housekeeping"] = (
     """
     component: "ATMCS"
     cmd: "setInstrumentPort"
@@ -92,9 +66,3 @@ yaml_string = yaml.safe_load(
         port: 2
     """
 )
-
-registry["atmcs_housekeeping"] = yaml.safe_dump(
-    yaml_string,
-    explicit_start=True,
-    canonical=True,
-)
@@ -21,15 +21,13 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import yaml
-
 from .config_registry import registry
 
 # Add the AuxTel Night Operations
 # script configurations to the registry.
 
 # auxtel_reset_offsets
-yaml_string = yaml.safe_load(
+registry["auxtel_enable_all_corrections"] = (
     """
     component: "ATAOS"
     cmd: "enableCorrection"
@@ -37,13 +35,8 @@ yaml_string = yaml.safe_load(
       enableAll: True
     """
 )
-registry["auxtel_enable_all_corrections"] = yaml.safe_dump(
-    yaml_string,
-    explicit_start=True,
-    canonical=True,
-)
 
-yaml_string = yaml.safe_load(
+registry["auxtel_reset_offsets"] = (
     """
     component: "ATAOS"
     cmd: "resetOffset"
@@ -51,13 +44,8 @@ yaml_string = yaml.safe_load(
       axis: "all"
     """
 )
-registry["auxtel_reset_offsets"] = yaml.safe_dump(
-    yaml_string,
-    explicit_start=True,
-    canonical=True,
-)
 
-yaml_string = yaml.safe_load(
+registry["auxtel_disable_all_corrections"] = (
     """
     component: "ATAOS"
     cmd: "disableCorrection"
@@ -65,13 +53,8 @@ yaml_string = yaml.safe_load(
       disableAll: True
     """
 )
-registry["auxtel_disable_all_corrections"] = yaml.safe_dump(
-    yaml_string,
-    explicit_start=True,
-    canonical=True,
-)
 
-yaml_string = yaml.safe_load(
+registry["auxtel_enable_m1_hex_atspect_corrections"] = (
     """
     component: "ATAOS"
     cmd: "enableCorrection"
@@ -81,128 +64,87 @@ yaml_string = yaml.safe_load(
       atspectrograph: True
     """
 )
-registry["auxtel_enable_m1_hex_atspect_corrections"] = yaml.safe_dump(
-    yaml_string,
-    explicit_start=True,
-    canonical=True,
-)
 
 # auxtel_latiss_wep_align
-registry["auxtel_wep_align"] = yaml.safe_dump(
-    {
-        "track_target": {"target_name": "HD164461"},
-        "rot_type": "PhysicalSky",
-        "filter": "SDSSr_65mm",
-        "grating": "empty_1",
-        "exposure_time": 5,
-        "reason": "IntegrationTesting",
-        "program": "IntegrationTesting",
-    },
-    explicit_start=True,
-    canonical=True,
-)
+registry["auxtel_wep_align"] = {
+    "track_target": {"target_name": "HD164461"},
+    "rot_type": "PhysicalSky",
+    "filter": "SDSSr_65mm",
+    "grating": "empty_1",
+    "exposure_time": 5,
+    "reason": "IntegrationTesting",
+    "program": "IntegrationTesting",
+}
 
 # latiss_acquire and latiss_take_sequence configs
 # pointing
-registry["auxtel_acquire_pointing"] = yaml.safe_dump(
-    {
-        "object_name": "HD164461",
-        "rot_type": "PhysicalSky",
-        "acq_filter": "empty_1",
-        "acq_grating": "empty_1",
-        "target_pointing_tolerance": 4,
-        "max_acq_iter": 0,
-        "reason": "IntegrationTesting_PointingConfiguration",
-        "program": "IntegrationTesting_PointingConfiguration",
-    },
-    explicit_start=True,
-    canonical=True,
-)
-registry["auxtel_take_sequence_pointing"] = yaml.safe_dump(
-    {
-        "grating_sequence": ["empty_1"],
-        "reason": "IntegrationTesting_PointingConfiguration",
-        "program": "IntegrationTesting_PointingConfiguration",
-    },
-    explicit_start=True,
-    canonical=True,
-)
+registry["auxtel_acquire_pointing"] = {
+    "object_name": "HD164461",
+    "rot_type": "PhysicalSky",
+    "acq_filter": "empty_1",
+    "acq_grating": "empty_1",
+    "target_pointing_tolerance": 4,
+    "max_acq_iter": 0,
+    "reason": "IntegrationTesting_PointingConfiguration",
+    "program": "IntegrationTesting_PointingConfiguration",
+}
+registry["auxtel_take_sequence_pointing"] = {
+    "grating_sequence": ["empty_1"],
+    "reason": "IntegrationTesting_PointingConfiguration",
+    "program": "IntegrationTesting_PointingConfiguration",
+}
 
 # latiss_acquire and latiss_take_sequence configs
 # verfiy
-registry["auxtel_acquire_verify"] = yaml.safe_dump(
-    {
-        "object_name": "HD164461",
-        "rot_type": "PhysicalSky",
-        "acq_filter": "SDSSr_65mm",
-        "acq_grating": "empty_1",
-        "acq_exposure_time": 0.4,
-        "target_pointing_tolerance": 6,
-        "max_acq_iter": 3,
-        "target_pointing_verification": False,
-        "reason": "IntegrationTesting_VerifyConfiguration",
-        "program": "IntegrationTesting_VerifyConfiguration",
-    },
-    explicit_start=True,
-    canonical=True,
-)
-registry["auxtel_take_sequence_verify"] = yaml.safe_dump(
-    {
-        "filter_sequence": ["SDSSr_65mm"],
-        "grating_sequence": ["empty_1"],
-        "reason": "IntegrationTesting_VerifyConfiguration",
-        "program": "IntegrationTesting_VerifyConfiguration",
-    },
-    explicit_start=True,
-    canonical=True,
-)
+registry["auxtel_acquire_verify"] = {
+    "object_name": "HD164461",
+    "rot_type": "PhysicalSky",
+    "acq_filter": "SDSSr_65mm",
+    "acq_grating": "empty_1",
+    "acq_exposure_time": 0.4,
+    "target_pointing_tolerance": 6,
+    "max_acq_iter": 3,
+    "target_pointing_verification": False,
+    "reason": "IntegrationTesting_VerifyConfiguration",
+    "program": "IntegrationTesting_VerifyConfiguration",
+}
+registry["auxtel_take_sequence_verify"] = {
+    "filter_sequence": ["SDSSr_65mm"],
+    "grating_sequence": ["empty_1"],
+    "reason": "IntegrationTesting_VerifyConfiguration",
+    "program": "IntegrationTesting_VerifyConfiguration",
+}
 
 # nominal/standard
-registry["auxtel_acquire_nominal"] = yaml.safe_dump(
-    {
-        "object_name": "HD164461",
-        "rot_type": "PhysicalSky",
-        "acq_filter": "SDSSr_65mm",
-        "acq_grating": "empty_1",
-        "target_pointing_tolerance": 5,
-        "target_pointing_verification": False,
-        "reason": "IntegrationTesting_NominalConfiguration",
-        "program": "IntegrationTesting_NominalConfiguration",
-    },
-    explicit_start=True,
-    canonical=True,
-)
-registry["auxtel_take_sequence_nominal"] = yaml.safe_dump(
-    {
-        "grating_sequence": ["holo4_003", "holo4_003", "empty_1"],
-        "filter_sequence": ["empty_1", "SDSSr_65mm", "SDSSr_65mm"],
-        "exposure_time_sequence": [4.0, 4.0, 1.0],
-        "reason": "IntegrationTesting_NominalConfiguration",
-        "program": "IntegrationTesting_NominalConfiguration",
-    },
-    explicit_start=True,
-    canonical=True,
-)
+registry["auxtel_acquire_nominal"] = {
+    "object_name": "HD164461",
+    "rot_type": "PhysicalSky",
+    "acq_filter": "SDSSr_65mm",
+    "acq_grating": "empty_1",
+    "target_pointing_tolerance": 5,
+    "target_pointing_verification": False,
+    "reason": "IntegrationTesting_NominalConfiguration",
+    "program": "IntegrationTesting_NominalConfiguration",
+}
+registry["auxtel_take_sequence_nominal"] = {
+    "grating_sequence": ["holo4_003", "holo4_003", "empty_1"],
+    "filter_sequence": ["empty_1", "SDSSr_65mm", "SDSSr_65mm"],
+    "exposure_time_sequence": [4.0, 4.0, 1.0],
+    "reason": "IntegrationTesting_NominalConfiguration",
+    "program": "IntegrationTesting_NominalConfiguration",
+}
 
 # test
-registry["auxtel_acquire_test"] = yaml.safe_dump(
-    {
-        "object_name": "HD164461",
-        "rot_type": "PhysicalSky",
-        "reason": "IntegrationTesting_TestConfiguration",
-        "program": "IntegrationTesting_TestConfiguration",
-    },
-    explicit_start=True,
-    canonical=True,
-)
-registry["auxtel_take_sequence_test"] = yaml.safe_dump(
-    {
-        "grating_sequence": ["holo4_003", "holo4_003", "holo4_003"],
-        "filter_sequence": ["SDSSr_65mm", "SDSSr_65mm", "SDSSr_65mm"],
-        "exposure_time_sequence": [5.0, 5.0, 5.0],
-        "reason": "IntegrationTesting_TestConfiguration",
-        "program": "IntegrationTesting_TestConfiguration",
-    },
-    explicit_start=True,
-    canonical=True,
-)
+registry["auxtel_acquire_test"] = {
+    "object_name": "HD164461",
+    "rot_type": "PhysicalSky",
+    "reason": "IntegrationTesting_TestConfiguration",
+    "program": "IntegrationTesting_TestConfiguration",
+}
+registry["auxtel_take_sequence_test"] = {
+    "grating_sequence": ["holo4_003", "holo4_003", "holo4_003"],
+    "filter_sequence": ["SDSSr_65mm", "SDSSr_65mm", "SDSSr_65mm"],
+    "exposure_time_sequence": [5.0, 5.0, 5.0],
+    "reason": "IntegrationTesting_TestConfiguration",
+    "program": "IntegrationTesting_TestConfiguration",
+}
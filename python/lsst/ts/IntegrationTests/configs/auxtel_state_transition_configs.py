@@ -21,14 +21,12 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import yaml
-
 from .config_registry import registry
 
 # Add the State Transition script configurations to the registry.
 
 # auxtel_standby_disabled
-yaml_string = yaml.safe_load(
+registry["auxtel_standby_disabled"] = (
     """
     data:
     - [ATDome, DISABLED]
@@ -41,12 +39,8 @@ yaml_string = yaml.safe_load(
     """
 )
 
-registry["auxtel_standby_disabled"] = yaml.safe_dump(
-    yaml_string, explicit_start=True, canonical=True
-)
-
 # auxtel_camera_standby_disabled
-yaml_string = yaml.safe_load(
+registry["auxtel_camera_standby_disabled"] = (
     """
     data:
     - [ATOODS, DISABLED]
@@ -56,12 +50,8 @@ yaml_string = yaml.safe_load(
     """
 )
 
-registry["auxtel_camera_standby_disabled"] = yaml.safe_dump(
-    yaml_string, explicit_start=True, canonical=True
-)
-
 # auxtel_disabled_enabled
-yaml_string = yaml.safe_load(
+registry["auxtel_disabled_enabled"] = (
     """
     data:
     - [ATDome, ENABLED]
@@ -74,12 +64,8 @@ yaml_string = yaml.safe_load(
     """
 )
 
-registry["auxtel_disabled_enabled"] = yaml.safe_dump(
-    yaml_string, explicit_start=True, canonical=True
-)
-
 # auxtel_camera_disabled_enabled
-yaml_string = yaml.safe_load(
+registry["auxtel_camera_disabled_enabled"] = (
     """
     data:
     - [ATOODS, ENABLED]
@@ -89,18 +75,10 @@ yaml_string = yaml.safe_load(
     """
 )
 
-registry["auxtel_camera_disabled_enabled"] = yaml.safe_dump(
-    yaml_string, explicit_start=True, canonical=True
-)
-
 # auxtel_offline_standby
-yaml_string = yaml.safe_load(
+registry["auxtel_offline_standby"] = (
     """
     data:
     - [ATCamera, STANDBY]
     """
 )
-
-registry["auxtel_offline_standby"] = yaml.safe_dump(
-    yaml_string, explicit_start=True, canonical=True
-)
@@ -21,8 +21,6 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import yaml
-
 from .config_registry import registry
 
 # Create the list Camera short-names.
@@ -81,7 +79,7 @@ playlist_options.sort()
 
 # Add the script configurations to the configuration registry.
 
-yaml_string = yaml.safe_load(
+registry["camera_playlist"] = (
     """
     component: "replace_me"
     cmd: "play"
@@ -90,9 +88,3 @@ yaml_string = yaml.safe_load(
         repeat: True
     """
 )
-
-registry["camera_playlist"] = yaml.safe_dump(
-    yaml_string,
-    explicit_start=True,
-    canonical=True,
-)
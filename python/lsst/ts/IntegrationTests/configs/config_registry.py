@@ -20,16 +20,180 @@
 #
 # You should have received a copy of the GNU General Public License
 
+import hashlib
+import importlib
+import importlib.util
+import json
+import os
+import pathlib
+import tempfile
 from collections import UserDict
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any
+
+import yaml
 
 __all__ = ["registry"]
 
+# The environment variable enabling the on-disk cache of the rendered
+# configurations; see ConfigRegistry.get_cache_path().
+CACHE_ENV_VAR = "TS_INTEGRATION_TESTS_CONFIG_CACHE"
+
+# A script configuration: a YAML formatted string, a dictionary, or a
+# function taking no arguments and returning either.
+ConfigSource = str | dict[str, Any] | Callable[[], str | dict[str, Any]]
+
+
+def render_config(config: ConfigSource) -> str:
+    """Render the given script configuration as canonical YAML.
+
+    Parameters
+    ----------
+    config : `str`, `dict` or ``callable``
+        The script configuration, as stored in the registry.
+
+    Returns
+    -------
+    config_yaml : `str`
+        The canonical YAML formatted string representation of the
+        script configuration.
+    """
+    if callable(config):
+        config = config()
+    if isinstance(config, str):
+        config = yaml.safe_load(config)
+    return yaml.safe_dump(config, explicit_start=True, canonical=True)
+
 
 class ConfigRegistry(UserDict):
-    def __init__(self) -> None:
+    """The named script configurations.
+
+    Parameters
+    ----------
+    modules : ``iterable``
+        The names of the modules adding the configurations to the registry.
+        They are imported the first time the registry is read.
+
+    Notes
+    -----
+    The configurations are stored as given, and rendered as canonical YAML
+    the first time they are read. The rendered string is kept, so each
+    configuration is rendered at most once, and the configurations that are
+    never read are never rendered.
+
+    If the TS_INTEGRATION_TESTS_CONFIG_CACHE environment variable is set,
+    the rendered configurations of the modules are also kept in a file, and
+    read back in one go by the next process. The file is rewritten whenever
+    the package version or the content of the modules changes.
+    """
+
+    def __init__(self, modules: Iterable[str] = ()) -> None:
         super().__init__()
+        self.modules = list(modules)
+        self.loaded = False
+        self.rendered: dict[str, str] = {}
+
+    def load(self) -> None:
+        """Import the modules adding the configurations, if not yet done."""
+        if self.loaded:
+            return
+        self.loaded = True
+        cache_path = self.get_cache_path()
+        if cache_path is None:
+            for module in self.modules:
+                importlib.import_module(module)
+            return
+        cache_key = self.get_cache_key()
+        configs = self.read_cache(cache_path, cache_key)
+        if configs is None:
+            names = set(self.data)
+            for module in self.modules:
+                importlib.import_module(module)
+            configs = {name: self[name] for name in self.data if name not in names}
+            self.write_cache(cache_path, cache_key, configs)
+        else:
+            for name, config_yaml in configs.items():
+                self.data.setdefault(name, config_yaml)
+                self.rendered.setdefault(name, config_yaml)
+
+    def get_cache_path(self) -> pathlib.Path | None:
+        """Get the path of the on-disk cache of the rendered configurations.
+
+        Returns
+        -------
+        cache_path : `pathlib.Path` or `None`
+            The cache file, or None if the cache is disabled. The cache is
+            enabled by setting TS_INTEGRATION_TESTS_CONFIG_CACHE to the
+            cache directory, or to 1 to use ts_IntegrationTests in the user
+            cache directory ($XDG_CACHE_HOME, or ~/.cache).
+        """
+        cache_dir = os.environ.get(CACHE_ENV_VAR, "")
+        if not cache_dir or cache_dir == "0":
+            return None
+        if cache_dir == "1":
+            user_cache_dir = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+                os.path.expanduser("~"), ".cache"
+            )
+            cache_dir = os.path.join(user_cache_dir, "ts_IntegrationTests")
+        return pathlib.Path(cache_dir) / "config_registry.json"
 
-    def __setitem__(self, name: str, config_yaml: str) -> None:
+    def get_cache_key(self) -> str:
+        """Get the key identifying the current configurations: the package
+        version and a hash of the modules adding the configurations.
+        """
+        from lsst.ts.IntegrationTests import __version__
+
+        digest = hashlib.sha256()
+        for module in self.modules:
+            spec = importlib.util.find_spec(module)
+            if spec is None or spec.origin is None:
+                raise ModuleNotFoundError(f"No module named {module!r}")
+            digest.update(module.encode())
+            digest.update(pathlib.Path(spec.origin).read_bytes())
+        return f"{__version__}:{digest.hexdigest()}"
+
+    @staticmethod
+    def read_cache(cache_path: pathlib.Path, cache_key: str) -> dict[str, str] | None:
+        """Read the rendered configurations from the cache.
+
+        Returns
+        -------
+        configs : `dict` or `None`
+            The rendered configurations, keyed by name, or None if the cache
+            is missing, unreadable, or for another cache key.
+        """
+        try:
+            with open(cache_path) as cache_file:
+                cache = json.load(cache_file)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(cache, dict) or cache.get("key") != cache_key:
+            return None
+        return cache.get("configs")
+
+    @staticmethod
+    def write_cache(
+        cache_path: pathlib.Path, cache_key: str, configs: dict[str, str]
+    ) -> None:
+        """Write the rendered configurations to the cache.
+
+        The file is replaced atomically, so concurrent processes never read
+        a partial cache. Errors are ignored; the cache is only an
+        optimization.
+        """
+        cache_file = None
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w", dir=cache_path.parent, suffix=".tmp", delete=False
+            ) as cache_file:
+                json.dump({"key": cache_key, "configs": configs}, cache_file)
+            os.replace(cache_file.name, cache_path)
+        except OSError:
+            if cache_file is not None:
+                pathlib.Path(cache_file.name).unlink(missing_ok=True)
+
+    def __setitem__(self, name: str, config: ConfigSource) -> None:
         """Add the given named configuration to the registry dictionary.
 
         Notes
@@ -41,16 +205,83 @@ class ConfigRegistry(UserDict):
         name : `str`
             The name of the configuration.
             This is the 'key' in the key-value pair.
-        config_yaml : `str`
-            A YAML formatted string representation of the script configuration.
-            This is the 'value' in the key-value pair.
+        config : `str`, `dict` or ``callable``
+            A YAML formatted string, or dictionary, representation of the
+            script configuration, or a function taking no arguments and
+            returning either. This is the 'value' in the key-value pair.
 
         """
         if name in self.data:
             raise ValueError(f"{name} already present")
-        self.data[name] = config_yaml
+        self.data[name] = config
+
+    def __getitem__(self, name: str) -> str:
+        """Get the canonical YAML representation of the named configuration.
+
+        Parameters
+        ----------
+        name : `str`
+            The name of the configuration.
+
+        Returns
+        -------
+        config_yaml : `str`
+            A YAML formatted string representation of the script
+            configuration.
+
+        Raises
+        ------
+        KeyError
+            If the name does not appear in the registry.
+        """
+        try:
+            return self.rendered[name]
+        except KeyError:
+            pass
+        self.load()
+        config_yaml = render_config(self.data[name])
+        self.rendered[name] = config_yaml
+        return config_yaml
+
+    def __delitem__(self, name: str) -> None:
+        self.load()
+        del self.data[name]
+        self.rendered.pop(name, None)
+
+    def __contains__(self, name: object) -> bool:
+        self.load()
+        return name in self.data
+
+    def __iter__(self) -> Iterator[str]:
+        self.load()
+        return iter(self.data)
+
+    def __len__(self) -> int:
+        self.load()
+        return len(self.data)
 
 
 # Define the registry in the class module, to prevent multiple
 # registries exisiting in memory at the same time.
-registry = ConfigRegistry()
+registry = ConfigRegistry(
+    modules=[
+        f"{__package__}.{name}"
+        for name in (
+            "auxtel_housekeeping_configs",
+            "auxtel_night_operations_configs",
+            "auxtel_state_transition_configs",
+            "eas_state_transition_configs",
+            "enabled_offline_state_transition_configs",
+            "gencam_state_transition_configs",
+            "image_taking_configs",
+            "love_stress_test_configs",
+            "maintel_housekeeping_configs",
+            "maintel_m1m3_configs",
+            "maintel_state_transition_configs",
+            "obssys_state_transition_configs",
+            "shutdown_configs",
+            "take_image_latiss_configs",
+            "track_target_configs",
+        )
+    ]
+)
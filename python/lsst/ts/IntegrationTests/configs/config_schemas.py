@@ -0,0 +1,363 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# This file is part of ts_IntegrationTests.
+#
+# Developed for the Vera C. Rubin Observatory Telescope & Site Software system.
+# This product includes software developed by the Vera C. Rubin Observatory
+# Project (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+__all__ = ["config_scripts", "script_schemas"]
+
+# The script run with each registry configuration, as an ordered mapping of
+# configuration name patterns (see fnmatch) to script paths.
+# The first matching pattern is used.
+config_scripts: dict[str, str] = {
+    "mtcs_enabled_offline": "maintel/offline_mtcs.py",
+    "*_offline_standby": "set_summary_state.py",
+    "*_standby_disabled": "set_summary_state.py",
+    "*_disabled_enabled": "set_summary_state.py",
+    "*_enabled_offline": "set_summary_state.py",
+    "atdome_park": "auxtel/atdome/slew_dome.py",
+    "atptg_park": "auxtel/point_azel.py",
+    "mtptg_park": "maintel/move_p2p.py",
+    "atdome_home": "run_command.py",
+    "atmcs_housekeeping": "run_command.py",
+    "*_stop_tracking": "run_command.py",
+    "*_corrections": "run_command.py",
+    "*_set_filter": "run_command.py",
+    "auxtel_reset_offsets": "run_command.py",
+    "camera_playlist": "run_command.py",
+    "mtmount_home_both_axes": "run_command.py",
+    "auxtel_acquire_*": "auxtel/latiss_acquire.py",
+    "auxtel_take_sequence_*": "auxtel/latiss_take_sequence.py",
+    "auxtel_visit_config*": "auxtel/take_image_latiss.py",
+    "image_taking": "auxtel/take_image_latiss.py",
+    "auxtel_wep_align": "auxtel/latiss_wep_align.py",
+    "latiss_calibrations_*": "auxtel/make_latiss_calibrations.py",
+    "comcam_calibrations_*": "maintel/make_comcam_calibrations.py",
+    "lsstcam_calibrations_*": "maintel/make_lsstcam_calibrations.py",
+    "enable1": "auxtel/enable_atcs.py",
+    "love_stress": "make_love_stress_tests.py",
+    "lower_m1m3": "maintel/m1m3/lower_m1m3.py",
+    "track_target": "auxtel/track_target.py",
+}
+
+# Define the schemas used to check the registry configurations,
+# keyed by script path. They check the configuration items used by this
+# package; the scripts themselves may accept more.
+take_image_schema = """
+$schema: http://json-schema.org/draft-07/schema#
+type: object
+properties:
+  image_type:
+    type: string
+    enum: [BIAS, DARK, FLAT, OBJECT, ENGTEST, ACQ, CWFS, FOCUS, STUTTERED]
+  nimages:
+    type: integer
+    minimum: 1
+  exp_times:
+    anyOf:
+      - type: number
+        minimum: 0
+      - type: array
+        items:
+          type: number
+          minimum: 0
+        minItems: 1
+  filter:
+    type: [string, integer, "null"]
+  grating:
+    type: [string, integer, "null"]
+  linear_stage:
+    type: [number, "null"]
+  reason:
+    type: string
+  program:
+    type: string
+required: [image_type]
+"""
+
+calibrations_schema = """
+$schema: http://json-schema.org/draft-07/schema#
+type: object
+properties:
+  n_bias:
+    type: integer
+    minimum: 0
+  n_dark:
+    type: integer
+    minimum: 0
+  n_flat:
+    type: integer
+    minimum: 0
+  exp_times_dark:
+    anyOf:
+      - type: number
+        minimum: 0
+      - type: array
+        items:
+          type: number
+          minimum: 0
+  exp_times_flat:
+    anyOf:
+      - type: number
+        minimum: 0
+      - type: array
+        items:
+          type: number
+          minimum: 0
+  detectors:
+    type: array
+    items:
+      type: integer
+      minimum: 0
+  filter:
+    type: [string, "null"]
+  calib_collection:
+    type: string
+  certify_calib_begin_date:
+    type: string
+  generate_calibrations:
+    type: boolean
+  do_verify:
+    type: boolean
+  do_defects:
+    type: boolean
+  do_ptc:
+    type: boolean
+required: [calib_collection, certify_calib_begin_date]
+"""
+
+script_schemas: dict[str, str] = {
+    "set_summary_state.py": """
+$schema: http://json-schema.org/draft-07/schema#
+type: object
+properties:
+  data:
+    type: array
+    minItems: 1
+    items:
+      type: array
+      minItems: 2
+      maxItems: 3
+      items:
+        - type: string
+          pattern: "^[a-zA-Z][a-zA-Z0-9_]*(:[0-9]+)?$"
+        - type: string
+          pattern: "^(?i:offline|standby|disabled|enabled)$"
+        - type: string
+required: [data]
+additionalProperties: false
+""",
+    "run_command.py": """
+$schema: http://json-schema.org/draft-07/schema#
+type: object
+properties:
+  component:
+    type: string
+    pattern: "^[a-zA-Z][a-zA-Z0-9_]*(:[0-9]+)?$"
+  cmd:
+    type: string
+  parameters:
+    type: object
+  event:
+    type: string
+  flush:
+    type: boolean
+  event_timeout:
+    type: number
+required: [component, cmd]
+""",
+    "auxtel/atdome/slew_dome.py": """
+$schema: http://json-schema.org/draft-07/schema#
+type: object
+properties:
+  az:
+    type: number
+required: [az]
+""",
+    "auxtel/point_azel.py": """
+$schema: http://json-schema.org/draft-07/schema#
+type: object
+properties:
+  az:
+    type: number
+  el:
+    type: number
+    minimum: 0
+    maximum: 90
+  target_name:
+    type: string
+required: [az, el]
+""",
+    "maintel/move_p2p.py": """
+$schema: http://json-schema.org/draft-07/schema#
+type: object
+properties:
+  az:
+    type: number
+  el:
+    type: number
+    minimum: 0
+    maximum: 90
+  ignore:
+    type: array
+    items:
+      type: string
+required: [az, el]
+""",
+    "maintel/offline_mtcs.py": """
+$schema: http://json-schema.org/draft-07/schema#
+type: object
+properties:
+  ignore:
+    type: array
+    items:
+      type: string
+""",
+    "auxtel/enable_atcs.py": """
+$schema: http://json-schema.org/draft-07/schema#
+type: object
+additionalProperties:
+  type: string
+""",
+    "auxtel/latiss_acquire.py": """
+$schema: http://json-schema.org/draft-07/schema#
+type: object
+properties:
+  object_name:
+    type: string
+  rot_type:
+    type: string
+  acq_filter:
+    type: string
+  acq_grating:
+    type: string
+  acq_exposure_time:
+    type: number
+    minimum: 0
+  target_pointing_tolerance:
+    type: number
+    minimum: 0
+  target_pointing_verification:
+    type: boolean
+  max_acq_iter:
+    type: integer
+    minimum: 0
+  reason:
+    type: string
+  program:
+    type: string
+required: [object_name]
+""",
+    "auxtel/latiss_take_sequence.py": """
+$schema: http://json-schema.org/draft-07/schema#
+type: object
+properties:
+  grating_sequence:
+    type: array
+    items:
+      type: string
+  filter_sequence:
+    type: array
+    items:
+      type: string
+  exposure_time_sequence:
+    type: array
+    items:
+      type: number
+      minimum: 0
+  reason:
+    type: string
+  program:
+    type: string
+""",
+    "auxtel/take_image_latiss.py": take_image_schema,
+    "maintel/take_image_comcam.py": take_image_schema,
+    "maintel/take_image_lsstcam.py": take_image_schema,
+    "auxtel/latiss_wep_align.py": """
+$schema: http://json-schema.org/draft-07/schema#
+type: object
+properties:
+  track_target:
+    type: object
+    properties:
+      target_name:
+        type: string
+    required: [target_name]
+  rot_type:
+    type: string
+  filter:
+    type: string
+  grating:
+    type: string
+  exposure_time:
+    type: number
+    minimum: 0
+  reason:
+    type: string
+  program:
+    type: string
+""",
+    "auxtel/make_latiss_calibrations.py": calibrations_schema,
+    "maintel/make_comcam_calibrations.py": calibrations_schema,
+    "maintel/make_lsstcam_calibrations.py": calibrations_schema,
+    "make_love_stress_tests.py": """
+$schema: http://json-schema.org/draft-07/schema#
+type: object
+properties:
+  location:
+    type: string
+  data:
+    type: array
+    minItems: 1
+    items:
+      type: string
+      pattern: "^[a-zA-Z][a-zA-Z0-9_]*:[0-9]+$"
+required: [data]
+""",
+    "maintel/m1m3/lower_m1m3.py": """
+$schema: http://json-schema.org/draft-07/schema#
+type: object
+properties:
+  test_case:
+    type: object
+    properties:
+      name:
+        type: string
+      execution:
+        type: string
+      version:
+        type: string
+""",
+    "auxtel/track_target.py": """
+$schema: http://json-schema.org/draft-07/schema#
+type: object
+properties:
+  target_name:
+    type: string
+  rot_type:
+    type: string
+  rot_value:
+    type: number
+  track_for:
+    type: number
+    minimum: 0
+required: [target_name]
+""",
+}
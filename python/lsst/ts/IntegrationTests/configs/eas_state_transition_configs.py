@@ -21,14 +21,12 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import yaml
-
 from .config_registry import registry
 
 # Add the State Transition script configurations to the registry.
 
 # eas_standby_disabled
-yaml_string = yaml.safe_load(
+registry["eas_standby_disabled"] = (
     """
     data:
     - [DIMM:1, DISABLED]
@@ -52,12 +50,8 @@ yaml_string = yaml.safe_load(
     """
 )
 
-registry["eas_standby_disabled"] = yaml.safe_dump(
-    yaml_string, explicit_start=True, canonical=True
-)
-
 # eas_disabled_enabled
-yaml_string = yaml.safe_load(
+registry["eas_disabled_enabled"] = (
     """
     data:
     - [DIMM:1, ENABLED]
@@ -80,7 +74,3 @@ yaml_string = yaml.safe_load(
     - [ESS:301, ENABLED]
     """
 )
-
-registry["eas_disabled_enabled"] = yaml.safe_dump(
-    yaml_string, explicit_start=True, canonical=True
-)
@@ -21,26 +21,20 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import yaml
-
 from .config_registry import registry
 
 # Add the State Transition script configurations to the registry.
 
 # watcher_enabled_offline
-yaml_string = yaml.safe_load(
+registry["watcher_enabled_offline"] = (
     """
     data:
     - [Watcher, OFFLINE]
     """
 )
 
-registry["watcher_enabled_offline"] = yaml.safe_dump(
-    yaml_string, explicit_start=True, canonical=True
-)
-
 # sched_ocps_enabled_offline
-yaml_string = yaml.safe_load(
+registry["sched_ocps_enabled_offline"] = (
     """
     data:
     - [Scheduler:1, OFFLINE]
@@ -50,12 +44,8 @@ yaml_string = yaml.safe_load(
     """
 )
 
-registry["sched_ocps_enabled_offline"] = yaml.safe_dump(
-    yaml_string, explicit_start=True, canonical=True
-)
-
 # eas_enabled_offline
-yaml_string = yaml.safe_load(
+registry["eas_enabled_offline"] = (
     """
     data:
     - [DREAM, OFFLINE]
@@ -72,9 +62,9 @@ yaml_string = yaml.safe_load(
     - [ESS:108, OFFLINE]
     - [ESS:109, OFFLINE]
     - [ESS:110, OFFLINE]
-    - [ESS:111 OFFLINE]
-    - [ESS:112 OFFLINE]
-    - [ESS:113 OFFLINE]
+    - [ESS:111, OFFLINE]
+    - [ESS:112, OFFLINE]
+    - [ESS:113, OFFLINE]
     - [ESS:201, OFFLINE]
     - [ESS:202, OFFLINE]
     - [ESS:203, OFFLINE]
@@ -85,12 +75,8 @@ yaml_string = yaml.safe_load(
     """
 )
 
-registry["eas_enabled_offline"] = yaml.safe_dump(
-    yaml_string, explicit_start=True, canonical=True
-)
-
 # authorize_test42_sq_enabled_offline
-yaml_string = yaml.safe_load(
+registry["sq_enabled_offline"] = (
     """
     data:
     - [Test:42, OFFLINE]
@@ -100,12 +86,8 @@ yaml_string = yaml.safe_load(
     """
 )
 
-registry["sq_enabled_offline"] = yaml.safe_dump(
-    yaml_string, explicit_start=True, canonical=True
-)
-
 # MTCS enabled_offline
-yaml_string = yaml.safe_load(
+registry["mtcs_enabled_offline"] = (
     """
     ignore:
         - mtptg
@@ -113,12 +95,8 @@ yaml_string = yaml.safe_load(
     """
 )
 
-registry["mtcs_enabled_offline"] = yaml.safe_dump(
-    yaml_string, explicit_start=True, canonical=True
-)
-
 # MainTel enabled_offline
-yaml_string = yaml.safe_load(
+registry["maintel_enabled_offline"] = (
     """
     data:
     - [MTAirCompressor:1, OFFLINE]
@@ -127,12 +105,8 @@ yaml_string = yaml.safe_load(
     """
 )
 
-registry["maintel_enabled_offline"] = yaml.safe_dump(
-    yaml_string, explicit_start=True, canonical=True
-)
-
 # GenCam enabled_offline
-yaml_string = yaml.safe_load(
+registry["gencam_enabled_offline"] = (
     """
     data:
     - [GenericCamera:1, OFFLINE]
@@ -140,18 +114,10 @@ yaml_string = yaml.safe_load(
     """
 )
 
-registry["gencam_enabled_offline"] = yaml.safe_dump(
-    yaml_string, explicit_start=True, canonical=True
-)
-
 # ATBuilding
-yaml_string = yaml.safe_load(
+registry["atbuilding_enabled_offline"] = (
     """
     data:
     - [ATBuilding, OFFLINE]
     """
 )
-
-registry["atbuilding_enabled_offline"] = yaml.safe_dump(
-    yaml_string, explicit_start=True, canonical=True
-)
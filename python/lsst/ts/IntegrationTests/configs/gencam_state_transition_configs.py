@@ -21,14 +21,12 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import yaml
-
 from .config_registry import registry
 
 # Add the State Transition script configurations to the registry.
 
 # gencam_standby_disabled
-yaml_string = yaml.safe_load(
+registry["gencam_standby_disabled"] = (
     """
     data:
     - [GenericCamera:1, DISABLED]
@@ -36,19 +34,11 @@ yaml_string = yaml.safe_load(
     """
 )
 
-registry["gencam_standby_disabled"] = yaml.safe_dump(
-    yaml_string, explicit_start=True, canonical=True
-)
-
 # gencam_disabled_enabled
-yaml_string = yaml.safe_load(
+registry["gencam_disabled_enabled"] = (
     """
     data:
     - [GenericCamera:1, ENABLED]
     - [GCHeaderService:1, ENABLED]
     """
 )
-
-registry["gencam_disabled_enabled"] = yaml.safe_dump(
-    yaml_string, explicit_start=True, canonical=True
-)
@@ -21,47 +21,41 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import yaml
-
 from .config_registry import registry
 
 # Add the LOVE Stress Test script
 # configurations to the registry.
 
-registry["love_stress"] = yaml.safe_dump(
-    {
-        "location": "replace_me",
-        "number_of_clients": 50,
-        "number_of_messages": 5000,
-        "data": [
-            "ATAOS:0",
-            "ATCamera:0",
-            "ATDome:0",
-            "ATDomeTrajectory:0",
-            "ATMCS:0",
-            "ATHexapod:0",
-            "ATPneumatics:0",
-            "ATPtg:0",
-            "ATSpectrograph:0",
-            "ESS:301",
-            "LaserTracker:1",
-            "MTAirCompressor:1",
-            "MTAirCompressor:2",
-            "MTMount:0",
-            "MTPtg:0",
-            "MTDome:0",
-            "MTDomeTrajectory:0",
-            "MTAOS:0",
-            "MTHexapod:1",
-            "MTHexapod:2",
-            "MTRotator:0",
-            "MTM1M3:0",
-            "MTM2:0",
-            "Scheduler:1",
-            "Scheduler:2",
-            "Watcher:0",
-        ],
-    },
-    explicit_start=True,
-    canonical=True,
-)
+registry["love_stress"] = {
+    "location": "replace_me",
+    "number_of_clients": 50,
+    "number_of_messages": 5000,
+    "data": [
+        "ATAOS:0",
+        "ATCamera:0",
+        "ATDome:0",
+        "ATDomeTrajectory:0",
+        "ATMCS:0",
+        "ATHexapod:0",
+        "ATPneumatics:0",
+        "ATPtg:0",
+        "ATSpectrograph:0",
+        "ESS:301",
+        "LaserTracker:1",
+        "MTAirCompressor:1",
+        "MTAirCompressor:2",
+        "MTMount:0",
+        "MTPtg:0",
+        "MTDome:0",
+        "MTDomeTrajectory:0",
+        "MTAOS:0",
+        "MTHexapod:1",
+        "MTHexapod:2",
+        "MTRotator:0",
+        "MTM1M3:0",
+        "MTM2:0",
+        "Scheduler:1",
+        "Scheduler:2",
+        "Watcher:0",
+    ],
+}
@@ -21,14 +21,12 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import yaml
-
 from .config_registry import registry
 
 # Add the script configurations to the configuration registry.
 
 # CCCamera Housekeeping configs
-yaml_string = yaml.safe_load(
+registry["cccamera_set_filter"] = (
     """
     component: "CCCamera"
     cmd: "setFilter"
@@ -38,14 +36,8 @@ yaml_string = yaml.safe_load(
     """
 )
 
-registry["cccamera_set_filter"] = yaml.safe_dump(
-    yaml_string,
-    explicit_start=True,
-    canonical=True,
-)
-
 # MTCamera Housekeeping configs
-yaml_string = yaml.safe_load(
+registry["mtcamera_set_filter"] = (
     """
     component: "MTCamera"
     cmd: "setFilter"
@@ -55,28 +47,16 @@ yaml_string = yaml.safe_load(
     """
 )
 
-registry["mtcamera_set_filter"] = yaml.safe_dump(
-    yaml_string,
-    explicit_start=True,
-    canonical=True,
-)
-
 # MTMount Housekeeping configs
-yaml_string = yaml.safe_load(
+registry["mtmount_home_both_axes"] = (
     """
     component: "MTMount"
     cmd: "homeBothAxes"
     """
 )
 
-registry["mtmount_home_both_axes"] = yaml.safe_dump(
-    yaml_string,
-    explicit_start=True,
-    canonical=True,
-)
-
 # MTPtg park
-yaml_string = yaml.safe_load(
+registry["mtptg_park"] = (
     """
     az: 0.0
     el: 80
@@ -85,22 +65,10 @@ yaml_string = yaml.safe_load(
     """
 )
 
-registry["mtptg_park"] = yaml.safe_dump(
-    yaml_string,
-    explicit_start=True,
-    canonical=True,
-)
-
 # MTPtg stop tracking
-yaml_string = yaml.safe_load(
+registry["mtptg_stop_tracking"] = (
     """
     component: "MTPtg"
     cmd: stopTracking
     """
 )
-
-registry["mtptg_stop_tracking"] = yaml.safe_dump(
-    yaml_string,
-    explicit_start=True,
-    canonical=True,
-)
@@ -21,20 +21,13 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import yaml
-
 from .config_registry import registry
 
 # Add the script configurations to the configuration registry.
 
 # lower_m1m3
-yaml_string = yaml.safe_load(
+registry["lower_m1m3"] = (
     """
     test_case: {name: "integration_testing", execution: "integration_testing", version: "v1"}
     """
 )
-registry["lower_m1m3"] = yaml.safe_dump(
-    yaml_string,
-    explicit_start=True,
-    canonical=True,
-)
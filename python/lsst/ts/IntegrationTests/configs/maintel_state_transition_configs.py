@@ -21,14 +21,12 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import yaml
-
 from .config_registry import registry
 
 # Add the State Transition script configurations to the registry.
 
 # maintel_standby_disabled
-yaml_string = yaml.safe_load(
+registry["maintel_standby_disabled"] = (
     """
     data:
     - [LaserTracker:1, DISABLED]
@@ -43,12 +41,8 @@ yaml_string = yaml.safe_load(
     """
 )
 
-registry["maintel_standby_disabled"] = yaml.safe_dump(
-    yaml_string, explicit_start=True, canonical=True
-)
-
 # maintel_camera_standby_disabled
-yaml_string = yaml.safe_load(
+registry["maintel_camera_standby_disabled"] = (
     """
     data:
     - [replace_me_HeaderService, DISABLED]
@@ -56,12 +50,8 @@ yaml_string = yaml.safe_load(
     """
 )
 
-registry["maintel_camera_standby_disabled"] = yaml.safe_dump(
-    yaml_string, explicit_start=True, canonical=True
-)
-
 # maintel_disabled_enabled
-yaml_string = yaml.safe_load(
+registry["maintel_disabled_enabled"] = (
     """
     data:
     - [MTAirCompressor:1, ENABLED]
@@ -77,7 +67,3 @@ yaml_string = yaml.safe_load(
     - [MTAOS, ENABLED]
     """
 )
-
-registry["maintel_disabled_enabled"] = yaml.safe_dump(
-    yaml_string, explicit_start=True, canonical=True
-)
@@ -21,14 +21,12 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import yaml
-
 from .config_registry import registry
 
 # Add the State Transition script configurations to the registry.
 
 # obssys_standby_disabled
-yaml_string = yaml.safe_load(
+registry["obssys_standby_disabled"] = (
     """
     data:
     - [Scheduler:1, DISABLED]
@@ -39,12 +37,8 @@ yaml_string = yaml.safe_load(
     """
 )
 
-registry["obssys_standby_disabled"] = yaml.safe_dump(
-    yaml_string, explicit_start=True, canonical=True
-)
-
 # obssys_disabled_enabled
-yaml_string = yaml.safe_load(
+registry["obssys_disabled_enabled"] = (
     """
     data:
     - [Scheduler:1, ENABLED]
@@ -54,7 +48,3 @@ yaml_string = yaml.safe_load(
     - [Watcher, ENABLED]
     """
 )
-
-registry["obssys_disabled_enabled"] = yaml.safe_dump(
-    yaml_string, explicit_start=True, canonical=True
-)
@@ -21,18 +21,12 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import yaml
-
 from .config_registry import registry
 
 # Add the script configurations to the configuration registry.
 
-registry["enable1"] = yaml.safe_dump(
-    {
-        "athexapod": "ncsa",
-        "atdome": "current",
-        "ataos": "current",
-    },
-    explicit_start=True,
-    canonical=True,
-)
+registry["enable1"] = {
+    "athexapod": "ncsa",
+    "atdome": "current",
+    "ataos": "current",
+}
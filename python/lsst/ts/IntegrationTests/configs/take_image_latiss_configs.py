@@ -21,81 +21,55 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import yaml
-
 from .config_registry import registry
 
 # Add the script configurations to the configuration registry.
 
-registry["auxtel_visit_config1"] = yaml.safe_dump(
-    {
-        "nimages": 1,
-        "exp_times": 5.0,
-        "image_type": "OBJECT",
-        "filter": "SDSSr_65mm",
-        "grating": "ronchi90lpmm",
-        "linear_stage": None,
-    },
-    explicit_start=True,
-    canonical=True,
-)
+registry["auxtel_visit_config1"] = {
+    "nimages": 1,
+    "exp_times": 5.0,
+    "image_type": "OBJECT",
+    "filter": "SDSSr_65mm",
+    "grating": "ronchi90lpmm",
+    "linear_stage": None,
+}
 
-registry["auxtel_visit_config2"] = yaml.safe_dump(
-    {
-        "nimages": 1,
-        "image_type": "OBJECT",
-        "exp_times": 5.0,
-        "filter": "SDSSr_65mm",
-        "grating": "ronchi90lpmm",
-    },
-    explicit_start=True,
-    canonical=True,
-)
+registry["auxtel_visit_config2"] = {
+    "nimages": 1,
+    "image_type": "OBJECT",
+    "exp_times": 5.0,
+    "filter": "SDSSr_65mm",
+    "grating": "ronchi90lpmm",
+}
 
-registry["auxtel_visit_config3"] = yaml.safe_dump(
-    {
-        "nimages": 1,
-        "image_type": "OBJECT",
-        "exp_times": 5.0,
-        "filter": "SDSSr_65mm",
-        "grating": "holo4_003",
-    },
-    explicit_start=True,
-    canonical=True,
-)
+registry["auxtel_visit_config3"] = {
+    "nimages": 1,
+    "image_type": "OBJECT",
+    "exp_times": 5.0,
+    "filter": "SDSSr_65mm",
+    "grating": "holo4_003",
+}
 
-registry["auxtel_visit_config4"] = yaml.safe_dump(
-    {
-        "nimages": 1,
-        "image_type": "OBJECT",
-        "exp_times": 5.0,
-        "filter": "SDSSr_65mm",
-        "grating": "holo4_003",
-    },
-    explicit_start=True,
-    canonical=True,
-)
+registry["auxtel_visit_config4"] = {
+    "nimages": 1,
+    "image_type": "OBJECT",
+    "exp_times": 5.0,
+    "filter": "SDSSr_65mm",
+    "grating": "holo4_003",
+}
 
-registry["auxtel_visit_config5"] = yaml.safe_dump(
-    {
-        "nimages": 1,
-        "image_type": "OBJECT",
-        "exp_times": 5.0,
-        "filter": "SDSSr_65mm",
-        "grating": "empty_1",
-    },
-    explicit_start=True,
-    canonical=True,
-)
+registry["auxtel_visit_config5"] = {
+    "nimages": 1,
+    "image_type": "OBJECT",
+    "exp_times": 5.0,
+    "filter": "SDSSr_65mm",
+    "grating": "empty_1",
+}
 
-registry["auxtel_visit_config6"] = yaml.safe_dump(
-    {
-        "nimages": 1,
-        "image_type": "OBJECT",
-        "exp_times": 5.0,
-        "filter": "SDSSr_65mm",
-        "grating": "empty_1",
-    },
-    explicit_start=True,
-    canonical=True,
-)
+registry["auxtel_visit_config6"] = {
+    "nimages": 1,
+    "image_type": "OBJECT",
+    "exp_times": 5.0,
+    "filter": "SDSSr_65mm",
+    "grating": "empty_1",
+}
@@ -21,19 +21,13 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import yaml
-
 from .config_registry import registry
 
 # Add the script configurations to the configuration registry.
 
-registry["track_target"] = yaml.safe_dump(
-    {
-        "target_name": "replace_me",
-        "track_for": 0,
-        "rot_value": 80.0,
-        "rot_type": "PhysicalSky",
-    },
-    explicit_start=True,
-    canonical=True,
-)
+registry["track_target"] = {
+    "target_name": "replace_me",
+    "track_for": 0,
+    "rot_value": 80.0,
+    "rot_type": "PhysicalSky",
+}
@@ -20,26 +20,81 @@
 #
 # You should have received a copy of the GNU General Public License
 
-__all__ = ["CSCStateTransition", "csc_state_transition"]
+__all__ = ["expand_csc_patterns", "CSCStateTransition", "csc_state_transition"]
 
 import argparse
-import asyncio
+import fnmatch
+from collections.abc import Iterable
 
 import yaml
 from lsst.ts.IntegrationTests import BaseScript, utils
 
 
+def has_wildcard(pattern: str) -> bool:
+    """Return True if the pattern has glob-style wildcards."""
+    return any(char in pattern for char in "*?[")
+
+
+def expand_csc_patterns(patterns: Iterable[str]) -> list[str]:
+    """Expand the glob-style CSC name patterns against utils.cscs.
+
+    Parameters
+    ----------
+    patterns : ``iterable``
+        The CSC[:index] targets. The CSC name may be a pattern,
+        e.g. "AT*" or "AT*:1"; names without wildcards are kept as given.
+
+    Returns
+    -------
+    cscs : `list`
+        The CSC[:index] targets, in the given order, each matching CSC
+        in alphabetical order, without duplicates.
+
+    Raises
+    ------
+    ValueError
+        If a pattern matches no CSC, or the index has wildcards;
+        the indexes of each CSC are not known, so list them explicitly,
+        e.g. "ESS:1 ESS:104".
+    """
+    cscs: list[str] = []
+    for pattern in patterns:
+        name, _, index = pattern.partition(":")
+        if has_wildcard(index):
+            raise ValueError(
+                f"Index patterns are not supported: {pattern}. "
+                f"Only the CSC names are matched, e.g. 'AT*'; "
+                f"give each index of {name}, e.g. {name}:1 {name}:2."
+            )
+        if has_wildcard(name):
+            names = sorted(fnmatch.filter(utils.cscs, name))
+            if not names:
+                raise ValueError(f"{pattern} matches no CSC.")
+        else:
+            names = [name]
+        for match in names:
+            csc = f"{match}:{index}" if index else match
+            if csc not in cscs:
+                cscs.append(csc)
+    return cscs
+
+
 class CSCStateTransition(BaseScript):
-    """Execute the set_summary_state script for the given CSC,
+    """Execute the set_summary_state script for the given CSCs,
     with any additional configuration parameters,
     placed in the given ScriptQueue location.
 
+    All the CSCs are transitioned by one set_summary_state script,
+    with one row of its data configuration per CSC.
+
     Attributes
     ----------
-    csc : `str`
-        The name of the CSC to transition. Case-sensitive.
-    csc_index : `int`
-        The index value for the indexed-CSC.
+    csc : `str` or ``iterable``
+        The CSC[:index] to transition, or several of them. Case-sensitive.
+        The CSC names, but not the indexes, may be glob-style patterns;
+        see expand_csc_patterns().
+    cscs : `list`
+        The CSC[:index] targets, with the patterns expanded.
     state : `str`
         The state to transition.
     sq_index : `int`
@@ -49,6 +104,10 @@ class CSCStateTransition(BaseScript):
     mute_alarms : `bool`
         The set_summary_state accepts a boolean argument to command the Watcher
         to mute alarms. This is necessary when moving a CSC to Offline.
+    queue_placement : `str`
+        The ScriptQueue location of the script; "FIRST" or "LAST".
+    inject : `bool`
+        Add the script to the running ScriptQueue, without pausing it.
     """
 
     configs: tuple = ()
@@ -58,34 +117,38 @@ class CSCStateTransition(BaseScript):
 
     def __init__(
         self,
-        csc: str,
+        csc: str | Iterable[str],
         state: str,
         sq_index: int,
         additional_configuration: str = "",
         mute_alarms: bool = False,
+        queue_placement: str = "LAST",
+        inject: bool = False,
     ) -> None:
-        super().__init__()
+        super().__init__(queue_placement=queue_placement, inject=inject)
         self.csc = csc
         self.state = state
         self.index = sq_index
         self.added_config = additional_configuration
         self.mute_alarms = mute_alarms
-        # Construct the intermediate configuration list.
-        # Convert the list to a string.
-        temp_config = [self.csc, self.state]
-        if self.added_config:
-            temp_config.append(self.added_config)
-        config = ", ".join(str(i) for i in temp_config)
+        self.cscs = expand_csc_patterns([csc] if isinstance(csc, str) else csc)
+        if not self.cscs:
+            raise ValueError("No CSC to transition.")
+        # Construct the intermediate configuration list of each CSC.
+        # Convert each list to a string.
+        rows = []
+        for target in self.cscs:
+            temp_config = [target, self.state]
+            if self.added_config:
+                temp_config.append(self.added_config)
+            rows.append(", ".join(str(i) for i in temp_config))
         # Construct the full configuration needed for the
         # set_summary_state.py script.
         # Convert it to a properly formatted YAML document.
-        yaml_string = yaml.safe_load(
-            f"""
-            data:
-            - [{config}]
-            mute_alarms: {self.mute_alarms}
-            """
-        )
+        config_lines = ["data:"]
+        config_lines += [f"- [{row}]" for row in rows]
+        config_lines.append(f"mute_alarms: {self.mute_alarms}")
+        yaml_string = yaml.safe_load("\n".join(config_lines))
         self.configs = (
             yaml.safe_dump(yaml_string, explicit_start=True, canonical=True),
         )
@@ -100,8 +163,13 @@ def csc_state_transition() -> None:
     parser.add_argument(
         "csc",
         metavar="csc[:index]",
+        nargs="+",
         type=str,
-        help="Specify which CSC[:index] to command (case sensitive).",
+        help="Specify which CSC[:index] to command (case sensitive). "
+        "Give several to transition them in one script. The CSC names, but "
+        "not the indexes, may be glob-style patterns, e.g. 'AT*' or 'AT*:1' "
+        "(quote them from the shell); give each index of an indexed CSC, "
+        "e.g. ESS:1 ESS:104.",
     )
     parser.add_argument(
         "state",
@@ -130,6 +198,20 @@ def csc_state_transition() -> None:
         action="store_true",
         help="Tell the Watcher to mute alarms. Include if setting CSC to Offline.",
     )
+    parser.add_argument(
+        "-q",
+        "--queue_placement",
+        type=str.upper,
+        choices=["FIRST", "LAST"],
+        default="LAST",
+        help="Specify where to place the script in the ScriptQueue.",
+    )
+    parser.add_argument(
+        "--inject",
+        action="store_true",
+        help="Add the script without pausing the ScriptQueue. "
+        "Use this on a busy ScriptQueue.",
+    )
     parser.add_argument(
         "-i",
         "--info",
@@ -144,13 +226,22 @@ def csc_state_transition() -> None:
     if not (args.csc or args.state):
         parser.print_help()
         exit()
-    if args.csc.split(":")[0] not in utils.cscs:
-        print(
-            f"Invalid CSC: {args.csc.split(':')[0]}. "
-            f"Perhaps it is misspelled or not properly capitalized."
-        )
-        parser.print_help()
-        exit()
+    for csc in args.csc:
+        name, _, index = csc.partition(":")
+        if has_wildcard(index):
+            print(
+                f"Invalid CSC: {csc}. Only the CSC names may be patterns; "
+                f"give each index, e.g. {name}:1 {name}:2."
+            )
+            parser.print_help()
+            exit()
+        if not has_wildcard(name) and name not in utils.cscs:
+            print(
+                f"Invalid CSC: {name}. "
+                f"Perhaps it is misspelled or not properly capitalized."
+            )
+            parser.print_help()
+            exit()
     main(args)
 
 
@@ -164,15 +255,17 @@ def main(opts: argparse.Namespace) -> None:
             state=opts.state,
             sq_index=opts.sq_index,
             additional_configuration=opts.additional_configuration,
+            queue_placement=opts.queue_placement,
+            inject=opts.inject,
         )
-    except KeyError as ke:
-        print(repr(ke))
+    except (KeyError, ValueError) as e:
+        print(repr(e))
     else:
         print(
-            f"\nTransitioning the {opts.csc.upper()} "
+            f"\nTransitioning the {', '.join(script_class.cscs).upper()} "
             f"to the {opts.state} state."
             f"\nRunning on ScriptQueue {opts.sq_index}."
             f"\nConfiguration: {script_class.configs}."
             f"\nMute Alarms: {script_class.mute_alarms}."
         )
-        asyncio.run(script_class.run())
+        script_class.execute()
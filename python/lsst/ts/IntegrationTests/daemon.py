@@ -0,0 +1,277 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# This file is part of ts_IntegrationTests.
+#
+# Developed for the Vera C. Rubin Observatory Telescope & Site Software system.
+# This product includes software developed by the Vera C. Rubin Observatory
+# Project (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+__all__ = ["IntegrationTestsDaemon", "run_daemon"]
+
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import logging
+import os
+import time
+from collections.abc import Iterable
+
+from .base_script import BaseScript
+from .daemon_client import get_socket_path
+from .dispatcher import collect_scripts, redirect_output
+from .orchestrator import OrchestratorReport, run_script
+from .script_log import PACKAGE_LOGGER_NAME, ensure_logging_configured
+from .script_queue_session import ScriptQueueSession
+
+
+class IntegrationTestsDaemon:
+    """Run integration test commands sent over a local Unix socket,
+    keeping the salobj Domain and ScriptQueue Remotes warm between them.
+
+    Parameters
+    ----------
+    socket_path : `str` or `None`
+        The Unix socket to listen on. If None, use get_socket_path().
+    indexes : ``iterable``
+        The indexes of the ScriptQueues whose Remotes are created,
+        and heartbeats awaited, when the daemon starts.
+
+    Notes
+    -----
+    Each connection sends one invocation, as a JSON object on one line::
+
+        {"invocation": ["run_command", "2", "ATAOS", "resetOffset"]}
+
+    and receives the outcome, once its scripts finish; see
+    daemon_client.send_request(). Invocations for different ScriptQueues
+    run concurrently; those for the same ScriptQueue run in turn.
+    """
+
+    def __init__(
+        self, socket_path: str | None = None, indexes: Iterable[int] = (1, 2, 3)
+    ) -> None:
+        self.socket_path: str = socket_path or get_socket_path()
+        self.indexes: tuple[int, ...] = tuple(indexes)
+        self.session: ScriptQueueSession = ScriptQueueSession()
+        self.server: asyncio.AbstractServer | None = None
+        # The entry points patch sys.argv, so collect one command at a time.
+        self.collect_lock: asyncio.Lock = asyncio.Lock()
+        self.log: logging.Logger = logging.getLogger(
+            f"{PACKAGE_LOGGER_NAME}.{type(self).__name__}"
+        )
+
+    async def start(self) -> None:
+        """Create the ScriptQueue Remotes and listen on the socket.
+
+        Raises
+        ------
+        RuntimeError
+            If another daemon is listening on the socket.
+        """
+        ensure_logging_configured()
+        await self.remove_stale_socket()
+        results = await asyncio.gather(
+            *[self.session.get_remote(index) for index in self.indexes],
+            return_exceptions=True,
+        )
+        for index, result in zip(self.indexes, results):
+            if isinstance(result, Exception):
+                # The Remote is created, or the heartbeat awaited,
+                # again on first use.
+                self.log.warning("ScriptQueue %s is not running: %r", index, result)
+        self.server = await asyncio.start_unix_server(
+            self.handle_connection, path=self.socket_path
+        )
+        # Only the user running the daemon may send it commands.
+        os.chmod(self.socket_path, 0o600)
+        self.log.info("Listening on %s", self.socket_path)
+
+    async def remove_stale_socket(self) -> None:
+        """Remove the socket left by a daemon that did not exit cleanly.
+
+        Raises
+        ------
+        RuntimeError
+            If another daemon is listening on the socket.
+        """
+        try:
+            _, writer = await asyncio.open_unix_connection(self.socket_path)
+        except FileNotFoundError:
+            return
+        except ConnectionRefusedError:
+            self.log.info("Removing the stale socket %s", self.socket_path)
+            os.remove(self.socket_path)
+            return
+        writer.close()
+        with contextlib.suppress(ConnectionError):
+            await writer.wait_closed()
+        raise RuntimeError(f"A daemon is already listening on {self.socket_path}.")
+
+    async def serve_forever(self) -> None:
+        """Start the daemon and serve requests until cancelled."""
+        try:
+            await self.start()
+            await self.server.serve_forever()
+        finally:
+            await self.close()
+
+    async def handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Read one request, run it and write the response.
+
+        Parameters
+        ----------
+        reader : `asyncio.StreamReader`
+            The connection reader.
+        writer : `asyncio.StreamWriter`
+            The connection writer.
+        """
+        try:
+            try:
+                line = await reader.readline()
+                invocation = json.loads(line)["invocation"]
+                if not (
+                    invocation
+                    and isinstance(invocation, list)
+                    and all(isinstance(arg, str) for arg in invocation)
+                ):
+                    raise ValueError("invocation must be a non-empty list of str.")
+            except (
+                asyncio.LimitOverrunError,
+                KeyError,
+                TypeError,
+                ValueError,
+            ) as e:
+                # The request is too long, not JSON or not an invocation.
+                response = dict(output="", report="", succeeded=False, error=repr(e))
+            else:
+                response = await self.handle_invocation(invocation)
+            writer.write((json.dumps(response) + "\n").encode())
+            await writer.drain()
+        except ConnectionError as e:
+            self.log.warning("Lost the client connection: %r", e)
+        finally:
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+    async def handle_invocation(self, invocation: list[str]) -> dict:
+        """Run the given invocation and return the response.
+
+        Parameters
+        ----------
+        invocation : `list`
+            The command and its arguments.
+
+        Returns
+        -------
+        response : `dict`
+            The response; see daemon_client.send_request().
+        """
+        self.log.info("Running %s", invocation)
+        output = io.StringIO()
+        error = None
+        scripts: list[BaseScript] = []
+        report = OrchestratorReport()
+        # Capture what this request prints, and only this request.
+        with redirect_output(output):
+            async with self.collect_lock:
+                # Invoke the entry point in a thread, so the commands running
+                # their own event loop, e.g. run_campaign, still work.
+                try:
+                    scripts = await asyncio.to_thread(collect_scripts, invocation)
+                except SystemExit as e:
+                    if e.code:
+                        error = repr(e)
+                except Exception as e:
+                    error = repr(e)
+            start_time = time.monotonic()
+            for script in scripts:
+                report.runs.append(await run_script(script, self.session))
+            report.duration = time.monotonic() - start_time
+        return dict(
+            output=output.getvalue(),
+            report=report.format() if report.runs else "",
+            succeeded=error is None and report.succeeded,
+            error=error,
+        )
+
+    async def close(self) -> None:
+        """Stop listening, and close the Remotes and the Domain."""
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+            self.server = None
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(self.socket_path)
+        await self.session.close()
+
+
+def run_daemon() -> None:
+    # Define the script arguments.
+    parser = argparse.ArgumentParser(
+        prog="integration_tests_daemon",
+        description="Serve integration test commands sent by "
+        "integration_tests_client.",
+    )
+    parser.add_argument(
+        "-s",
+        "--socket",
+        type=str,
+        default=None,
+        help="Specify the socket to listen on; "
+        "defaults to $TS_INTEGRATION_TESTS_SOCKET.",
+    )
+    parser.add_argument(
+        "-q",
+        "--queues",
+        metavar="sq_index",
+        nargs="+",
+        type=int,
+        choices=[1, 2, 3],
+        default=[1, 2, 3],
+        help="Specify which ScriptQueues to connect to on startup.",
+    )
+    parser.add_argument(
+        "-i",
+        "--info",
+        action="store_true",
+        help="Print the allowed options.",
+    )
+    args = parser.parse_args()
+    if args.info:
+        parser.print_help()
+        exit()
+    main(args)
+
+
+def main(opts: argparse.Namespace) -> None:
+    # Serve requests until interrupted.
+    # Exit with an error if another daemon is listening on the socket.
+    daemon = IntegrationTestsDaemon(socket_path=opts.socket, indexes=opts.queues)
+    print(f"\nStarting the integration_tests_daemon on {daemon.socket_path}.")
+    try:
+        asyncio.run(daemon.serve_forever())
+    except KeyboardInterrupt:
+        print("\nStopped the integration_tests_daemon.")
+    except RuntimeError as e:
+        print(repr(e))
+        exit(1)
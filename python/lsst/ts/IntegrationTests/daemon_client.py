@@ -0,0 +1,165 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# This file is part of ts_IntegrationTests.
+#
+# Developed for the Vera C. Rubin Observatory Telescope & Site Software system.
+# This product includes software developed by the Vera C. Rubin Observatory
+# Project (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+__all__ = [
+    "get_socket_path",
+    "send_request",
+    "run_client",
+]
+
+import argparse
+import json
+import os
+import socket
+import tempfile
+
+# The maximum time, in seconds, to wait for the daemon to answer.
+# A request returns when its scripts finish, so allow a long night step.
+CLIENT_TIMEOUT = 3600
+
+
+def get_socket_path() -> str:
+    """Get the path of the daemon Unix socket.
+
+    Returns
+    -------
+    path : `str`
+        The TS_INTEGRATION_TESTS_SOCKET environment variable, if set;
+        otherwise integration_tests_<uid>.sock in the temporary directory.
+    """
+    return os.environ.get("TS_INTEGRATION_TESTS_SOCKET") or os.path.join(
+        tempfile.gettempdir(), f"integration_tests_{os.getuid()}.sock"
+    )
+
+
+def send_request(
+    invocation: list[str],
+    socket_path: str | None = None,
+    timeout: float = CLIENT_TIMEOUT,
+) -> dict:
+    """Send an invocation to the integration_tests daemon and wait for
+    its outcome.
+
+    Parameters
+    ----------
+    invocation : `list`
+        The command and its arguments, e.g.
+        ``["run_command", "2", "ATAOS", "resetOffset", "-p", "axis:all"]``.
+    socket_path : `str` or `None`
+        The daemon socket. If None, use get_socket_path().
+    timeout : `float`
+        The maximum time, in seconds, to wait for the outcome.
+
+    Returns
+    -------
+    response : `dict`
+        The daemon response, with the keys:
+
+        * output: the text printed by the command.
+        * report: the formatted outcome of the scripts run.
+        * succeeded: True if the command and its scripts succeeded.
+        * error: the exception raised by the command, or None.
+
+    Raises
+    ------
+    OSError
+        If the daemon is not running.
+
+    Notes
+    -----
+    The protocol is one JSON object per line: the client sends
+    ``{"invocation": [...]}`` and the daemon answers with the response,
+    then closes the connection.
+    """
+    request = json.dumps(dict(invocation=list(invocation))) + "\n"
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.settimeout(timeout)
+        client.connect(socket_path or get_socket_path())
+        client.sendall(request.encode())
+        with client.makefile("r") as response_file:
+            line = response_file.readline()
+    if not line:
+        raise ConnectionError("The daemon closed the connection without answering.")
+    return json.loads(line)
+
+
+def run_client() -> None:
+    # Define the script arguments.
+    parser = argparse.ArgumentParser(
+        prog="integration_tests_client",
+        description="Run an integration test command on the "
+        "integration_tests_daemon.",
+    )
+    parser.add_argument(
+        "command",
+        metavar="command",
+        nargs="?",
+        type=str,
+        help="Specify the command to run, e.g. run_command.",
+    )
+    parser.add_argument(
+        "arguments",
+        metavar="arguments",
+        nargs=argparse.REMAINDER,
+        help="Specify the arguments of the command.",
+    )
+    parser.add_argument(
+        "-s",
+        "--socket",
+        type=str,
+        default=None,
+        help="Specify the daemon socket; " "defaults to $TS_INTEGRATION_TESTS_SOCKET.",
+    )
+    parser.add_argument(
+        "-i",
+        "--info",
+        action="store_true",
+        help="Print the allowed options.",
+    )
+    args = parser.parse_args()
+    # Print the help if the command is not defined.
+    if args.info or not args.command:
+        parser.print_help()
+        exit()
+    main(args)
+
+
+def main(opts: argparse.Namespace) -> None:
+    # Send the invocation to the daemon.
+    # If the daemon is not running, print the error.
+    # Otherwise, print the outcome and exit with an error if it failed.
+    try:
+        response = send_request(
+            [opts.command, *opts.arguments], socket_path=opts.socket
+        )
+    except OSError as e:
+        print(f"Cannot reach the integration_tests_daemon: {e!r}")
+        exit(1)
+    if response["output"]:
+        print(response["output"], end="")
+    if response["report"]:
+        print(response["report"])
+    if response["error"] is not None:
+        print(response["error"])
+    if not response["succeeded"]:
+        exit(1)
@@ -0,0 +1,415 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# This file is part of ts_IntegrationTests.
+#
+# Developed for the Vera C. Rubin Observatory Telescope & Site Software system.
+# This product includes software developed by the Vera C. Rubin Observatory
+# Project (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+__all__ = [
+    "commands",
+    "get_entry_point",
+    "read_batch_file",
+    "redirect_output",
+    "collect_scripts",
+    "run_invocations",
+    "run_integration_tests",
+]
+
+import argparse
+import asyncio
+import contextlib
+import contextvars
+import importlib
+import shlex
+import sys
+import time
+from collections.abc import Callable, Iterator
+from typing import Any, TextIO
+
+from . import base_script
+from .base_script import BaseScript
+from .orchestrator import OrchestratorReport, ScriptRunReport, run_script
+from .script_queue_session import ScriptQueueSession
+
+# The entry points of the integration_tests subcommands, as
+# (module, function), keyed by command. They match [project.scripts];
+# test_dispatcher checks they stay in sync.
+commands: dict[str, tuple[str, str]] = {
+    "auxtel_daytime_atpneumatics": (
+        "auxtel_daytime_atpneumatics",
+        "run_atpneumatics_checkout",
+    ),
+    "auxtel_daytime_latiss": ("auxtel_daytime_latiss", "run_auxtel_latiss_checkout"),
+    "auxtel_daytime_slew_and_take_image": (
+        "auxtel_daytime_slew_and_take_image",
+        "run_auxtel_slew_and_take_image_checkout",
+    ),
+    "auxtel_daytime_telescope_and_dome": (
+        "auxtel_daytime_telescope_and_dome",
+        "run_auxtel_telescope_and_dome_checkout",
+    ),
+    "auxtel_disabled_enabled": (
+        "auxtel_disabled_enabled",
+        "run_auxtel_disabled_enabled",
+    ),
+    "auxtel_enable_atcs": ("auxtel_enable_atcs", "run_auxtel_enable_atcs"),
+    "auxtel_housekeeping": ("auxtel_housekeeping", "run_auxtel_housekeeping"),
+    "auxtel_image_taking": ("image_taking_verification", "run_auxtel_image_taking"),
+    "auxtel_latiss_acquire": ("auxtel_latiss_acquire", "run_auxtel_latiss_acquire"),
+    "auxtel_latiss_calibrations": (
+        "auxtel_latiss_calibrations",
+        "run_auxtel_latiss_calibrations",
+    ),
+    "auxtel_latiss_take_sequence": (
+        "auxtel_latiss_take_sequence",
+        "run_auxtel_latiss_take_sequence",
+    ),
+    "auxtel_latiss_wep_align": (
+        "auxtel_latiss_wep_align",
+        "run_auxtel_latiss_wep_align",
+    ),
+    "auxtel_offline_standby": ("auxtel_offline_standby", "run_auxtel_offline_standby"),
+    "auxtel_point_azel": ("auxtel_point_azel", "run_auxtel_point_azel"),
+    "auxtel_prepare_for_flat": (
+        "auxtel_prepare_for_flat",
+        "run_auxtel_prepare_for_flat",
+    ),
+    "auxtel_prepare_for_onsky": (
+        "auxtel_prepare_for_onsky",
+        "run_auxtel_prepare_for_onsky",
+    ),
+    "auxtel_reset_offsets": ("auxtel_reset_offsets", "run_auxtel_reset_offsets"),
+    "auxtel_shutdown": ("auxtel_shutdown", "run_auxtel_shutdown"),
+    "auxtel_standby_disabled": (
+        "auxtel_standby_disabled",
+        "run_auxtel_standby_disabled",
+    ),
+    "auxtel_stop": ("auxtel_stop", "run_auxtel_stop"),
+    "auxtel_track_target": ("auxtel_track_target", "run_auxtel_track_target"),
+    "auxtel_visit": ("auxtel_visit", "run_auxtel_visit"),
+    "comcam_calibrations": ("comcam_calibrations", "run_comcam_calibrations"),
+    "comcam_housekeeping": ("maintel_housekeeping", "run_comcam_housekeeping"),
+    "comcam_image_taking": ("image_taking_verification", "run_comcam_image_taking"),
+    "csc_state_transition": ("csc_state_transition", "csc_state_transition"),
+    "eas_disabled_enabled": ("eas_disabled_enabled", "run_eas_disabled_enabled"),
+    "eas_standby_disabled": ("eas_standby_disabled", "run_eas_standby_disabled"),
+    "enabled_offline": ("enabled_offline", "run_enabled_offline"),
+    "gencam_disabled_enabled": (
+        "gencam_disabled_enabled",
+        "run_gencam_disabled_enabled",
+    ),
+    "gencam_standby_disabled": (
+        "gencam_standby_disabled",
+        "run_gencam_standby_disabled",
+    ),
+    "load_camera_playlist": ("load_camera_playlist", "load_camera_playlist"),
+    "love_stress_test": ("love_stress_test", "run_love_stress_test"),
+    "lsstcam_calibrations": ("lsstcam_calibrations", "run_lsstcam_calibrations"),
+    "lsstcam_housekeeping": ("maintel_housekeeping", "run_lsstcam_housekeeping"),
+    "lsstcam_image_taking": ("image_taking_verification", "run_lsstcam_image_taking"),
+    "maintel_csc_end_of_night": (
+        "maintel_csc_end_of_night",
+        "maintel_csc_end_of_night",
+    ),
+    "maintel_disabled_enabled": (
+        "maintel_disabled_enabled",
+        "run_maintel_disabled_enabled",
+    ),
+    "maintel_housekeeping": ("maintel_housekeeping", "run_maintel_housekeeping"),
+    "maintel_lower_m1m3": ("maintel_lower_m1m3", "maintel_lower_m1m3"),
+    "maintel_move_rotator": ("maintel_move_rotator", "maintel_move_rotator"),
+    "maintel_open_mirror_covers": (
+        "maintel_open_mirror_covers",
+        "maintel_open_mirror_covers",
+    ),
+    "maintel_point_azel": ("maintel_point_azel", "run_maintel_point_azel"),
+    "maintel_slew_dome": ("maintel_slew_dome", "maintel_slew_dome"),
+    "maintel_standby_disabled": (
+        "maintel_standby_disabled",
+        "run_maintel_standby_disabled",
+    ),
+    "obssys_disabled_enabled": (
+        "obssys_disabled_enabled",
+        "run_obssys_disabled_enabled",
+    ),
+    "obssys_standby_disabled": (
+        "obssys_standby_disabled",
+        "run_obssys_standby_disabled",
+    ),
+    "parallel_checkout": ("orchestrator", "run_parallel_checkout"),
+    "query_results": ("results_db", "query_results"),
+    "run_campaign": ("campaign", "run_campaign_file"),
+    "run_command": ("run_command", "run_command"),
+    "validate_configs": ("config_validation", "run_validate_configs"),
+}
+
+
+def get_entry_point(command: str) -> Callable[[], None]:
+    """Get the entry point function of the given command.
+
+    Parameters
+    ----------
+    command : `str`
+        The command, e.g. auxtel_housekeeping.
+
+    Raises
+    ------
+    KeyError
+        If the command is not known.
+    """
+    if command not in commands:
+        raise KeyError(f"{command} is not an integration_tests command.")
+    module_name, function_name = commands[command]
+    module = importlib.import_module(f"{__package__}.{module_name}")
+    return getattr(module, function_name)
+
+
+# The stream the current context prints to instead of sys.stdout, if any;
+# see redirect_output.
+_output: contextvars.ContextVar[TextIO | None] = contextvars.ContextVar(
+    "output", default=None
+)
+
+
+class _ContextStdout:
+    """Standard output, printing to the stream redirected to in the
+    current context, if any.
+
+    Parameters
+    ----------
+    stdout : ``TextIO``
+        The standard output of the other contexts.
+    """
+
+    def __init__(self, stdout: TextIO) -> None:
+        self.stdout = stdout
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(_output.get() or self.stdout, name)
+
+
+@contextlib.contextmanager
+def redirect_output(output: TextIO) -> Iterator[None]:
+    """Redirect what the current context prints to the given stream.
+
+    Unlike contextlib.redirect_stdout, only the current context, e.g. the
+    task running a daemon request, and the threads started from it with
+    asyncio.to_thread, print to the stream; other contexts still print to
+    sys.stdout.
+
+    Parameters
+    ----------
+    output : ``TextIO``
+        The stream to print to.
+    """
+    if not isinstance(sys.stdout, _ContextStdout):
+        sys.stdout = _ContextStdout(sys.stdout)
+    token = _output.set(output)
+    try:
+        yield
+    finally:
+        _output.reset(token)
+
+
+def read_batch_file(path: str) -> list[list[str]]:
+    """Read the invocations of a batch file.
+
+    Parameters
+    ----------
+    path : `str`
+        The batch file. Each line is an invocation, as typed in a shell,
+        e.g. ``run_command 1 ATAOS resetOffset -p axis:all``.
+        Blank lines and ``#`` comments are ignored.
+
+    Returns
+    -------
+    invocations : `list`
+        The command and arguments of each invocation.
+
+    Raises
+    ------
+    KeyError
+        If a command is not known.
+    """
+    invocations = []
+    with open(path) as batch_file:
+        for line in batch_file:
+            invocation = shlex.split(line, comments=True)
+            if not invocation:
+                continue
+            if invocation[0] not in commands:
+                raise KeyError(f"{invocation[0]} is not an integration_tests command.")
+            invocations.append(invocation)
+    return invocations
+
+
+def collect_scripts(invocation: list[str]) -> list[BaseScript]:
+    """Invoke the entry point of a command, collecting the BaseScripts it
+    would run rather than running them.
+
+    Parameters
+    ----------
+    invocation : `list`
+        The command and its arguments.
+
+    Returns
+    -------
+    scripts : `list`
+        The BaseScripts to run. Commands that are not BaseScripts, e.g.
+        query_results, run when invoked and return no scripts.
+
+    Raises
+    ------
+    KeyError
+        If the command is not known.
+    SystemExit
+        If the entry point exits, e.g. to print its help.
+    """
+    entry_point = get_entry_point(invocation[0])
+    scripts: list[BaseScript] = []
+    argv = sys.argv
+    sys.argv = list(invocation)
+    base_script.script_collector = scripts
+    try:
+        entry_point()
+    finally:
+        base_script.script_collector = None
+        sys.argv = argv
+    return scripts
+
+
+def run_invocations(invocations: list[list[str]]) -> OrchestratorReport:
+    """Run the invocations in turn, in one event loop and salobj Domain.
+
+    Parameters
+    ----------
+    invocations : `list`
+        The command and arguments of each invocation.
+
+    Returns
+    -------
+    report : `OrchestratorReport`
+        The outcome of each BaseScript run, in order. An invocation that
+        fails before running a script, e.g. with invalid arguments or an
+        exception from its entry point, is reported as a run with an error.
+
+    Notes
+    -----
+    The entry points are invoked outside the event loop, so the commands
+    running their own event loop, e.g. run_campaign, still work; they do
+    not share the Domain.
+    """
+    report = OrchestratorReport()
+    loop = asyncio.new_event_loop()
+    session = ScriptQueueSession()
+    start_time = time.monotonic()
+    try:
+        for invocation in invocations:
+            # Report an invocation failing before running its scripts,
+            # e.g. with invalid arguments, and go on with the next one.
+            error = None
+            try:
+                scripts = collect_scripts(invocation)
+            except SystemExit as e:
+                if e.code:
+                    error = repr(e)
+                scripts = []
+            except Exception as e:
+                error = repr(e)
+                scripts = []
+            if error is not None:
+                report.runs.append(
+                    ScriptRunReport(
+                        name=shlex.join(invocation),
+                        index=0,
+                        num_scripts=0,
+                        error=error,
+                    )
+                )
+            for script in scripts:
+                report.runs.append(loop.run_until_complete(run_script(script, session)))
+    finally:
+        loop.run_until_complete(session.close())
+        loop.close()
+    report.duration = time.monotonic() - start_time
+    return report
+
+
+def run_integration_tests() -> None:
+    # Define the script arguments.
+    parser = argparse.ArgumentParser(
+        prog="integration_tests",
+        description="Run any integration test command, or a batch of them, "
+        "in one process.",
+    )
+    parser.add_argument(
+        "command",
+        metavar="command",
+        nargs="?",
+        type=str,
+        help=f"Specify the command to run; one of {', '.join(sorted(commands))}.",
+    )
+    parser.add_argument(
+        "arguments",
+        metavar="arguments",
+        nargs=argparse.REMAINDER,
+        help="Specify the arguments of the command.",
+    )
+    parser.add_argument(
+        "-b",
+        "--batch",
+        metavar="batch_file",
+        type=str,
+        help="Specify a file of invocations to run, one per line, "
+        "e.g. 'run_command 1 ATAOS resetOffset -p axis:all'.",
+    )
+    parser.add_argument(
+        "-i",
+        "--info",
+        action="store_true",
+        help="Print the allowed options.",
+    )
+    args = parser.parse_args()
+    # Print the help if neither a command nor a batch file is defined.
+    if args.info or not (args.command or args.batch):
+        parser.print_help()
+        exit()
+    main(args)
+
+
+def main(opts: argparse.Namespace) -> None:
+    # Ensure the invocations are correct.
+    # If not, raise KeyError, or OSError if the batch file is not readable.
+    # Exit with an error if they are not correct, or if any run failed.
+    try:
+        invocations = []
+        if opts.command:
+            get_entry_point(opts.command)
+            invocations.append([opts.command, *opts.arguments])
+        if opts.batch:
+            invocations += read_batch_file(opts.batch)
+    except (KeyError, OSError) as e:
+        print(repr(e))
+        exit(1)
+    else:
+        report = run_invocations(invocations)
+        if opts.batch:
+            print(report.format())
+        if not report.succeeded:
+            exit(1)
@@ -22,7 +22,6 @@
 
 __all__ = ["EnabledOffline", "run_enabled_offline"]
 
-import asyncio
 
 from lsst.ts.IntegrationTests import BaseScript
 
@@ -83,4 +82,4 @@ def run_enabled_offline() -> None:
             f"with this configuration: \n"
             f"{script_class.configs}"
         )
-        asyncio.run(script_class.run())
+        script_class.execute()
@@ -20,11 +20,12 @@
 #
 # You should have received a copy of the GNU General Public License
 
-import asyncio
+__all__ = ["FailingScriptQueueController"]
 
 from lsst.ts.xml.enums.Script import ScriptState
 from lsst.ts.xml.enums.ScriptQueue import ScriptProcessState
 
+from .clock import Clock
 from .script_queue_controller import ScriptQueueController
 
 
@@ -38,7 +39,7 @@ class FailingScriptQueueController(ScriptQueueController):
     integration test scripts that fail for various reasons.
     """
 
-    def __init__(self, index: int, test_type: str) -> None:
+    def __init__(self, index: int, test_type: str, clock: Clock | None = None) -> None:
         """Initialize the Failing ScriptQueue Controller.
 
         Parameters
@@ -48,44 +49,52 @@ class FailingScriptQueueController(ScriptQueueController):
             or an AuxTel (index=2) controller.
         test_type : `str`
             Defines what type of failing test to mimic.
+        clock : `Clock` or `None`
+            The clock timing the scripts.
+            If None, the default clock; see get_default_clock().
         """
-        super().__init__(index)
+        super().__init__(index, clock=clock)
         self.test_type: str = test_type
 
-    async def do_resume(self, data: tuple) -> None:
-        """Resume the ScriptQueue after adding the scripts
-        to the queue. The ScriptQueue will then execute
-        the scripts.
+    async def execute_script(self, script_index: int) -> None:
+        """Execute the given script, ending in the test_type state.
+        As the real ScriptQueue, pause the queue if the script FAILED.
 
+        Parameters
+        ----------
+        script_index : `int`
+            The index of the script.
         """
-        # self.log.info("ScriptQueue resumed\n")
-        for script, _ in enumerate(self.queue_list, start=1):
+        await self.evt_script.set_write(
+            scriptSalIndex=script_index,
+            processState=ScriptProcessState.RUNNING,
+            scriptState=3,  # RUNNING
+        )
+        await self.clock.sleep(0.1)
+        if self.test_type.upper() == "TERMINATED":
+            await self.evt_script.set_write(
+                scriptSalIndex=script_index,
+                processState=ScriptProcessState.TERMINATED,
+                # The next line is technically improper,
+                # but for testing, it's fine.
+                scriptState=ScriptProcessState.TERMINATED,
+                timestampProcessEnd=99999,
+            )
+        elif self.test_type.upper() == "UNFINISHED":
+            # Leave the script RUNNING, to mimic a script that hangs.
+            return
+        elif self.test_type.upper() == "FAILED":
+            self.running = False
+            await self.evt_script.set_write(
+                scriptSalIndex=script_index,
+                processState=ScriptProcessState.DONE,
+                scriptState=ScriptState.FAILED,
+                timestampProcessEnd=99999,
+            )
+        else:
             await self.evt_script.set_write(
-                scriptSalIndex=script,
-                processState=ScriptProcessState.RUNNING,
-                scriptState=3,  # RUNNING
+                scriptSalIndex=script_index,
+                processState=ScriptProcessState.DONE,
+                scriptState=ScriptState.DONE,
+                timestampProcessEnd=99999,
             )
-            await asyncio.sleep(0.1)
-            if self.test_type.upper() == "TERMINATED":
-                await self.evt_script.set_write(
-                    scriptSalIndex=script,
-                    processState=ScriptProcessState.TERMINATED,
-                    # The next line is technically improper,
-                    # but for testing, it's fine.
-                    scriptState=ScriptProcessState.TERMINATED,
-                    timestampProcessEnd=99999,
-                )
-            elif self.test_type.upper() == "FAILED":
-                await self.evt_script.set_write(
-                    scriptSalIndex=script,
-                    processState=ScriptProcessState.DONE,
-                    scriptState=ScriptState.FAILED,
-                    timestampProcessEnd=99999,
-                )
-            else:
-                await self.evt_script.set_write(
-                    scriptSalIndex=script,
-                    processState=ScriptProcessState.DONE,
-                    scriptState=ScriptState.DONE,
-                    timestampProcessEnd=99999,
-                )
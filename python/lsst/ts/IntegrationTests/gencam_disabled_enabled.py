@@ -22,7 +22,6 @@
 
 __all__ = ["GenCamDisabledEnabled", "run_gencam_disabled_enabled"]
 
-import asyncio
 
 from lsst.ts.IntegrationTests import BaseScript
 
@@ -50,4 +49,4 @@ def run_gencam_disabled_enabled() -> None:
     script_class = GenCamDisabledEnabled()
     num_scripts = len(script_class.scripts)
     print(f"\nGenCam Disabled to Enabled; running {num_scripts} scripts")
-    asyncio.run(script_class.run())
+    script_class.execute()
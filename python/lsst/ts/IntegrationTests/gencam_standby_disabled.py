@@ -22,7 +22,6 @@
 
 __all__ = ["GenCamStandbyDisabled", "run_gencam_standby_disabled"]
 
-import asyncio
 
 from lsst.ts.IntegrationTests import BaseScript
 
@@ -50,4 +49,4 @@ def run_gencam_standby_disabled() -> None:
     script_class = GenCamStandbyDisabled()
     num_scripts = len(script_class.scripts)
     print(f"\nGenCam Standby to Disabled; running {num_scripts} scripts")
-    asyncio.run(script_class.run())
+    script_class.execute()
@@ -29,7 +29,6 @@ __all__ = [
     "run_lsstcam_image_taking",
 ]
 
-import asyncio
 
 from lsst.ts.IntegrationTests import BaseScript
 
@@ -88,18 +87,18 @@ def run_auxtel_image_taking() -> None:
     script_class = AuxTelImageTaking()
     num_scripts = len(script_class.scripts)
     print(f"\nAuxTel Image Taking Verification; running {num_scripts} scripts")
-    asyncio.run(script_class.run())
+    script_class.execute()
 
 
 def run_comcam_image_taking() -> None:
     script_class = ComCamImageTaking()
     num_scripts = len(script_class.scripts)
     print(f"\nComCam Image Taking Verification; running {num_scripts} scripts")
-    asyncio.run(script_class.run())
+    script_class.execute()
 
 
 def run_lsstcam_image_taking() -> None:
     script_class = LsstCamImageTaking()
     num_scripts = len(script_class.scripts)
     print(f"\nLSSTCam Image Taking Verification; running {num_scripts} scripts")
-    asyncio.run(script_class.run())
+    script_class.execute()
@@ -23,7 +23,6 @@
 __all__ = ["LoadCameraPlaylist", "load_camera_playlist"]
 
 import argparse
-import asyncio
 import os
 
 import lsst.ts.IntegrationTests.configs.camera_playlist_configs as playlist_configs
@@ -141,4 +140,4 @@ def main(opts: argparse.Namespace) -> None:
             f"'{opts.playlist_shortname}' playlist."
             f" Playlist repeat is {repeat}."
         )
-        asyncio.run(script_class.run())
+        script_class.execute()
@@ -22,7 +22,6 @@
 
 __all__ = ["LoveStressTest", "run_love_stress_test"]
 
-import asyncio
 
 import yaml
 from lsst.ts.IntegrationTests import BaseScript
@@ -104,4 +103,4 @@ def run_love_stress_test() -> None:
             f" with this configuration:\n"
             f"{script_class.configs}"
         )
-        asyncio.run(script_class.run())
+        script_class.execute()
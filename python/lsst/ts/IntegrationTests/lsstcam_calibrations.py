@@ -23,7 +23,6 @@
 __all__ = ["LsstCamCalibrations", "run_lsstcam_calibrations"]
 
 import argparse
-import asyncio
 
 import yaml
 from lsst.ts.IntegrationTests import BaseScript
@@ -93,4 +92,4 @@ def run_lsstcam_calibrations() -> None:
         f"master_{script_class.calib_type} calibrations"
         f"\nwith configuration;\n{script_class.configs}"
     )
-    asyncio.run(script_class.run())
+    script_class.execute()
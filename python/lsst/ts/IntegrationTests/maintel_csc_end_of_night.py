@@ -23,7 +23,6 @@
 __all__ = ["MainTelCscEndOfNight", "maintel_csc_end_of_night"]
 
 import argparse
-import asyncio
 from typing import List
 
 import yaml
@@ -87,4 +86,4 @@ def main(opts: argparse.Namespace) -> None:
         print(repr(ke))
     else:
         print(f"\nExecuting End-of-Night activities." f"\nIgnore list: {opts.ignore}.")
-        asyncio.run(script_class.run())
+        script_class.execute()
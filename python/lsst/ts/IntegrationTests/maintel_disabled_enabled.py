@@ -22,7 +22,6 @@
 
 __all__ = ["MainTelDisabledEnabled", "run_maintel_disabled_enabled"]
 
-import asyncio
 
 from lsst.ts.IntegrationTests import BaseScript
 
@@ -55,4 +54,4 @@ def run_maintel_disabled_enabled() -> None:
         f"with this configuration: \n"
         f"{script_class.configs}"
     )
-    asyncio.run(script_class.run())
+    script_class.execute()
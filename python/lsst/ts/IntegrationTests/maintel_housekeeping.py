@@ -29,7 +29,6 @@ __all__ = [
     "run_maintel_housekeeping",
 ]
 
-import asyncio
 
 from lsst.ts.IntegrationTests import BaseScript
 
@@ -97,18 +96,18 @@ def run_comcam_housekeeping() -> None:
     script_class = ComCamHousekeeping()
     num_scripts = len(script_class.scripts)
     print(f"\nComCam Housekeeping; running {num_scripts} scripts")
-    asyncio.run(script_class.run())
+    script_class.execute()
 
 
 def run_lsstcam_housekeeping() -> None:
     script_class = LsstCamHousekeeping()
     num_scripts = len(script_class.scripts)
     print(f"\nLSSTCam Housekeeping; running {num_scripts} scripts")
-    asyncio.run(script_class.run())
+    script_class.execute()
 
 
 def run_maintel_housekeeping() -> None:
     script_class = MainTelHousekeeping()
     num_scripts = len(script_class.scripts)
     print(f"\nMainTel Housekeeping; running {num_scripts} scripts")
-    asyncio.run(script_class.run())
+    script_class.execute()
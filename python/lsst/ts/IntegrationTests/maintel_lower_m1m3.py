@@ -22,7 +22,6 @@
 
 __all__ = ["MainTelLowerM1M3", "maintel_lower_m1m3"]
 
-import asyncio
 
 from lsst.ts.IntegrationTests import BaseScript
 
@@ -52,4 +51,4 @@ def maintel_lower_m1m3() -> None:
         print(repr(ke))
     else:
         print("\nRaising M1M3.")
-        asyncio.run(script_class.run())
+        script_class.execute()
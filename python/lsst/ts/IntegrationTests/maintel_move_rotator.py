@@ -23,7 +23,6 @@
 __all__ = ["MainTelMoveRotator", "maintel_move_rotator"]
 
 import argparse
-import asyncio
 from typing import List
 
 import yaml
@@ -101,4 +100,4 @@ def main(opts: argparse.Namespace) -> None:
             f"\nMoving MTRotator to {opts.angle} degrees."
             f"\nIgnore list: {opts.ignore}."
         )
-        asyncio.run(script_class.run())
+        script_class.execute()
@@ -23,7 +23,6 @@
 __all__ = ["MainTelOpenMirrorCovers", "maintel_open_mirror_covers"]
 
 import argparse
-import asyncio
 from typing import List
 
 import yaml
@@ -87,4 +86,4 @@ def main(opts: argparse.Namespace) -> None:
         print(repr(ke))
     else:
         print(f"Opening mirror covers." f"\nIgnore list: {opts.ignore}.")
-        asyncio.run(script_class.run())
+        script_class.execute()
@@ -22,7 +22,6 @@
 
 __all__ = ["MainTelPointAzEl", "run_maintel_point_azel"]
 
-import asyncio
 
 import yaml
 from lsst.ts.IntegrationTests import BasePointAzEl, BaseScript
@@ -67,4 +66,4 @@ def run_maintel_point_azel() -> None:
         f"\nTarget: {script_class.args.target_name}"
         f"\nIgnore list: {script_class.args.ignore}"
     )
-    asyncio.run(script_class.run())
+    script_class.execute()
@@ -23,7 +23,6 @@
 __all__ = ["MainTelSlewDome", "maintel_slew_dome"]
 
 import argparse
-import asyncio
 from typing import List
 
 import yaml
@@ -100,4 +99,4 @@ def main(opts: argparse.Namespace) -> None:
         print(
             f"\nSlewing MTDome to {opts.az} degrees." f"\nIgnore list: {opts.ignore}."
         )
-        asyncio.run(script_class.run())
+        script_class.execute()
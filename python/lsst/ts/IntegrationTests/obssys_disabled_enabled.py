@@ -22,7 +22,6 @@
 
 __all__ = ["ObsSysDisabledEnabled", "run_obssys_disabled_enabled"]
 
-import asyncio
 
 from lsst.ts.IntegrationTests import BaseScript
 
@@ -62,4 +61,4 @@ def run_obssys_disabled_enabled() -> None:
             f"with this configuration: \n"
             f"{script_class.configs}"
         )
-        asyncio.run(script_class.run())
+        script_class.execute()
@@ -0,0 +1,278 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# This file is part of ts_IntegrationTests.
+#
+# Developed for the Vera C. Rubin Observatory Telescope & Site Software system.
+# This product includes software developed by the Vera C. Rubin Observatory
+# Project (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+__all__ = [
+    "ScriptRunReport",
+    "OrchestratorReport",
+    "get_script_class",
+    "run_script",
+    "run_in_parallel",
+    "run_parallel_checkout",
+]
+
+import argparse
+import asyncio
+import dataclasses
+import importlib
+import time
+from collections.abc import Iterable
+
+from lsst.ts.IntegrationTests import BaseScript
+from lsst.ts.xml.enums.Script import ScriptState
+
+from .script_queue_session import ScriptQueueSession
+
+
+@dataclasses.dataclass
+class ScriptRunReport:
+    """The outcome of one BaseScript run.
+
+    Attributes
+    ----------
+    name : `str`
+        The name of the BaseScript class.
+    index : `int`
+        The ScriptQueue index.
+    num_scripts : `int`
+        The number of scripts the BaseScript adds to the ScriptQueue.
+    script_indexes : `list`
+        The script indexes returned by the ScriptQueue.
+    script_states : `list`
+        The final script states, as integers.
+    duration : `float`
+        The time, in seconds, taken by the run.
+    error : `str` or `None`
+        The exception raised by the run, if any.
+    """
+
+    name: str
+    index: int
+    num_scripts: int
+    script_indexes: list[int] = dataclasses.field(default_factory=list)
+    script_states: list[int] = dataclasses.field(default_factory=list)
+    duration: float = 0.0
+    error: str | None = None
+
+    @property
+    def succeeded(self) -> bool:
+        """True if every script was added and finished in the DONE state."""
+        return (
+            self.error is None
+            and len(self.script_states) == self.num_scripts
+            and all(state == ScriptState.DONE for state in self.script_states)
+        )
+
+
+@dataclasses.dataclass
+class OrchestratorReport:
+    """The combined outcome of BaseScript runs on several ScriptQueues.
+
+    Attributes
+    ----------
+    runs : `list`
+        The ScriptRunReport of each run, in the order the runs were given.
+    duration : `float`
+        The time, in seconds, taken by all the runs.
+    """
+
+    runs: list[ScriptRunReport] = dataclasses.field(default_factory=list)
+    duration: float = 0.0
+
+    @property
+    def succeeded(self) -> bool:
+        """True if every run succeeded."""
+        return all(run.succeeded for run in self.runs)
+
+    def format(self) -> str:
+        """Format the report as text, one line per run."""
+        queues = sorted({run.index for run in self.runs})
+        lines = [
+            f"Ran {len(self.runs)} integration test scripts on "
+            f"ScriptQueues {queues} in {self.duration:.1f} s."
+        ]
+        for run in self.runs:
+            outcome = "PASSED" if run.succeeded else "FAILED"
+            line = (
+                f"  ScriptQueue {run.index} {run.name}: {outcome} "
+                f"in {run.duration:.1f} s; "
+                f"Script Indexes {run.script_indexes}; "
+                f"Script States {run.script_states}"
+            )
+            if run.error is not None:
+                line += f"; Error: {run.error}"
+            lines.append(line)
+        return "\n".join(lines)
+
+
+def get_script_class(name: str) -> type[BaseScript]:
+    """Get the integration test script class with the given name.
+
+    Parameters
+    ----------
+    name : `str`
+        The name of the BaseScript subclass, e.g. AuxTelHousekeeping.
+
+    Raises
+    ------
+    KeyError
+        If the name is not an integration test script class.
+    """
+    package = importlib.import_module("lsst.ts.IntegrationTests")
+    script_class = getattr(package, name, None)
+    if not (isinstance(script_class, type) and issubclass(script_class, BaseScript)):
+        raise KeyError(f"{name} is not an integration test script.")
+    return script_class
+
+
+async def run_script(
+    script: BaseScript, session: ScriptQueueSession
+) -> ScriptRunReport:
+    """Run the given script, one script at a time per ScriptQueue,
+    and report the outcome rather than raising.
+
+    Parameters
+    ----------
+    script : `BaseScript`
+        The integration test script to run.
+    session : `ScriptQueueSession`
+        The session holding the ScriptQueue Remotes.
+
+    Returns
+    -------
+    report : `ScriptRunReport`
+        The outcome of the run.
+    """
+    report = ScriptRunReport(
+        name=type(script).__name__,
+        index=script.index,
+        num_scripts=len(script.scripts),
+    )
+    async with session.queue_lock(script.index):
+        start_time = time.monotonic()
+        try:
+            await script.run(session=session)
+        except Exception as e:
+            report.error = repr(e)
+        report.duration = time.monotonic() - start_time
+    report.script_indexes = list(script.script_indexes)
+    report.script_states = list(script.script_states)
+    return report
+
+
+async def run_in_parallel(
+    scripts: Iterable[BaseScript | type[BaseScript]],
+    session: ScriptQueueSession | None = None,
+) -> OrchestratorReport:
+    """Run the given scripts, running the scripts for different
+    ScriptQueues concurrently.
+
+    Parameters
+    ----------
+    scripts : ``iterable``
+        The BaseScript instances, or BaseScript subclasses taking no
+        arguments, to run.
+    session : `ScriptQueueSession` or `None`
+        The session holding the ScriptQueue Remotes. If None, a session
+        is created for, and closed after, these runs.
+
+    Returns
+    -------
+    report : `OrchestratorReport`
+        The combined outcome of the runs.
+
+    Notes
+    -----
+    The scripts for each ScriptQueue form a lane, run in the given order.
+    The lanes run concurrently, so the whole set finishes in about the
+    time of the longest lane.
+    """
+    instances = [script() if isinstance(script, type) else script for script in scripts]
+    if session is None:
+        async with ScriptQueueSession() as session:
+            return await run_in_parallel(instances, session=session)
+
+    lanes: dict[int, list[BaseScript]] = {}
+    for script in instances:
+        lanes.setdefault(script.index, []).append(script)
+
+    async def run_lane(lane: list[BaseScript]) -> list[ScriptRunReport]:
+        return [await run_script(script, session) for script in lane]
+
+    start_time = time.monotonic()
+    lane_reports = await asyncio.gather(*[run_lane(lane) for lane in lanes.values()])
+    duration = time.monotonic() - start_time
+    # Return the reports in the order the scripts were given.
+    reports = {
+        id(script): report
+        for lane, lane_report in zip(lanes.values(), lane_reports)
+        for script, report in zip(lane, lane_report)
+    }
+    return OrchestratorReport(
+        runs=[reports[id(script)] for script in instances], duration=duration
+    )
+
+
+def run_parallel_checkout() -> None:
+    # Define the script arguments.
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "script_classes",
+        metavar="script_class",
+        nargs="*",
+        type=str,
+        help="Specify the integration test script classes to run, "
+        "e.g. AuxTelHousekeeping MainTelHousekeeping (case sensitive).",
+    )
+    parser.add_argument(
+        "-i",
+        "--info",
+        action="store_true",
+        help="Print the allowed options.",
+    )
+    args = parser.parse_args()
+    # Print the help if no script classes are defined.
+    if args.info or not args.script_classes:
+        parser.print_help()
+        exit()
+    main(args)
+
+
+def main(opts: argparse.Namespace) -> None:
+    # Ensure the invocation is correct.
+    # If not, raise KeyError.
+    # If it is correct, run the scripts.
+    # Exit with an error if the invocation is not correct or a run failed.
+    try:
+        scripts = [get_script_class(name)() for name in opts.script_classes]
+    except (KeyError, TypeError) as e:
+        print(repr(e))
+        exit(1)
+    else:
+        print(
+            f"\nRunning {len(scripts)} integration test scripts "
+            f"on ScriptQueues {sorted({script.index for script in scripts})}."
+        )
+        report = asyncio.run(run_in_parallel(scripts))
+        print(report.format())
+        if not report.succeeded:
+            exit(1)
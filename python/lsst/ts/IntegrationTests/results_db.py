@@ -0,0 +1,478 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# This file is part of ts_IntegrationTests.
+#
+# Developed for the Vera C. Rubin Observatory Telescope & Site Software system.
+# This product includes software developed by the Vera C. Rubin Observatory
+# Project (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+__all__ = [
+    "PhaseStats",
+    "PhaseRegression",
+    "ResultsDatabase",
+    "get_results_db_path",
+    "query_results",
+]
+
+import argparse
+import dataclasses
+import os
+import sqlite3
+import statistics
+import types
+from collections.abc import Iterable
+
+from lsst.ts.utils import current_tai
+
+from .script_timing import RunTiming
+
+# The phases of a script run, as named in the scripts table.
+PHASES = ("add", "load", "queued", "run")
+
+# The seconds in a day.
+DAY = 24 * 60 * 60
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    entry_point TEXT NOT NULL,
+    queue_index INTEGER NOT NULL,
+    start_time REAL,
+    end_time REAL,
+    pause_duration REAL,
+    resume_duration REAL
+);
+CREATE TABLE IF NOT EXISTS scripts (
+    run_id TEXT NOT NULL REFERENCES runs (run_id),
+    position INTEGER NOT NULL,
+    script_index INTEGER NOT NULL,
+    path TEXT NOT NULL,
+    is_standard INTEGER NOT NULL,
+    config_hash TEXT NOT NULL,
+    script_state INTEGER,
+    add_duration REAL,
+    load_duration REAL,
+    queued_duration REAL,
+    run_duration REAL,
+    PRIMARY KEY (run_id, position)
+);
+CREATE INDEX IF NOT EXISTS scripts_path ON scripts (path);
+CREATE INDEX IF NOT EXISTS runs_start_time ON runs (start_time);
+"""
+
+
+def get_results_db_path() -> str | None:
+    """Get the results database path from the
+    TS_INTEGRATION_TESTS_RESULTS_DB environment variable, if set.
+    """
+    return os.environ.get("TS_INTEGRATION_TESTS_RESULTS_DB") or None
+
+
+def get_percentile(sorted_values: list[float], percent: float) -> float:
+    """Return the given percentile of the sorted values,
+    interpolating between the closest ranks.
+    """
+    position = (len(sorted_values) - 1) * percent / 100
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    fraction = position - lower
+    return sorted_values[lower] * (1 - fraction) + sorted_values[upper] * fraction
+
+
+@dataclasses.dataclass
+class PhaseStats:
+    """The statistics of one phase of the runs of a script.
+
+    Attributes
+    ----------
+    path : `str`
+        The script path.
+    phase : `str`
+        The phase: add, load, queued or run.
+    count : `int`
+        The number of runs.
+    mean, p50, p90, p99, max : `float`
+        The mean, percentiles and maximum duration, in seconds.
+    """
+
+    path: str
+    phase: str
+    count: int
+    mean: float
+    p50: float
+    p90: float
+    p99: float
+    max: float
+
+    @classmethod
+    def from_durations(
+        cls, path: str, phase: str, durations: Iterable[float]
+    ) -> "PhaseStats":
+        """Compute the statistics of the given durations; at least one."""
+        values = sorted(durations)
+        return cls(
+            path=path,
+            phase=phase,
+            count=len(values),
+            mean=statistics.fmean(values),
+            p50=get_percentile(values, 50),
+            p90=get_percentile(values, 90),
+            p99=get_percentile(values, 99),
+            max=values[-1],
+        )
+
+
+@dataclasses.dataclass
+class PhaseRegression:
+    """A script phase slower in the recent runs than in the earlier runs.
+
+    Attributes
+    ----------
+    path : `str`
+        The script path.
+    phase : `str`
+        The phase: add, load, queued or run.
+    baseline : `PhaseStats`
+        The statistics of the earlier runs.
+    recent : `PhaseStats`
+        The statistics of the recent runs.
+    """
+
+    path: str
+    phase: str
+    baseline: PhaseStats
+    recent: PhaseStats
+
+    @property
+    def ratio(self) -> float:
+        """The ratio of the recent to the earlier median durations."""
+        if self.baseline.p50 == 0:
+            return float("inf")
+        return self.recent.p50 / self.baseline.p50
+
+
+class ResultsDatabase:
+    """A SQLite database of the integration test script runs.
+
+    Parameters
+    ----------
+    path : `str`
+        The database file; it is created if needed.
+
+    Notes
+    -----
+    The runs table holds one row per BaseScript run, and the scripts table
+    one row per script of each run, with the duration of each phase.
+    See RunTiming and ScriptTiming.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript(SCHEMA)
+
+    def add_run(self, timing: RunTiming, entry_point: str) -> None:
+        """Add the given run to the database.
+
+        Parameters
+        ----------
+        timing : `RunTiming`
+            The timeline of the run.
+        entry_point : `str`
+            The command that started the run, e.g. auxtel_housekeeping.
+        """
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO runs VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    timing.run_id,
+                    timing.name,
+                    entry_point,
+                    timing.index,
+                    timing.start_time,
+                    timing.end_time,
+                    timing.pause_duration,
+                    timing.resume_duration,
+                ),
+            )
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO scripts "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        timing.run_id,
+                        position,
+                        script.script_index,
+                        script.path,
+                        script.is_standard,
+                        script.config_hash,
+                        script.script_state,
+                        script.add_duration,
+                        script.load_duration,
+                        script.queued_duration,
+                        script.run_duration,
+                    )
+                    for position, script in enumerate(timing.scripts)
+                ],
+            )
+
+    def get_durations(
+        self,
+        phase: str,
+        start_time: float | None = None,
+        end_time: float | None = None,
+        path: str | None = None,
+    ) -> dict[str, list[float]]:
+        """Get the durations of the given phase, keyed by script path.
+
+        Parameters
+        ----------
+        phase : `str`
+            The phase: add, load, queued or run.
+        start_time, end_time : `float` or `None`
+            Only include the runs started in this TAI time range.
+        path : `str` or `None`
+            Only include the scripts matching this SQL LIKE pattern,
+            e.g. auxtel/%.
+
+        Raises
+        ------
+        ValueError
+            If the phase is not known.
+        """
+        if phase not in PHASES:
+            raise ValueError(f"{phase} is not one of {PHASES}")
+        query = (
+            f"SELECT scripts.path, scripts.{phase}_duration FROM scripts "
+            f"JOIN runs USING (run_id) WHERE scripts.{phase}_duration IS NOT NULL"
+        )
+        parameters: list = []
+        if start_time is not None:
+            query += " AND runs.start_time >= ?"
+            parameters.append(start_time)
+        if end_time is not None:
+            query += " AND runs.start_time < ?"
+            parameters.append(end_time)
+        if path is not None:
+            query += " AND scripts.path LIKE ?"
+            parameters.append(path)
+        query += " ORDER BY runs.start_time, scripts.position"
+        durations: dict[str, list[float]] = {}
+        for script_path, duration in self.connection.execute(query, parameters):
+            durations.setdefault(script_path, []).append(duration)
+        return durations
+
+    def get_stats(
+        self,
+        phase: str,
+        days: float = 30,
+        path: str | None = None,
+        now: float | None = None,
+    ) -> list[PhaseStats]:
+        """Get the statistics of the given phase of each script,
+        over the given number of days.
+
+        Parameters
+        ----------
+        phase : `str`
+            The phase: add, load, queued or run.
+        days : `float`
+            The number of days, before now, to include.
+        path : `str` or `None`
+            Only include the scripts matching this SQL LIKE pattern.
+        now : `float` or `None`
+            The current TAI time; if None, use the clock.
+        """
+        now = current_tai() if now is None else now
+        durations = self.get_durations(phase, start_time=now - days * DAY, path=path)
+        return [
+            PhaseStats.from_durations(script_path, phase, values)
+            for script_path, values in sorted(durations.items())
+        ]
+
+    def find_regressions(
+        self,
+        phase: str,
+        days: float = 30,
+        recent_days: float = 1,
+        threshold: float = 1.2,
+        path: str | None = None,
+        now: float | None = None,
+    ) -> list[PhaseRegression]:
+        """Find the scripts whose recent median duration of the given phase
+        exceeds the earlier median by the given factor.
+
+        Parameters
+        ----------
+        phase : `str`
+            The phase: add, load, queued or run.
+        days : `float`
+            The number of days, before now, to include.
+        recent_days : `float`
+            The number of days, before now, making the recent runs.
+            The earlier runs of the period are the baseline.
+        threshold : `float`
+            The ratio of the recent to the baseline median durations
+            above which a script is reported.
+        path : `str` or `None`
+            Only include the scripts matching this SQL LIKE pattern.
+        now : `float` or `None`
+            The current TAI time; if None, use the clock.
+        """
+        now = current_tai() if now is None else now
+        split_time = now - recent_days * DAY
+        baseline = self.get_durations(
+            phase, start_time=now - days * DAY, end_time=split_time, path=path
+        )
+        recent = self.get_durations(phase, start_time=split_time, path=path)
+        regressions = []
+        for script_path in sorted(baseline.keys() & recent.keys()):
+            regression = PhaseRegression(
+                path=script_path,
+                phase=phase,
+                baseline=PhaseStats.from_durations(
+                    script_path, phase, baseline[script_path]
+                ),
+                recent=PhaseStats.from_durations(
+                    script_path, phase, recent[script_path]
+                ),
+            )
+            if regression.ratio > threshold:
+                regressions.append(regression)
+        return regressions
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def __enter__(self) -> "ResultsDatabase":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        exc_traceback: types.TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+def query_results() -> None:
+    # Define the script arguments.
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--db",
+        type=str,
+        default=get_results_db_path(),
+        help="Specify the results database "
+        "(default: $TS_INTEGRATION_TESTS_RESULTS_DB).",
+    )
+    parser.add_argument(
+        "--phase",
+        choices=PHASES,
+        default="run",
+        help="Specify the script phase to report (default: run).",
+    )
+    parser.add_argument(
+        "--script",
+        type=str,
+        default=None,
+        help="Specify the scripts to report, as a SQL LIKE pattern, "
+        "e.g. auxtel/take_image_latiss.py or auxtel/%%.",
+    )
+    parser.add_argument(
+        "--days",
+        type=float,
+        default=30,
+        help="Specify the number of days to report (default: 30).",
+    )
+    parser.add_argument(
+        "--regressions",
+        action="store_true",
+        help="Report the scripts slower in the recent runs than before.",
+    )
+    parser.add_argument(
+        "--recent-days",
+        type=float,
+        default=1,
+        help="Specify the number of days of recent runs (default: 1).",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.2,
+        help="Specify the ratio of the recent to the earlier median durations "
+        "reported as a regression (default: 1.2).",
+    )
+    parser.add_argument(
+        "-i",
+        "--info",
+        action="store_true",
+        help="Print the allowed options.",
+    )
+    args = parser.parse_args()
+    # Print the help if the database is not defined.
+    if args.info or not args.db:
+        parser.print_help()
+        exit()
+    main(args)
+
+
+def main(opts: argparse.Namespace) -> None:
+    # Exit with an error if the database does not exist,
+    # rather than creating an empty one.
+    # Otherwise, report the statistics or the regressions of the script phase.
+    if not os.path.exists(opts.db):
+        print(f"The results database {opts.db} does not exist.")
+        exit(1)
+    with ResultsDatabase(opts.db) as results_db:
+        if opts.regressions:
+            regressions = results_db.find_regressions(
+                opts.phase,
+                days=opts.days,
+                recent_days=opts.recent_days,
+                threshold=opts.threshold,
+                path=opts.script,
+            )
+            print(
+                f"{len(regressions)} {opts.phase} time regressions over "
+                f"{opts.days:g} days:"
+            )
+            for regression in regressions:
+                print(
+                    f"  {regression.path}: median {regression.recent.p50:.3f} s "
+                    f"in the last {opts.recent_days:g} days "
+                    f"({regression.recent.count} runs), "
+                    f"{regression.baseline.p50:.3f} s before "
+                    f"({regression.baseline.count} runs); "
+                    f"x{regression.ratio:.2f}"
+                )
+        else:
+            print(f"Script {opts.phase} times (s) over {opts.days:g} days:")
+            print(
+                f"  {'script':<45} {'runs':>5} {'mean':>8} {'p50':>8} "
+                f"{'p90':>8} {'p99':>8} {'max':>8}"
+            )
+            for stats in results_db.get_stats(
+                opts.phase, days=opts.days, path=opts.script
+            ):
+                print(
+                    f"  {stats.path:<45} {stats.count:>5} {stats.mean:>8.3f} "
+                    f"{stats.p50:>8.3f} {stats.p90:>8.3f} {stats.p99:>8.3f} "
+                    f"{stats.max:>8.3f}"
+                )
@@ -20,20 +20,28 @@
 #
 # You should have received a copy of the GNU General Public License
 
-__all__ = ["RunCommand", "run_command"]
+__all__ = ["RunCommand", "read_commands_file", "run_command"]
 
 import argparse
-import asyncio
+from collections.abc import Iterable
+from typing import Any
 
 import yaml
 from lsst.ts.IntegrationTests import BaseScript, utils
 
+from .command_parameters import get_parameter_parser, split_values
+from .script_queue_session import ScriptQueueSession
+
 
 class RunCommand(BaseScript):
     """Execute the run_command script for the given CSC and command,
     with any additional configuration parameters, placed in the
     given ScriptQueue location.
 
+    Several commands can be run in one submission: each is a run_command
+    script, and they are all added to the ScriptQueue, in order, in one
+    pause and resume cycle.
+
     Attributes
     ----------
     sq_index : `int`
@@ -42,8 +50,17 @@ class RunCommand(BaseScript):
         The <CSC>:<INDEX> for which to execute the command. Case-sensitive.
     command : `str`
         The command to execute.
-    parameters : `str`
-        A dictionary of parameters needed by the command, in key:value format.
+    parameters : `str` or `dict`
+        The parameters needed by the command, in comma-separated key:value
+        format, or as a dictionary. The values are converted to the types
+        of the command fields, read from the CSC XML definition.
+    queue_placement : `str`
+        The ScriptQueue location of the script; "FIRST" or "LAST".
+    inject : `bool`
+        Add the script to the running ScriptQueue, without pausing it.
+    commands : ``iterable``
+        More (csc, command, parameters) tuples to execute after the
+        command above, in order. The parameters may be empty.
     """
 
     configs: tuple = ()
@@ -54,58 +71,155 @@ class RunCommand(BaseScript):
     def __init__(
         self,
         sq_index: int,
-        csc: str,
-        command: str,
-        parameters: str = "",
+        csc: str = "",
+        command: str = "",
+        parameters: str | dict[str, Any] = "",
+        queue_placement: str = "LAST",
+        inject: bool = False,
+        commands: Iterable[tuple[str, str, str | dict[str, Any]]] = (),
     ) -> None:
-        super().__init__()
+        super().__init__(queue_placement=queue_placement, inject=inject)
         self.index = sq_index
         self.csc = csc
         self.command = command
         self.parameters = parameters
-        # Convert the parameters to a properly formatted dictionary.
-        # First, construct the config with the CSC and Command.
-        formatted_lines = [
-            f"component: {self.csc}",
-            f"cmd: {self.command}",
+        self.commands: list[tuple[str, str, str | dict[str, Any]]] = []
+        if csc or command:
+            self.commands.append((csc, command, parameters))
+        self.commands += [
+            (entry_csc, entry_command, entry_parameters or "")
+            for entry_csc, entry_command, entry_parameters in commands
         ]
-        # Second, if the command needs parameters, add them to the config.
-        if self.parameters:
-            formatted_lines.append("parameters:")
-            # Third, construct an intermediate dictionary of the parameters.
-            pairs = self.parameters.split(",")
-            parameters_dict = {}
-            for pair in pairs:
-                key, value = pair.split(":")
-                # Convert booleans regardless of capitalization.
-                if value.lower() == "true":
-                    value = True
-                elif value.lower() == "false":
-                    value = False
-                else:
-                    # Convert integer values.
-                    try:
-                        value = int(value)
-                    except ValueError:
-                        # Convert float values.
-                        try:
-                            value = float(value)
-                        # Quote strings to handle spaces.
-                        except ValueError:
-                            value = f"'{value}'"
-                parameters_dict[key] = value
-            # Fourth, add the command parameters to the config.
-            for key, value in parameters_dict.items():
-                formatted_lines.append(f"  {key}: {value}")
-        # Fifth, construct the full configuration needed for the
-        # run_command.py script.
-        config = "\n".join(formatted_lines)
-        # Convert it to a properly formatted YAML document.
-        yaml_string = yaml.safe_load(f"""{config}""")
-        self.configs = (
-            yaml.safe_dump(yaml_string, explicit_start=True, canonical=True),
+        if not self.commands:
+            raise ValueError("No command to execute.")
+        for entry_csc, entry_command, _ in self.commands:
+            if not (entry_csc and entry_command):
+                raise ValueError(
+                    f"Both the CSC and command are needed; "
+                    f"got {entry_csc!r} and {entry_command!r}."
+                )
+        self.scripts = [RunCommand.scripts[0]] * len(self.commands)
+        self.configs = tuple(
+            self.make_config(*command_entry) for command_entry in self.commands
         )
 
+    @staticmethod
+    def make_config(
+        csc: str, command: str, parameters: str | dict[str, Any] | None
+    ) -> str:
+        """Make the run_command.py configuration of one command.
+
+        Parameters
+        ----------
+        csc : `str`
+            The <CSC>:<INDEX> for which to execute the command.
+        command : `str`
+            The command to execute.
+        parameters : `str`, `dict` or `None`
+            The parameters of the command, in comma-separated key:value
+            format, or as a dictionary; see ParameterParser.parse().
+
+        Returns
+        -------
+        config : `str`
+            The Yaml-formatted configuration.
+
+        Raises
+        ------
+        ValueError
+            If the parameters do not match the command fields.
+        """
+        config: dict[str, Any] = dict(component=csc, cmd=command)
+        # Convert the parameters to the types of the command fields.
+        parameters_dict = get_parameter_parser(csc, command).parse(parameters)
+        if parameters_dict:
+            config["parameters"] = parameters_dict
+        return yaml.safe_dump(config, explicit_start=True, canonical=True)
+
+    async def run(self, session: ScriptQueueSession | None = None) -> None:
+        """Run the commands, then print the final script state of each.
+
+        The results are printed by the run, rather than by the entry point,
+        so they follow the run wherever it happens, e.g. on the
+        integration_tests daemon.
+
+        Parameters
+        ----------
+        session : `ScriptQueueSession` or `None`
+            The session holding the salobj Domain and ScriptQueue Remote;
+            see BaseScript.run.
+        """
+        if session is None:
+            # BaseScript.run creates the session, and runs again with it.
+            await super().run()
+            return
+        try:
+            await super().run(session=session)
+        finally:
+            self.print_results()
+
+    def print_results(self) -> None:
+        """Print the final script state of each finished command."""
+        for csc, command, state in self.results:
+            if state is not None:
+                print(f"{csc} {command}: Script State {state}")
+
+    @property
+    def results(self) -> list[tuple[str, str, int | None]]:
+        """The (csc, command, final script state) of each command,
+        in order. The state is None if the script was not added or
+        did not finish.
+        """
+        # Match each command to its script by script index, as a script
+        # may fail to be added, or to finish, while the next ones do not.
+        indexes = list(self.added_indexes)
+        indexes += [None] * (len(self.commands) - len(indexes))
+        return [
+            (csc, command, None if index is None else self.final_states.get(index))
+            for (csc, command, _), index in zip(self.commands, indexes)
+        ]
+
+
+def read_commands_file(path: str) -> list[tuple[str, str, str]]:
+    """Read the commands of a run_command file.
+
+    Parameters
+    ----------
+    path : `str`
+        The file. Each line is a command, as
+        ``<CSC>[:<INDEX>] <command> [<parameters>]``, e.g.
+        ``ATAOS resetOffset axis:all``. The parameters are the rest of
+        the line, as given to the -p option, with their quotes, e.g.
+        ``Test setScalars string0:"Peek, a boo",int0:42``.
+        Blank lines and ``#`` comments, outside quotes, are ignored.
+
+    Returns
+    -------
+    commands : `list`
+        The (csc, command, parameters) of each command.
+
+    Raises
+    ------
+    ValueError
+        If a line is not a command, or has an unclosed quote.
+    """
+    commands = []
+    with open(path) as commands_file:
+        for line_number, line in enumerate(commands_file, start=1):
+            # Only split off the CSC and command, as the parameter parser
+            # needs the quotes of the parameters.
+            fields = split_values(line, separator="#")[0].split(maxsplit=2)
+            if not fields:
+                continue
+            if len(fields) < 2:
+                raise ValueError(
+                    f"{path}:{line_number}: expected "
+                    f"'<CSC> <command> [<parameters>]'; got {line.strip()!r}."
+                )
+            csc, command, *parameters = fields
+            commands.append((csc, command, parameters[0] if parameters else ""))
+    return commands
+
 
 def run_command() -> None:
     # Define the script arguments.
@@ -120,12 +234,14 @@ def run_command() -> None:
     parser.add_argument(
         "csc",
         metavar="csc[:index]",
+        nargs="?",
         type=str,
         help="Specify which CSC[:index] to command (case sensitive).",
     )
     parser.add_argument(
         "command",
         metavar="command",
+        nargs="?",
         type=str,
         help="Specify which command to execute.",
     )
@@ -134,7 +250,40 @@ def run_command() -> None:
         "--parameters",
         nargs="?",
         type=str,
-        help="Specify any parameters for the command, in a comma-separated, key:value pair format.",
+        help="Specify any parameters for the command, in a comma-separated, "
+        "key:value pair format. Quote values with commas or colons, e.g. "
+        "\"name:'a, b'\", and bracket arrays, e.g. 'values:[1, 2]'.",
+    )
+    parser.add_argument(
+        "-t",
+        "--then",
+        metavar="CSC COMMAND [PARAMETERS]",
+        nargs="+",
+        action="append",
+        default=[],
+        help="Specify another command to execute, in the same ScriptQueue "
+        "submission; may be repeated.",
+    )
+    parser.add_argument(
+        "-f",
+        "--commands_file",
+        type=str,
+        help="Specify a file of commands to execute, in the same ScriptQueue "
+        "submission, one '<CSC>[:<INDEX>] <command> [<parameters>]' per line.",
+    )
+    parser.add_argument(
+        "-q",
+        "--queue_placement",
+        type=str.upper,
+        choices=["FIRST", "LAST"],
+        default="LAST",
+        help="Specify where to place the script in the ScriptQueue.",
+    )
+    parser.add_argument(
+        "--inject",
+        action="store_true",
+        help="Add the script without pausing the ScriptQueue. "
+        "Use this on a busy ScriptQueue.",
     )
     parser.add_argument(
         "-i",
@@ -146,38 +295,55 @@ def run_command() -> None:
     if args.info:
         parser.print_help()
         exit()
-    # Print the help if the CSC or COMMAND is not defined.
-    if not (args.csc or args.command):
-        parser.print_help()
-        exit()
-    if args.csc.split(":")[0] not in utils.cscs:
-        print(
-            f"Invalid CSC: {args.csc.split(':')[0]}. "
-            f"Perhaps it is misspelled or not properly capitalized."
-        )
+    # Collect the commands.
+    args.commands = []
+    if args.csc and not args.command:
+        parser.error("the command of the CSC is required.")
+    if args.csc:
+        args.commands.append((args.csc, args.command, args.parameters or ""))
+    for fields in args.then:
+        if len(fields) not in (2, 3):
+            parser.error(f"--then expects CSC COMMAND [PARAMETERS]; got {fields}.")
+        csc, command, *parameters = fields
+        args.commands.append((csc, command, parameters[0] if parameters else ""))
+    if args.commands_file:
+        try:
+            args.commands += read_commands_file(args.commands_file)
+        except (OSError, ValueError) as e:
+            parser.error(str(e))
+    # Print the help if no CSC and COMMAND are defined.
+    if not args.commands:
         parser.print_help()
         exit()
+    for csc, _, _ in args.commands:
+        if csc.split(":")[0] not in utils.cscs:
+            print(
+                f"Invalid CSC: {csc.split(':')[0]}. "
+                f"Perhaps it is misspelled or not properly capitalized."
+            )
+            parser.print_help()
+            exit()
     main(args)
 
 
 def main(opts: argparse.Namespace) -> None:
     # Ensure the invocation is correct.
     # If not, raise KeyError.
-    # If it is correct, execute the command.
+    # If it is correct, execute the commands.
     try:
         script_class = RunCommand(
             sq_index=opts.sq_index,
-            csc=opts.csc,
-            command=opts.command,
-            parameters=opts.parameters,
+            queue_placement=opts.queue_placement,
+            inject=opts.inject,
+            commands=opts.commands,
         )
-    except KeyError as ke:
-        print(repr(ke))
+    except (KeyError, ValueError) as e:
+        print(repr(e))
     else:
-        print(
-            f"\nExecuting the {opts.command} command "
-            f"for the {opts.csc} CSC."
-            f"\nRunning on ScriptQueue {opts.sq_index}."
-            f"\nParameters: {script_class.parameters}."
-        )
-        asyncio.run(script_class.run())
+        print(f"\nRunning on ScriptQueue {opts.sq_index}.")
+        for csc, command, parameters in script_class.commands:
+            print(
+                f"Executing the {command} command for the {csc} CSC."
+                f"\nParameters: {parameters or None}."
+            )
+        script_class.execute()
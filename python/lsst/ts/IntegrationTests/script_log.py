@@ -0,0 +1,187 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# This file is part of ts_IntegrationTests.
+#
+# Developed for the Vera C. Rubin Observatory Telescope & Site Software system.
+# This product includes software developed by the Vera C. Rubin Observatory
+# Project (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+__all__ = [
+    "JsonFormatter",
+    "ProgressRateLimiter",
+    "configure_logging",
+    "stop_logging",
+    "ensure_logging_configured",
+]
+
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import time
+from typing import IO
+
+# The logger of the package; the BaseScript loggers are its children.
+PACKAGE_LOGGER_NAME = "lsst.ts.IntegrationTests"
+
+# The attributes of every LogRecord. The other attributes are the extra
+# fields given to the logging call, and are added to the JSON output.
+RECORD_ATTRIBUTES = frozenset(
+    logging.LogRecord("", 0, "", 0, "", None, None).__dict__
+) | {"message", "asctime", "progress"}
+
+# The listener writing the queued log records, if logging is configured.
+listener: logging.handlers.QueueListener | None = None
+
+
+class JsonFormatter(logging.Formatter):
+    """Format each log record as one JSON object per line.
+
+    The object holds the time (unix seconds), level, logger name and
+    message, plus the extra fields given to the logging call, e.g.
+    ``log.info("Script done", extra={"script_index": 3})``.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        output = dict(
+            time=record.created,
+            level=record.levelname,
+            name=record.name,
+            message=record.getMessage(),
+        )
+        for key, value in record.__dict__.items():
+            if key not in RECORD_ATTRIBUTES:
+                output[key] = value
+        if record.exc_info:
+            output["exception"] = self.formatException(record.exc_info)
+        return json.dumps(output, default=str)
+
+
+class ProgressRateLimiter(logging.Filter):
+    """Drop the progress records logged too soon after the last one
+    with the same message format.
+
+    A record is a progress record if it is logged with
+    ``extra={"progress": True}``. Other records always pass.
+
+    Parameters
+    ----------
+    interval : `float`
+        The minimum time, in seconds, between two progress records with
+        the same message format. 0 lets every record pass.
+    """
+
+    def __init__(self, interval: float) -> None:
+        super().__init__()
+        self.interval = interval
+        self.last_times: dict[str, float] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not getattr(record, "progress", False):
+            return True
+        now = time.monotonic()
+        last_time = self.last_times.get(str(record.msg))
+        if last_time is not None and now - last_time < self.interval:
+            return False
+        self.last_times[str(record.msg)] = now
+        return True
+
+
+def configure_logging(
+    json_format: bool | None = None,
+    quiet: bool | None = None,
+    progress_interval: float | None = None,
+    stream: IO[str] | None = None,
+) -> None:
+    """Configure the output of the package logger.
+
+    The records are formatted and written by a background thread, so
+    logging never waits for the console.
+
+    Parameters
+    ----------
+    json_format : `bool` or `None`
+        Write one JSON object per line, rather than the plain message.
+        If None, True if TS_INTEGRATION_TESTS_LOG_FORMAT is json.
+    quiet : `bool` or `None`
+        Only write the warnings and errors. If None, True if
+        TS_INTEGRATION_TESTS_LOG_QUIET is set, and not 0.
+    progress_interval : `float` or `None`
+        The minimum time, in seconds, between two progress lines of the
+        same kind; see ProgressRateLimiter. If None, use
+        TS_INTEGRATION_TESTS_PROGRESS_INTERVAL, or 5.
+    stream : ``file`` or `None`
+        The output stream. If None, use sys.stdout.
+    """
+    global listener
+    if json_format is None:
+        json_format = (
+            os.environ.get("TS_INTEGRATION_TESTS_LOG_FORMAT", "").lower() == "json"
+        )
+    if quiet is None:
+        quiet = os.environ.get("TS_INTEGRATION_TESTS_LOG_QUIET", "0") not in ("", "0")
+    if progress_interval is None:
+        progress_interval = float(
+            os.environ.get("TS_INTEGRATION_TESTS_PROGRESS_INTERVAL", 5)
+        )
+    stop_logging()
+
+    stream_handler = logging.StreamHandler(sys.stdout if stream is None else stream)
+    stream_handler.setFormatter(
+        JsonFormatter() if json_format else logging.Formatter("%(message)s")
+    )
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    # Filter before queueing, so dropped records cost nothing more.
+    queue_handler.addFilter(ProgressRateLimiter(progress_interval))
+    logger = logging.getLogger(PACKAGE_LOGGER_NAME)
+    logger.addHandler(queue_handler)
+    logger.setLevel(logging.WARNING if quiet else logging.INFO)
+    logger.propagate = False
+    listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    listener.start()
+
+
+def stop_logging() -> None:
+    """Write the queued log records, and remove the package log handlers
+    added by configure_logging().
+    """
+    global listener
+    if listener is None:
+        return
+    listener.stop()
+    listener = None
+    logger = logging.getLogger(PACKAGE_LOGGER_NAME)
+    for handler in list(logger.handlers):
+        if isinstance(handler, logging.handlers.QueueHandler):
+            logger.removeHandler(handler)
+    logger.propagate = True
+
+
+def ensure_logging_configured() -> None:
+    """Configure the package logger with the defaults, unless it is
+    already configured, by configure_logging() or by the application.
+    """
+    if listener is None and not logging.getLogger(PACKAGE_LOGGER_NAME).handlers:
+        configure_logging()
+
+
+atexit.register(stop_logging)
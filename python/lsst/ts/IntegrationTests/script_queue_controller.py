@@ -20,11 +20,15 @@
 #
 # You should have received a copy of the GNU General Public License
 
+__all__ = ["ScriptQueueController"]
+
 import asyncio
 
 from lsst.ts import salobj
 from lsst.ts.xml.enums.Script import ScriptState
-from lsst.ts.xml.enums.ScriptQueue import ScriptProcessState
+from lsst.ts.xml.enums.ScriptQueue import Location, ScriptProcessState
+
+from .clock import Clock, get_default_clock
 
 
 # Create an inherited class from the controller,
@@ -35,9 +39,15 @@ class ScriptQueueController(salobj.Controller):
     mimic the functions of the real ScriptQueue. The integration test
     scripts are designed to run in a fully stood-up environment.
 
+    Notes
+    -----
+    As the real ScriptQueue, the controller runs the queued scripts one at
+    a time, in queue order, while it is running. It starts running, stops
+    when paused, and scripts added while it is running are executed
+    without a resume command.
     """
 
-    def __init__(self, index: int) -> None:
+    def __init__(self, index: int, clock: Clock | None = None) -> None:
         """Initialize the ScriptQueue Controller.
 
         Parameters
@@ -45,10 +55,32 @@ class ScriptQueueController(salobj.Controller):
         index : `int`
             Defines whether this is a MainTel (index=1)
             or an AuxTel (index=2) controller.
+        clock : `Clock` or `None`
+            The clock timing the scripts. Use a VirtualClock to run the
+            unit tests without sleeping. If None, the default clock;
+            see get_default_clock(). The heartbeat follows the wall clock,
+            as the ScriptQueueSession checks its age against the wall clock.
+        queue_list : `list`
+            The paths of all the scripts added, in the order they were added.
+        queue : `list`
+            The indexes of the scripts waiting to be executed,
+            in execution order.
+        running : `bool`
+            True if the queue is running; False if paused.
+        last_script_index : `int`
+            The index of the last script added. Script indexes
+            increase monotonically, starting at 1.
+        queue_task : `asyncio.Task` or `None`
+            The task executing the queued scripts.
         """
         super().__init__("ScriptQueue", index=index)
         self.index: int = index
+        self.clock: Clock = clock or get_default_clock()
         self.queue_list: list = []
+        self.queue: list[int] = []
+        self.running: bool = True
+        self.last_script_index: int = 0
+        self.queue_task: asyncio.Task | None = None
         self.cmd_pause.callback = self.do_pause
         self.cmd_add.callback = self.do_add
         self.cmd_resume.callback = self.do_resume
@@ -73,14 +105,15 @@ class ScriptQueueController(salobj.Controller):
         self.hb_task = asyncio.create_task(self.pub_hb())
 
     async def do_pause(self, data: tuple) -> None:
-        """Pause the ScriptQueue to add scripts to the queue."""
-        # self.log.info("ScriptQueue paused\n")
-        pass
+        """Pause the ScriptQueue to add scripts to the queue.
+        The script being executed, if any, runs to completion.
+        """
+        self.running = False
 
     async def do_add(self, data: tuple) -> None:
         """Add scripts to the ScriptQueue queue.
         This mock function uses a simple array to mimic the queue.
-        It simply appends the script path to the array.
+        It places the script index in the array at the given location.
 
         Parameters
         ----------
@@ -90,32 +123,74 @@ class ScriptQueueController(salobj.Controller):
             queue.
 
         """
-        # self.log.info("Script: " + data.path)
-        # self.log.info("Location: " + data.location)
         self.queue_list.append(data.path)  # type: ignore
+        self.last_script_index += 1
+        script_index = self.last_script_index
+        await self.load_script(script_index, data.path)  # type: ignore
+        position = self.get_queue_position(
+            data.location, data.locationSalIndex  # type: ignore
+        )
+        self.queue.insert(position, script_index)
+        self.start_queue()
+        return self.salinfo.make_ackcmd(
+            result=str(script_index),
+            ack=salobj.SalRetCode.CMD_COMPLETE,
+            private_seqNum=1001,
+        )
+
+    async def load_script(self, script_index: int, path: str) -> None:
+        """Load and configure the given script. Override this method
+        to mimic other loading behaviors.
+
+        Parameters
+        ----------
+        script_index : `int`
+            The index of the script.
+        path : `str`
+            The path of the script.
+        """
         await self.evt_script.set_write(
-            scriptSalIndex=len(self.queue_list),
+            scriptSalIndex=script_index,
             processState=ScriptProcessState.UNKNOWN,
             scriptState=ScriptState.UNKNOWN,
             force_output=True,
         )
         await self.evt_script.set_write(
-            scriptSalIndex=len(self.queue_list),
+            scriptSalIndex=script_index,
             processState=ScriptProcessState.LOADING,
             scriptState=ScriptState.UNCONFIGURED,
             force_output=True,
         )
         await self.evt_script.set_write(
-            scriptSalIndex=len(self.queue_list),
+            scriptSalIndex=script_index,
             processState=ScriptProcessState.CONFIGURED,
             scriptState=ScriptState.CONFIGURED,
             force_output=True,
         )
-        return self.salinfo.make_ackcmd(
-            result=str(len(self.queue_list)),
-            ack=salobj.SalRetCode.CMD_COMPLETE,
-            private_seqNum=1001,
-        )
+
+    def get_queue_position(self, location: int, location_index: int) -> int:
+        """Get the position in the queue of a new script.
+
+        Parameters
+        ----------
+        location : `int`
+            The ``lsst.ts.xml.enums.ScriptQueue.Location`` of the script.
+        location_index : `int`
+            The index of the script to place the new script before or after.
+            Unknown indexes place the new script last.
+
+        Returns
+        -------
+        position : `int`
+            The position in the queue list.
+        """
+        if location == Location.FIRST:
+            return 0
+        if location in (Location.BEFORE, Location.AFTER):
+            if location_index in self.queue:
+                position = self.queue.index(location_index)
+                return position if location == Location.BEFORE else position + 1
+        return len(self.queue)
 
     async def do_resume(self, data: tuple) -> None:
         """Resume the ScriptQueue after adding the scripts
@@ -123,20 +198,65 @@ class ScriptQueueController(salobj.Controller):
         the scripts.
 
         """
-        # self.log.info("ScriptQueue resumed\n")
-        for script, _ in enumerate(self.queue_list, start=1):
-            await self.evt_script.set_write(
-                scriptSalIndex=script,
-                processState=ScriptProcessState.RUNNING,
-                scriptState=ScriptState.RUNNING,
-            )
-            await asyncio.sleep(0.1)
-            await self.evt_script.set_write(
-                scriptSalIndex=script,
-                processState=ScriptProcessState.DONE,
-                scriptState=ScriptState.DONE,
-                timestampProcessEnd=99999,
-            )
+        self.running = True
+        self.start_queue()
+
+    def start_queue(self) -> None:
+        """Start executing the queued scripts, if the queue is running
+        and not already executing them.
+        """
+        if self.running and (self.queue_task is None or self.queue_task.done()):
+            self.queue_task = asyncio.create_task(self.run_queue())
+
+    async def run_queue(self) -> None:
+        """Execute the queued scripts, one at a time,
+        until the queue is empty or paused.
+        """
+        while self.running and self.queue:
+            await self.execute_script(self.queue.pop(0))
+
+    async def execute_script(self, script_index: int) -> None:
+        """Execute the given script. Override this method
+        to mimic other script outcomes.
+
+        Parameters
+        ----------
+        script_index : `int`
+            The index of the script.
+        """
+        await self.evt_script.set_write(
+            scriptSalIndex=script_index,
+            processState=ScriptProcessState.RUNNING,
+            scriptState=ScriptState.RUNNING,
+        )
+        await self.clock.sleep(0.1)
+        await self.evt_script.set_write(
+            scriptSalIndex=script_index,
+            processState=ScriptProcessState.DONE,
+            scriptState=ScriptState.DONE,
+            timestampProcessEnd=99999,
+        )
+
+    async def reset(self) -> None:
+        """Forget the scripts added so far, and resume the queue,
+        so the controller can be shared by several unit tests.
+        """
+        if self.queue_task is not None:
+            self.queue_task.cancel()
+            self.queue_task = None
+        self.queue_list.clear()
+        self.queue.clear()
+        self.running = True
+        self.last_script_index = 0
+        # Replace the last Script Event, so the Remotes of the next
+        # test do not see a terminal state for a reused script index.
+        await self.evt_script.set_write(
+            scriptSalIndex=0,
+            processState=ScriptProcessState.UNKNOWN,
+            scriptState=ScriptState.UNKNOWN,
+            timestampProcessEnd=0,
+            force_output=True,
+        )
 
     async def close_tasks(self) -> None:
         """This closes the resources for the controller,
@@ -144,6 +264,8 @@ class ScriptQueueController(salobj.Controller):
 
         """
         self.hb_task.cancel()
+        if self.queue_task is not None:
+            self.queue_task.cancel()
         await super().close_tasks()
 
     async def do_move(self) -> None:
@@ -0,0 +1,213 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# This file is part of ts_IntegrationTests.
+#
+# Developed for the Vera C. Rubin Observatory Telescope & Site Software system.
+# This product includes software developed by the Vera C. Rubin Observatory
+# Project (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+__all__ = ["ScriptQueueSession"]
+
+import asyncio
+import functools
+import types
+from collections.abc import Awaitable, Callable
+
+from lsst.ts import salobj
+from lsst.ts.utils import current_tai
+
+ScriptCallback = Callable[[salobj.BaseMsgType], Awaitable[None]]
+
+
+class ScriptQueueSession:
+    """Keep the salobj Domain and the ScriptQueue Remotes alive, so
+    many integration test scripts can share them.
+
+    Notes
+    -----
+    Creating the Domain and the Remote, and waiting for the ScriptQueue
+    heartbeat, takes seconds. A session does this once per ScriptQueue
+    index, so back-to-back BaseScript runs start almost immediately::
+
+        async with ScriptQueueSession() as session:
+            await AuxTelOfflineStandby().run(session=session)
+            await AuxTelStandbyDisabled().run(session=session)
+
+    The session owns the ScriptQueue Script Event (evt_script) callback of
+    each Remote, and forwards every event to the callbacks registered for
+    that ScriptQueue, so several scripts can listen to the same Remote.
+
+    Attributes
+    ----------
+    heartbeat_timeout : `float`
+        The maximum time, in seconds, to wait for a ScriptQueue heartbeat.
+    heartbeat_max_age : `float`
+        The age, in seconds, below which the last heartbeat received is
+        recent enough to show the ScriptQueue is running.
+    """
+
+    # See Attributes for the definition.
+    heartbeat_timeout: float = 30
+    heartbeat_max_age: float = 5
+
+    def __init__(self) -> None:
+        """Initialize the session. The Domain and Remotes are created on
+        first use.
+
+        Parameters
+        ----------
+        domain : `salobj.Domain` or `None`
+            The Domain shared by all the Remotes.
+        remotes : `dict`
+            The ScriptQueue Remotes, keyed by ScriptQueue index.
+        script_callbacks : `dict`
+            The lists of ScriptQueue Script Event callbacks, keyed by
+            ScriptQueue index.
+        """
+        self.domain: salobj.Domain | None = None
+        self.remotes: dict[int, salobj.Remote] = {}
+        self.script_callbacks: dict[int, list[ScriptCallback]] = {}
+        self._remote_locks: dict[int, asyncio.Lock] = {}
+        self._queue_locks: dict[int, asyncio.Lock] = {}
+
+    async def get_remote(self, index: int) -> salobj.Remote:
+        """Get the Remote for the given ScriptQueue, creating it if needed,
+        and ensure the ScriptQueue is running.
+
+        Parameters
+        ----------
+        index : `int`
+            The ScriptQueue index; 1 for MainTel, 2 for AuxTel or 3 for OCS.
+
+        Returns
+        -------
+        remote : `salobj.Remote`
+            The ScriptQueue Remote.
+        """
+        if self.domain is None:
+            self.domain = salobj.Domain()
+        lock = self._remote_locks.setdefault(index, asyncio.Lock())
+        async with lock:
+            remote = self.remotes.get(index)
+            if remote is None:
+                remote = salobj.Remote(
+                    domain=self.domain, name="ScriptQueue", index=index
+                )
+                await remote.start_task
+                remote.evt_script.callback = functools.partial(
+                    self.dispatch_script, index
+                )
+                self.remotes[index] = remote
+            await self.wait_for_heartbeat(remote)
+        return remote
+
+    async def wait_for_heartbeat(self, remote: salobj.Remote) -> None:
+        """Ensure the ScriptQueue is running.
+
+        If the last heartbeat received is recent, return immediately.
+        Otherwise, wait for the next heartbeat.
+
+        Parameters
+        ----------
+        remote : `salobj.Remote`
+            The ScriptQueue Remote.
+        """
+        data = remote.evt_heartbeat.get()
+        if (
+            data is not None
+            and current_tai() - data.private_sndStamp < self.heartbeat_max_age
+        ):
+            return
+        await remote.evt_heartbeat.next(flush=True, timeout=self.heartbeat_timeout)
+
+    def queue_lock(self, index: int) -> asyncio.Lock:
+        """Get the lock used to run one BaseScript at a time on the
+        given ScriptQueue.
+
+        Parameters
+        ----------
+        index : `int`
+            The ScriptQueue index.
+
+        Returns
+        -------
+        lock : `asyncio.Lock`
+            The lock for the given ScriptQueue.
+        """
+        return self._queue_locks.setdefault(index, asyncio.Lock())
+
+    def add_script_callback(self, index: int, callback: ScriptCallback) -> None:
+        """Register a callback for the given ScriptQueue Script Event.
+
+        Parameters
+        ----------
+        index : `int`
+            The ScriptQueue index.
+        callback : ``callable``
+            A coroutine function that takes the evt_script data.
+        """
+        self.script_callbacks.setdefault(index, []).append(callback)
+
+    def remove_script_callback(self, index: int, callback: ScriptCallback) -> None:
+        """Unregister a callback for the given ScriptQueue Script Event.
+
+        Parameters
+        ----------
+        index : `int`
+            The ScriptQueue index.
+        callback : ``callable``
+            The callback given to add_script_callback().
+        """
+        callbacks = self.script_callbacks.get(index, [])
+        if callback in callbacks:
+            callbacks.remove(callback)
+
+    async def dispatch_script(self, index: int, data: salobj.BaseMsgType) -> None:
+        """Forward the ScriptQueue Script Event to the registered callbacks.
+
+        Parameters
+        ----------
+        index : `int`
+            The ScriptQueue index.
+        data : ``lsst.ts.salobj.BaseMsgType``
+            The object returned by the ScriptQueue Script Event (evt_script).
+        """
+        # Copy the list, as a callback may unregister itself.
+        for callback in list(self.script_callbacks.get(index, [])):
+            await callback(data)
+
+    async def close(self) -> None:
+        """Close the Remotes and the Domain."""
+        for remote in self.remotes.values():
+            await remote.close()
+        self.remotes.clear()
+        self.script_callbacks.clear()
+        if self.domain is not None:
+            await self.domain.close()
+            self.domain = None
+
+    async def __aenter__(self) -> "ScriptQueueSession":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        exc_traceback: types.TracebackType | None,
+    ) -> None:
+        await self.close()
@@ -0,0 +1,361 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# This file is part of ts_IntegrationTests.
+#
+# Developed for the Vera C. Rubin Observatory Telescope & Site Software system.
+# This product includes software developed by the Vera C. Rubin Observatory
+# Project (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+__all__ = [
+    "ScriptDurations",
+    "TimingModel",
+    "FixedTimingModel",
+    "NormalTimingModel",
+    "ReplayTimingModel",
+    "SimulatedScriptQueueController",
+]
+
+import asyncio
+import dataclasses
+import itertools
+import random
+from collections.abc import Iterator
+
+from lsst.ts.xml.enums.Script import ScriptState
+from lsst.ts.xml.enums.ScriptQueue import ScriptProcessState
+
+from .clock import Clock, get_default_clock
+from .results_db import DAY, ResultsDatabase
+from .script_queue_controller import ScriptQueueController
+
+
+@dataclasses.dataclass
+class ScriptDurations:
+    """The simulated durations, in seconds, of the phases of a script.
+
+    Attributes
+    ----------
+    load : `float`
+        The time to load the script, from LOADING to UNCONFIGURED.
+    configure : `float`
+        The time to configure the script, from UNCONFIGURED to CONFIGURED.
+    run : `float`
+        The time to run the script, from RUNNING to DONE.
+    """
+
+    load: float = 0.0
+    configure: float = 0.0
+    run: float = 0.1
+
+
+class TimingModel:
+    """Give the durations of the scripts run by the simulated ScriptQueue.
+
+    The base model gives the default ScriptDurations to every script.
+    """
+
+    def get_durations(self, path: str) -> ScriptDurations:
+        """Get the durations of the next run of the given script.
+
+        Parameters
+        ----------
+        path : `str`
+            The path of the script, e.g. auxtel/point_azel.py.
+        """
+        return ScriptDurations()
+
+
+class FixedTimingModel(TimingModel):
+    """Give fixed durations to the scripts.
+
+    Parameters
+    ----------
+    durations : `ScriptDurations` or `None`
+        The durations of the scripts not in by_path. If None,
+        the default ScriptDurations.
+    by_path : `dict` or `None`
+        The durations of specific scripts, keyed by script path.
+    """
+
+    def __init__(
+        self,
+        durations: ScriptDurations | None = None,
+        by_path: dict[str, ScriptDurations] | None = None,
+    ) -> None:
+        self.durations = durations or ScriptDurations()
+        self.by_path = by_path or {}
+
+    def get_durations(self, path: str) -> ScriptDurations:
+        return self.by_path.get(path, self.durations)
+
+
+class NormalTimingModel(TimingModel):
+    """Draw the durations of the scripts from normal distributions,
+    truncated at zero.
+
+    Parameters
+    ----------
+    mean : `ScriptDurations`
+        The mean duration of each phase.
+    stddev : `ScriptDurations`
+        The standard deviation of the duration of each phase.
+    seed : `int` or `None`
+        The seed of the random number generator, to repeat a simulation.
+    """
+
+    def __init__(
+        self,
+        mean: ScriptDurations,
+        stddev: ScriptDurations,
+        seed: int | None = None,
+    ) -> None:
+        self.mean = mean
+        self.stddev = stddev
+        self.random = random.Random(seed)
+
+    def get_durations(self, path: str) -> ScriptDurations:
+        return ScriptDurations(
+            **{
+                field.name: max(
+                    0.0,
+                    self.random.gauss(
+                        getattr(self.mean, field.name),
+                        getattr(self.stddev, field.name),
+                    ),
+                )
+                for field in dataclasses.fields(ScriptDurations)
+            }
+        )
+
+
+class ReplayTimingModel(TimingModel):
+    """Replay the durations recorded for each script, in turn.
+
+    Parameters
+    ----------
+    load : `dict`
+        The recorded load durations, keyed by script path.
+        The load duration covers both loading and configuring.
+    run : `dict`
+        The recorded run durations, keyed by script path.
+    default : `ScriptDurations` or `None`
+        The durations of the scripts with no recorded duration.
+        If None, the default ScriptDurations.
+
+    Notes
+    -----
+    When the recorded durations of a script are exhausted,
+    they are replayed from the start.
+    """
+
+    def __init__(
+        self,
+        load: dict[str, list[float]],
+        run: dict[str, list[float]],
+        default: ScriptDurations | None = None,
+    ) -> None:
+        self.default = default or ScriptDurations()
+        self.load: dict[str, Iterator[float]] = {
+            path: itertools.cycle(durations)
+            for path, durations in load.items()
+            if durations
+        }
+        self.run: dict[str, Iterator[float]] = {
+            path: itertools.cycle(durations)
+            for path, durations in run.items()
+            if durations
+        }
+
+    @classmethod
+    def from_results_db(
+        cls,
+        results_db: ResultsDatabase,
+        days: float | None = None,
+        now: float | None = None,
+        default: ScriptDurations | None = None,
+    ) -> "ReplayTimingModel":
+        """Create a model replaying the durations of a results database.
+
+        Parameters
+        ----------
+        results_db : `ResultsDatabase`
+            The results database.
+        days : `float` or `None`
+            Only replay the runs started in this many days before now.
+            If None, replay all the runs.
+        now : `float` or `None`
+            The end of the time range, as TAI unix seconds.
+            If None, all the runs up to the present.
+        default : `ScriptDurations` or `None`
+            The durations of the scripts with no recorded duration.
+        """
+        start_time = None
+        if days is not None:
+            if now is None:
+                now = get_default_clock().time()
+            start_time = now - days * DAY
+        return cls(
+            load=results_db.get_durations("load", start_time, now),
+            run=results_db.get_durations("run", start_time, now),
+            default=default,
+        )
+
+    def get_durations(self, path: str) -> ScriptDurations:
+        load = self.load.get(path)
+        run = self.run.get(path)
+        return ScriptDurations(
+            load=self.default.load if load is None else next(load),
+            configure=self.default.configure if load is None else 0.0,
+            run=self.default.run if run is None else next(run),
+        )
+
+
+class SimulatedScriptQueueController(ScriptQueueController):
+    """Define a ScriptQueue controller that simulates the time taken to
+    load, configure and run each script.
+
+    Use this to benchmark the orchestration overhead of the integration
+    test scripts, or to model a night of scripts in seconds.
+
+    Notes
+    -----
+    As the real ScriptQueue, the controller acknowledges the add command
+    as soon as the script is created, then loads and configures the
+    script in the background. A queued script only runs once configured.
+    """
+
+    def __init__(
+        self,
+        index: int,
+        timing_model: TimingModel | None = None,
+        clock: Clock | None = None,
+    ) -> None:
+        """Initialize the Simulated ScriptQueue Controller.
+
+        Parameters
+        ----------
+        index : `int`
+            Defines whether this is a MainTel (index=1)
+            or an AuxTel (index=2) controller.
+        timing_model : `TimingModel` or `None`
+            Gives the durations of each script. If None, the
+            default ScriptDurations of every script.
+        clock : `Clock` or `None`
+            The clock of the simulated time. Use Clock(time_scale) to
+            accelerate time, or VirtualClock() to run at CPU speed.
+            If None, the default clock; see get_default_clock().
+        durations : `dict`
+            The ScriptDurations of each script, keyed by script index.
+        """
+        super().__init__(index, clock=clock)
+        self.timing_model: TimingModel = timing_model or TimingModel()
+        self.durations: dict[int, ScriptDurations] = {}
+        self._configured: dict[int, asyncio.Future] = {}
+        self._load_tasks: set[asyncio.Task] = set()
+
+    async def load_script(self, script_index: int, path: str) -> None:
+        """Start loading and configuring the given script.
+
+        Parameters
+        ----------
+        script_index : `int`
+            The index of the script.
+        path : `str`
+            The path of the script.
+        """
+        self.durations[script_index] = self.timing_model.get_durations(path)
+        self._configured[script_index] = asyncio.get_running_loop().create_future()
+        await self.evt_script.set_write(
+            scriptSalIndex=script_index,
+            path=path,
+            processState=ScriptProcessState.UNKNOWN,
+            scriptState=ScriptState.UNKNOWN,
+            force_output=True,
+        )
+        task = asyncio.create_task(self.configure_script(script_index))
+        self._load_tasks.add(task)
+        task.add_done_callback(self._load_tasks.discard)
+
+    async def configure_script(self, script_index: int) -> None:
+        """Load and configure the given script, in simulated time.
+
+        Parameters
+        ----------
+        script_index : `int`
+            The index of the script.
+        """
+        durations = self.durations[script_index]
+        await self.evt_script.set_write(
+            scriptSalIndex=script_index,
+            processState=ScriptProcessState.LOADING,
+            scriptState=ScriptState.UNKNOWN,
+            force_output=True,
+        )
+        await self.clock.sleep(durations.load)
+        await self.evt_script.set_write(
+            scriptSalIndex=script_index,
+            processState=ScriptProcessState.LOADING,
+            scriptState=ScriptState.UNCONFIGURED,
+            force_output=True,
+        )
+        await self.clock.sleep(durations.configure)
+        await self.evt_script.set_write(
+            scriptSalIndex=script_index,
+            processState=ScriptProcessState.CONFIGURED,
+            scriptState=ScriptState.CONFIGURED,
+            timestampConfigureEnd=self.clock.time(),
+            force_output=True,
+        )
+        self._configured[script_index].set_result(None)
+
+    async def execute_script(self, script_index: int) -> None:
+        """Run the given script, in simulated time, once configured.
+
+        Parameters
+        ----------
+        script_index : `int`
+            The index of the script.
+        """
+        await self._configured[script_index]
+        await self.evt_script.set_write(
+            scriptSalIndex=script_index,
+            processState=ScriptProcessState.RUNNING,
+            scriptState=ScriptState.RUNNING,
+            timestampRunStart=self.clock.time(),
+        )
+        await self.clock.sleep(self.durations[script_index].run)
+        await self.evt_script.set_write(
+            scriptSalIndex=script_index,
+            processState=ScriptProcessState.DONE,
+            scriptState=ScriptState.DONE,
+            timestampProcessEnd=self.clock.time(),
+        )
+
+    async def reset(self) -> None:
+        """Forget the scripts added so far, including those loading."""
+        for task in list(self._load_tasks):
+            task.cancel()
+        self.durations.clear()
+        self._configured.clear()
+        await super().reset()
+
+    async def close_tasks(self) -> None:
+        """Stop loading the scripts, then close the controller."""
+        for task in list(self._load_tasks):
+            task.cancel()
+        await super().close_tasks()
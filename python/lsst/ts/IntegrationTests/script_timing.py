@@ -0,0 +1,227 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# This file is part of ts_IntegrationTests.
+#
+# Developed for the Vera C. Rubin Observatory Telescope & Site Software system.
+# This product includes software developed by the Vera C. Rubin Observatory
+# Project (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+__all__ = ["ScriptTiming", "RunTiming", "get_config_hash"]
+
+import dataclasses
+import hashlib
+import json
+import uuid
+from typing import Any
+
+from lsst.ts.xml.enums.Script import ScriptState
+from lsst.ts.xml.enums.ScriptQueue import ScriptProcessState
+
+from . import utils
+
+
+def get_config_hash(config: str) -> str:
+    """Return a short hash identifying the given script configuration."""
+    return hashlib.sha256(config.encode()).hexdigest()[:16]
+
+
+def get_duration(start: float | None, end: float | None) -> float | None:
+    """Return end - start, or None if either time is unknown."""
+    if start is None or end is None:
+        return None
+    return end - start
+
+
+@dataclasses.dataclass
+class ScriptTiming:
+    """The timeline of one script run by a BaseScript.
+
+    All times are TAI unix seconds, as seen by the BaseScript.
+
+    Attributes
+    ----------
+    script_index : `int`
+        The script index returned by the ScriptQueue.
+    path : `str`
+        The script path.
+    is_standard : `bool`
+        True for a Standard script, False for an External script.
+    add_time : `float`
+        The time the add command was issued.
+    ack_time : `float`
+        The time the add command was acknowledged.
+    state_times : `dict`
+        The time each ScriptProcessState was first seen, keyed by name,
+        e.g. LOADING, CONFIGURED, RUNNING and DONE.
+    config_hash : `str`
+        A hash of the script configuration; see get_config_hash().
+    script_state : `int` or `None`
+        The final ScriptState, if the script finished.
+    """
+
+    script_index: int
+    path: str
+    is_standard: bool
+    add_time: float
+    ack_time: float
+    state_times: dict[str, float] = dataclasses.field(default_factory=dict)
+    config_hash: str = ""
+    script_state: int | None = None
+
+    @property
+    def end_time(self) -> float | None:
+        """The time a terminal ScriptProcessState was first seen."""
+        times = [
+            self.state_times[state.name]
+            for state in utils.terminal_states
+            if state.name in self.state_times
+        ]
+        return min(times) if times else None
+
+    @property
+    def add_duration(self) -> float:
+        """The time taken by the add command."""
+        return self.ack_time - self.add_time
+
+    @property
+    def load_duration(self) -> float | None:
+        """The time taken to load and configure the script."""
+        return get_duration(
+            self.state_times.get(ScriptProcessState.LOADING.name),
+            self.state_times.get(ScriptProcessState.CONFIGURED.name),
+        )
+
+    @property
+    def queued_duration(self) -> float | None:
+        """The time the configured script waited to run."""
+        return get_duration(
+            self.state_times.get(ScriptProcessState.CONFIGURED.name),
+            self.state_times.get(ScriptProcessState.RUNNING.name),
+        )
+
+    @property
+    def run_duration(self) -> float | None:
+        """The time taken to run the script."""
+        return get_duration(
+            self.state_times.get(ScriptProcessState.RUNNING.name), self.end_time
+        )
+
+    def record(self, process_state: int, time: float) -> None:
+        """Record the first time the given ScriptProcessState is seen.
+
+        Parameters
+        ----------
+        process_state : `int`
+            The ScriptProcessState.
+        time : `float`
+            The time the state was seen.
+        """
+        self.state_times.setdefault(ScriptProcessState(process_state).name, time)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the timeline, and the duration of each phase,
+        as a JSON-serializable dict.
+        """
+        return dict(
+            script_index=self.script_index,
+            path=self.path,
+            is_standard=self.is_standard,
+            config_hash=self.config_hash,
+            script_state=(
+                None
+                if self.script_state is None
+                else ScriptState(self.script_state).name
+            ),
+            add_time=self.add_time,
+            ack_time=self.ack_time,
+            state_times=self.state_times,
+            add_duration=self.add_duration,
+            load_duration=self.load_duration,
+            queued_duration=self.queued_duration,
+            run_duration=self.run_duration,
+        )
+
+
+@dataclasses.dataclass
+class RunTiming:
+    """The timeline of one BaseScript run.
+
+    All times are TAI unix seconds.
+
+    Attributes
+    ----------
+    name : `str`
+        The name of the BaseScript class.
+    index : `int`
+        The ScriptQueue index.
+    run_id : `str`
+        A unique identifier of the run.
+    start_time : `float` or `None`
+        The time the run started.
+    end_time : `float` or `None`
+        The time the run ended.
+    pause_duration : `float` or `None`
+        The time taken by the ScriptQueue pause command.
+    resume_duration : `float` or `None`
+        The time taken by the ScriptQueue resume command.
+    scripts : `list`
+        The ScriptTiming of each script added, in the order of the
+        scripts list.
+    """
+
+    name: str
+    index: int
+    run_id: str = dataclasses.field(default_factory=lambda: uuid.uuid4().hex)
+    start_time: float | None = None
+    end_time: float | None = None
+    pause_duration: float | None = None
+    resume_duration: float | None = None
+    scripts: list[ScriptTiming] = dataclasses.field(default_factory=list)
+
+    @property
+    def duration(self) -> float | None:
+        """The time taken by the run."""
+        return get_duration(self.start_time, self.end_time)
+
+    def to_dicts(self) -> list[dict[str, Any]]:
+        """Return one JSON-serializable dict per script, each including
+        the run information.
+        """
+        run = dict(
+            run_id=self.run_id,
+            name=self.name,
+            queue_index=self.index,
+            start_time=self.start_time,
+            end_time=self.end_time,
+            duration=self.duration,
+            pause_duration=self.pause_duration,
+            resume_duration=self.resume_duration,
+        )
+        return [dict(run, **script.to_dict()) for script in self.scripts]
+
+    def write_json_lines(self, path: str) -> None:
+        """Append the timeline to the given file, one JSON line per script.
+
+        Parameters
+        ----------
+        path : `str`
+            The JSON lines file.
+        """
+        with open(path, "a") as json_file:
+            for record in self.to_dicts():
+                json_file.write(json.dumps(record) + "\n")
@@ -21,7 +21,46 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import subprocess
+__all__ = [
+    "lint_yaml",
+    "assert_yaml_formatted",
+    "assert_all_yaml_formatted",
+    "logging_statement",
+]
+
+import functools
+from collections.abc import Mapping
+
+from yamllint import linter
+from yamllint.config import YamlLintConfig
+
+
+@functools.cache
+def get_yamllint_config() -> YamlLintConfig:
+    """Get the yamllint configuration; the yamllint defaults, as used by
+    ``yamllint -``.
+    """
+    return YamlLintConfig("extends: default")
+
+
+def lint_yaml(yaml_string: str) -> list[str]:
+    """Lint the given string with yamllint, in this process.
+
+    Parameters
+    ----------
+    yaml_string : `str`
+        String, either stdin or printed content from a file.
+
+    Returns
+    -------
+    problems : `list`
+        The warnings and errors found by yamllint, each formatted as
+        level line:column: description (rule).
+    """
+    return [
+        f"{problem.level} {problem}"
+        for problem in linter.run(yaml_string, get_yamllint_config())
+    ]
 
 
 def assert_yaml_formatted(reference: str, yaml_string: str) -> None:
@@ -29,7 +68,7 @@ def assert_yaml_formatted(reference: str, yaml_string: str) -> None:
 
     To call this from a unit test (see ``tests/test_yaml.py``)::
 
-        IntegrationTests.assert_yaml_formatted(yaml_string)
+        IntegrationTests.assert_yaml_formatted(reference, yaml_string)
 
     Parameters
     ----------
@@ -42,26 +81,38 @@ def assert_yaml_formatted(reference: str, yaml_string: str) -> None:
     ------
     AssertionError
         If string not formatted properly as assessed by ``yamllint``.
+    """
+    assert_all_yaml_formatted({reference: yaml_string})
+
+
+def assert_all_yaml_formatted(yaml_strings: Mapping[str, str]) -> None:
+    """Assert that all the given strings are properly yaml formatted.
+
+    To check every configuration of the registry in one call (see
+    ``tests/test_yaml.py``)::
+
+        IntegrationTests.assert_all_yaml_formatted(registry)
 
-    Notes
-    -----
-    Yamllint works with files or stdin, but the invocation syntax is
-    different. Most instances in the integration testing will be
-    strings, so this test uses the stdin invocation.
+    Parameters
+    ----------
+    yaml_strings : `dict`
+        The strings to check, keyed by the reference used to identify them.
+
+    Raises
+    ------
+    AssertionError
+        If any string is not formatted properly as assessed by ``yamllint``.
+        The message lists every badly formatted string.
     """
-    args = ["yamllint", "-"]
-    byte_string = bytes(yaml_string, "utf-8")
-    child_proccess = subprocess.Popen(
-        args, stdin=subprocess.PIPE, stdout=subprocess.PIPE
-    )
-    child_proccess.stdin.write(byte_string)  # type: ignore
-    result = child_proccess.communicate()[0]  # type: bytes
-    result_str = result.decode("utf-8")  # type: str
-    child_proccess.stdin.close()  # type: ignore
-    if any(exception in result_str for exception in ("warning", "error")):
-        raise AssertionError(
-            f"Bad YAML\n\n{reference!r}:\n'{yaml_string!r}'\n\n{result!r}"
-        )  # type: ignore
+    failures = []
+    for reference, yaml_string in yaml_strings.items():
+        problems = lint_yaml(yaml_string)
+        if problems:
+            failures.append(
+                f"{reference!r}:\n'{yaml_string!r}'\n\n" + "\n".join(problems)
+            )
+    if failures:
+        raise AssertionError("Bad YAML\n\n" + "\n\n".join(failures))
 
 
 def logging_statement(statement: str) -> None:
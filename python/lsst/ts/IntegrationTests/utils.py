@@ -20,6 +20,14 @@
 #
 # You should have received a copy of the GNU General Public License
 
+__all__ = [
+    "cscs",
+    "csc_states",
+    "processing_states",
+    "terminal_states",
+    "get_test_env_arg",
+]
+
 import argparse
 
 from lsst.ts.xml.enums.ScriptQueue import ScriptProcessState
@@ -21,13 +21,229 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import asyncio
+import atexit
 import os
+import threading
 import unittest
+from typing import Any
 
 from lsst.ts import salobj
-from lsst.ts.IntegrationTests import ScriptQueueController
+from lsst.ts.IntegrationTests import (
+    Clock,
+    ScriptQueueController,
+    VirtualClock,
+    set_default_clock,
+)
 from lsst.ts.salobj.delete_topics import DeleteTopics, DeleteTopicsArgs
-from lsst.ts.xml import subsystems
+
+# Time the tests with a VirtualClock, unless told to use the wall clock.
+VIRTUAL_TIME = not os.environ.get("TS_INTEGRATION_TESTS_REAL_TIME")
+# The real time, in seconds, taken by each step of the VirtualClock.
+STEP_DELAY = 0.01
+
+
+class ControllerPool:
+    """Keep the ScriptQueue controllers running for the whole test session,
+    so the test cases share them rather than each starting its own.
+
+    Notes
+    -----
+    Each test case runs in its own event loop, so the controllers run in
+    the event loop of a background thread, and the test cases talk to them
+    through SAL, as to the real ScriptQueue.
+
+    The controllers of the same class, keyword arguments and clock share a
+    topic subname, so a test can use several ScriptQueue indexes. Controllers
+    of different classes, keyword arguments or clocks, e.g.
+    FailingScriptQueueController with different test types, get their own
+    subname, so they do not answer each other's commands.
+
+    The tests can run in parallel with pytest-xdist (pytest -n auto).
+    Each worker process has its own pool, and the subnames include the
+    worker id, so the workers never see each other's ScriptQueue Script
+    Events, even if the random part of the subnames were to collide.
+
+    The controllers are closed at exit. Then the topics of the components
+    used, rather than of every subsystem, are deleted for all the subnames
+    at once.
+
+    Attributes
+    ----------
+    controllers : `dict`
+        The controllers, keyed by class, keyword arguments, clock settings
+        and index.
+    subnames : `dict`
+        The topic subnames of the controllers, keyed by class, keyword
+        arguments and clock settings.
+    topic_subnames : `list`
+        All the topic subnames used, whose topics are deleted at exit.
+    components : `set`
+        The names of the SAL components used, e.g. ScriptQueue,
+        whose topics are deleted at exit.
+    clocks : `dict`
+        The clocks of the controllers, keyed by (virtual_time, step_delay);
+        see BaseTestClass. The test cases time the BaseScript timeouts
+        with the clock of their controller, so the scripts and the timeouts
+        share one virtual time.
+    """
+
+    def __init__(self) -> None:
+        self.controllers: dict[tuple, ScriptQueueController] = {}
+        self.subnames: dict[tuple, str] = {}
+        self.topic_subnames: list[str] = []
+        self.components: set[str] = set()
+        self.prefix: str = ""
+        self.loop: asyncio.AbstractEventLoop | None = None
+        self.thread: threading.Thread | None = None
+        self.clocks: dict[tuple[bool, float], Clock] = {}
+
+    async def get_controller(
+        self,
+        controller_class: type[ScriptQueueController],
+        index: int,
+        virtual_time: bool = VIRTUAL_TIME,
+        step_delay: float = STEP_DELAY,
+        **kwargs: Any,
+    ) -> ScriptQueueController:
+        """Get the running controller, reset for a new test, and set
+        LSST_TOPIC_SUBNAME to its subname.
+
+        Parameters
+        ----------
+        controller_class : `type`
+            ScriptQueueController or one of its sub-Classes.
+        index : `int`
+            The ScriptQueue index.
+        virtual_time : `bool`
+            Time the controller with a VirtualClock, rather than the
+            wall clock.
+        step_delay : `float`
+            The real time, in seconds, taken by each step of the
+            VirtualClock.
+        **kwargs : `dict`, optional
+            Additional keyword arguments for the controller constructor.
+        """
+        clock_settings = (virtual_time, step_delay if virtual_time else 0.0)
+        variant = (controller_class, tuple(sorted(kwargs.items())), clock_settings)
+        if variant not in self.subnames:
+            self.subnames[variant] = self.new_subname()
+        os.environ["LSST_TOPIC_SUBNAME"] = self.subnames[variant]
+        key = (*variant, index)
+        controller = self.controllers.get(key)
+        if controller is None:
+            controller = await self.run(
+                self.start_controller(controller_class, index, clock_settings, kwargs)
+            )
+            self.controllers[key] = controller
+        else:
+            await self.run(controller.reset())
+        return controller
+
+    def new_subname(self) -> str:
+        """Return a new topic subname, deleted at exit,
+        and set LSST_TOPIC_SUBNAME to it.
+        """
+        if not self.prefix:
+            salobj.set_test_topic_subname()
+            self.prefix = os.environ["LSST_TOPIC_SUBNAME"]
+            # Set by pytest-xdist in each worker, e.g. gw0.
+            worker = os.environ.get("PYTEST_XDIST_WORKER")
+            if worker:
+                self.prefix += f"_{worker}"
+            atexit.register(self.close)
+        subname = f"{self.prefix}_{len(self.topic_subnames)}"
+        self.topic_subnames.append(subname)
+        os.environ["LSST_TOPIC_SUBNAME"] = subname
+        return subname
+
+    async def run(self, coroutine: Any) -> Any:
+        """Run the coroutine in the event loop of the controllers."""
+        if self.loop is None:
+            self.loop = asyncio.new_event_loop()
+            self.thread = threading.Thread(
+                target=self.loop.run_forever, name="ControllerPool", daemon=True
+            )
+            self.thread.start()
+        return await asyncio.wrap_future(
+            asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+        )
+
+    async def start_controller(
+        self,
+        controller_class: type[ScriptQueueController],
+        index: int,
+        clock_settings: tuple[bool, float],
+        kwargs: dict[str, Any],
+    ) -> ScriptQueueController:
+        """Create and start a controller, in the event loop of
+        the controllers, with the clock of the given
+        (virtual_time, step_delay) settings.
+        """
+        controller = controller_class(
+            index=index, clock=self.get_clock(clock_settings), **kwargs
+        )
+        self.components.add(controller.salinfo.name)
+        await controller.start_task
+        return controller
+
+    def get_clock(self, clock_settings: tuple[bool, float]) -> Clock:
+        """Get the clock of the given (virtual_time, step_delay) settings,
+        shared by the controllers and the test cases using them.
+        """
+        clock = self.clocks.get(clock_settings)
+        if clock is None:
+            virtual_time, step_delay = clock_settings
+            clock = VirtualClock(step_delay=step_delay) if virtual_time else Clock()
+            self.clocks[clock_settings] = clock
+        return clock
+
+    async def close_controllers(self) -> None:
+        """Close the controllers, then delete the topics of the
+        components used, for all the subnames concurrently.
+        """
+        for controller in self.controllers.values():
+            await controller.close()
+        self.controllers.clear()
+        if not self.components:
+            return
+        delete_topics = await DeleteTopics.new()
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(
+            *[
+                loop.run_in_executor(
+                    None,
+                    delete_topics.execute,
+                    DeleteTopicsArgs(
+                        all_topics=False,
+                        subname=subname,
+                        force=False,
+                        dry=False,
+                        log_level=None,
+                        components=sorted(self.components),
+                    ),
+                )
+                for subname in self.topic_subnames
+            ]
+        )
+
+    def close(self) -> None:
+        """Close the controllers, delete their topics,
+        and stop the background thread.
+        """
+        if self.loop is None:
+            # Only subnames were used; delete their topics.
+            asyncio.run(self.close_controllers())
+            return
+        asyncio.run_coroutine_threadsafe(self.close_controllers(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()  # type: ignore
+        self.loop.close()
+        self.loop = None
+
+
+# The controllers shared by all the test cases.
+controller_pool = ControllerPool()
 
 
 class BaseTestClass(unittest.IsolatedAsyncioTestCase):
@@ -42,44 +258,51 @@ class BaseTestClass(unittest.IsolatedAsyncioTestCase):
     if necessary.
     The BaseTest class defaults to index=1, as the most common option.
 
+    The ScriptQueue controller is shared with the other test cases using
+    the same controller_class, controller_kwargs and index; see
+    ControllerPool. It is reset before each test.
+
     Attributes
     ----------
     index : `int`
         The index represents the ScriptQueue for Main Telescope, index=1,
         the Auxilliary Telescope, index=2, or OCS, index=3.
+    controller_class : `type`
+        The ScriptQueue controller class, e.g. FailingScriptQueueController.
+    controller_kwargs : `dict`
+        Additional keyword arguments for the controller constructor,
+        e.g. dict(test_type="FAILED").
+    virtual_time : `bool`
+        Time the ScriptQueue controllers and the BaseScript timeouts with
+        a VirtualClock, so the tests run at CPU speed rather than waiting
+        for the scripts and the timeouts. The default is
+        True, unless the TS_INTEGRATION_TESTS_REAL_TIME environment
+        variable is set.
+    step_delay : `float`
+        The real time, in seconds, taken by each step of the VirtualClock.
+        This gives the SAL messages time to arrive.
 
     """
 
     # See Attributes for the definition.
     index: int = 1
+    controller_class: type[ScriptQueueController] = ScriptQueueController
+    controller_kwargs: dict[str, Any] = {}
+    virtual_time: bool = VIRTUAL_TIME
+    step_delay: float = STEP_DELAY
 
-    async def asyncSetUp(self) -> None:
-        # Define LSST_TOPIC_SUBNAME.
-        salobj.set_test_topic_subname()
-
-        # Create the ScriptQueue Controller.
-        self.controller = ScriptQueueController(index=self.index)
-
-        # Start the controller and wait for it be ready.
-        await self.controller.start_task
-
-    async def asyncTearDown(self) -> None:
-        # Close the controller.
-        await self.controller.close()
-        await self.controller.done_task
-
-        # Cleanup topics
-        topic_subname = os.environ["LSST_TOPIC_SUBNAME"]
+    def tearDown(self) -> None:
+        set_default_clock(None)
 
-        delete_topics = await DeleteTopics.new()
-
-        delete_topics_args = DeleteTopicsArgs(
-            all_topics=False,
-            subname=topic_subname,
-            force=False,
-            dry=False,
-            log_level=None,
-            components=subsystems,
+    async def asyncSetUp(self) -> None:
+        # Get the ScriptQueue Controller, reset for this test.
+        # This also defines LSST_TOPIC_SUBNAME.
+        self.controller = await controller_pool.get_controller(
+            self.controller_class,
+            self.index,
+            virtual_time=self.virtual_time,
+            step_delay=self.step_delay,
+            **self.controller_kwargs,
         )
-
-        delete_topics.execute(delete_topics_args)
+        # Time the BaseScript timeouts with the clock of the controller.
+        set_default_clock(self.controller.clock)
@@ -47,3 +47,23 @@ class AuxTelVisitTestCase(BaseTestClass):
         self.assertEqual(len(self.controller.queue_list), num_scripts)
         # Assert scripts passed.
         self.assertEqual(script_class.script_states, [8, 8, 8, 8, 8, 8])
+
+    async def test_auxtel_visit_bulk_add(self) -> None:
+        """Execute the AuxTelVisit integration test script, issuing the
+        ScriptQueue add commands concurrently.
+        """
+        # Instantiate the AuxTelVisit integration tests.
+        script_class = AuxTelVisit()
+        script_class.bulk_add = True
+        script_class.max_in_flight = 4
+        # Get number of scripts
+        num_scripts = len(script_class.scripts)
+        print(f"AuxTel Visit; bulk adding {num_scripts} scripts")
+        # Execute the scripts.
+        await script_class.run()
+        # Assert script was added to ScriptQueue.
+        self.assertEqual(len(self.controller.queue_list), num_scripts)
+        # Assert the script indexes are in the order of the scripts list.
+        self.assertEqual(script_class.script_indexes, [1, 2, 3, 4, 5, 6])
+        # Assert scripts passed.
+        self.assertEqual(script_class.script_states, [8, 8, 8, 8, 8, 8])
@@ -0,0 +1,170 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# This file is part of ts_IntegrationTests.
+#
+# Developed for the Vera C. Rubin Observatory Telescope & Site Software system.
+# This product includes software developed by the Vera C. Rubin Observatory
+# Project (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import argparse
+import os
+import tempfile
+import unittest
+import unittest.mock
+
+from base_test import BaseTestClass
+from lsst.ts.IntegrationTests import (
+    AuxTelDisabledEnabled,
+    AuxTelOfflineStandby,
+    AuxTelStandbyDisabled,
+    AuxTelStop,
+    Campaign,
+    CampaignNode,
+    CampaignReport,
+)
+from lsst.ts.IntegrationTests import campaign as campaign_module
+from lsst.ts.IntegrationTests import run_campaign
+
+
+class CampaignTestCase(BaseTestClass):
+    """Test running a campaign of integration test scripts."""
+
+    # Use AuxTel ScriptQueue.
+    index = 2
+
+    async def test_campaign(self) -> None:
+        """Execute the AuxTel Offline to Enabled state transitions,
+        with the AuxTelStop script running independently.
+        """
+        campaign = Campaign(
+            [
+                CampaignNode("disabled_enabled", AuxTelDisabledEnabled, ("standby",)),
+                CampaignNode("standby", AuxTelStandbyDisabled, ("offline",)),
+                CampaignNode("offline", AuxTelOfflineStandby),
+                CampaignNode("stop", AuxTelStop),
+            ]
+        )
+        report = await run_campaign(campaign)
+        # Assert scripts were added to ScriptQueue.
+        self.assertEqual(len(self.controller.queue_list), 6)
+        # Assert the prerequisites ran first, and all steps passed.
+        self.assertLess(
+            list(report.runs).index("offline"), list(report.runs).index("standby")
+        )
+        self.assertLess(
+            list(report.runs).index("standby"),
+            list(report.runs).index("disabled_enabled"),
+        )
+        self.assertEqual(report.skipped, [])
+        self.assertTrue(report.succeeded, report.format())
+
+    async def test_skip_dependents(self) -> None:
+        """Verify the steps depending on a failed step are skipped."""
+
+        def broken_script() -> AuxTelOfflineStandby:
+            raise RuntimeError("Cannot create the script.")
+
+        campaign = Campaign(
+            [
+                CampaignNode("offline", broken_script),
+                CampaignNode("standby", AuxTelStandbyDisabled, ("offline",)),
+                CampaignNode("disabled_enabled", AuxTelDisabledEnabled, ("standby",)),
+                CampaignNode("stop", AuxTelStop),
+            ]
+        )
+        report = await run_campaign(campaign)
+        # Assert only the independent step ran.
+        self.assertEqual(len(self.controller.queue_list), 1)
+        self.assertEqual(sorted(report.runs), ["offline", "stop"])
+        self.assertIsNotNone(report.runs["offline"].error)
+        self.assertTrue(report.runs["stop"].succeeded)
+        self.assertEqual(report.skipped, ["standby", "disabled_enabled"])
+        self.assertFalse(report.succeeded)
+
+
+class CampaignDefinitionTestCase(unittest.TestCase):
+    """Test the campaign definition checks."""
+
+    def test_from_yaml(self) -> None:
+        """Verify a campaign is created from its Yaml definition."""
+        campaign = Campaign.from_yaml(
+            """
+            steps:
+              - name: standby
+                script: AuxTelStandbyDisabled
+                requires: [offline]
+              - name: offline
+                script: AuxTelOfflineStandby
+            """
+        )
+        self.assertEqual(campaign.order, ["offline", "standby"])
+        self.assertIsInstance(campaign.nodes["standby"].script(), AuxTelStandbyDisabled)
+
+    def test_unknown_script(self) -> None:
+        """Verify an unknown script class raises KeyError."""
+        with self.assertRaises(KeyError):
+            Campaign.from_yaml("steps: [{name: bad, script: NotAScript}]")
+
+    def test_unknown_prerequisite(self) -> None:
+        """Verify an unknown prerequisite raises ValueError."""
+        with self.assertRaises(ValueError):
+            Campaign([CampaignNode("stop", AuxTelStop, ("missing",))])
+
+    def test_cycle(self) -> None:
+        """Verify a prerequisite cycle raises ValueError."""
+        with self.assertRaises(ValueError):
+            Campaign(
+                [
+                    CampaignNode("offline", AuxTelOfflineStandby, ("standby",)),
+                    CampaignNode("standby", AuxTelStandbyDisabled, ("offline",)),
+                ]
+            )
+
+    def run_main(self, campaign_yaml: str) -> int | str | None:
+        """Run the run_campaign command on the given campaign definition,
+        and return its exit status.
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "campaign.yaml")
+            with open(path, "w") as campaign_file:
+                campaign_file.write(campaign_yaml)
+            with self.assertRaises(SystemExit) as cm:
+                campaign_module.main(argparse.Namespace(campaign_file=path))
+        return cm.exception.code
+
+    def test_main_invalid_campaign(self) -> None:
+        """Verify an invalid campaign exits with an error."""
+        self.assertEqual(self.run_main("steps: [{name: bad, script: NotAScript}]"), 1)
+
+    def test_main_malformed_campaign(self) -> None:
+        """Verify malformed campaign Yaml exits with an error."""
+        for campaign_yaml in ("steps: [", "steps: 5", "steps: [stop]"):
+            with self.subTest(campaign_yaml=campaign_yaml):
+                self.assertEqual(self.run_main(campaign_yaml), 1)
+
+    def test_main_failed_campaign(self) -> None:
+        """Verify a campaign with a skipped step exits with an error."""
+        report = CampaignReport(skipped=["stop"])
+        with unittest.mock.patch.object(
+            campaign_module,
+            "run_campaign",
+            new=unittest.mock.AsyncMock(return_value=report),
+        ):
+            self.assertEqual(
+                self.run_main("steps: [{name: stop, script: AuxTelStop}]"), 1
+            )
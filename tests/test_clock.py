@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# This file is part of ts_IntegrationTests.
+#
+# Developed for the Vera C. Rubin Observatory Telescope & Site Software system.
+# This product includes software developed by the Vera C. Rubin Observatory
+# Project (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import asyncio
+import threading
+import time
+import unittest
+
+from lsst.ts.IntegrationTests import (
+    Clock,
+    VirtualClock,
+    get_default_clock,
+    set_default_clock,
+)
+
+
+class ClockTestCase(unittest.IsolatedAsyncioTestCase):
+    """Test the accelerated and virtual clocks."""
+
+    async def test_time_scale(self) -> None:
+        clock = Clock(time_scale=1000)
+        start_time = time.monotonic()
+        await clock.sleep(100)
+        self.assertLess(time.monotonic() - start_time, 1)
+        self.assertGreaterEqual(clock.time() - clock.start_tai, 100)
+        with self.assertRaises(ValueError):
+            Clock(time_scale=0)
+
+    async def test_virtual_clock(self) -> None:
+        clock = VirtualClock(start_tai=0)
+        wake_ups: list[tuple[str, float]] = []
+
+        async def sleep(name: str, duration: float) -> None:
+            await clock.sleep(duration)
+            wake_ups.append((name, clock.time()))
+
+        start_time = time.monotonic()
+        await asyncio.gather(sleep("night", 36000), sleep("a", 1), sleep("b", 30))
+        # Assert the sleeps wake up in order, without waiting.
+        self.assertEqual(wake_ups, [("a", 1), ("b", 30), ("night", 36000)])
+        self.assertLess(time.monotonic() - start_time, 1)
+
+    async def test_virtual_timeout(self) -> None:
+        clock = VirtualClock(start_tai=0)
+        with self.assertRaises(asyncio.TimeoutError):
+            await clock.wait_for(asyncio.Event().wait(), timeout=2)
+        self.assertEqual(clock.time(), 2)
+        self.assertEqual(await clock.wait_for(clock.sleep(1), timeout=2), None)
+        self.assertEqual(clock.time(), 3)
+
+    async def test_virtual_timeout_follows_sleeps(self) -> None:
+        """Ensure a timeout only expires when the sleeps reach it,
+        however long the real time between the sleeps.
+        """
+        clock = VirtualClock(start_tai=0, idle_delay=0.5)
+
+        async def work() -> None:
+            for _ in range(3):
+                await clock.sleep(1)
+                # Take real time, e.g. to send a message, between sleeps.
+                await asyncio.sleep(0.1)
+
+        await clock.wait_for(work(), timeout=5)
+        self.assertEqual(clock.time(), 3)
+        # Assert the timeout expires when the sleep goes past it.
+        with self.assertRaises(asyncio.TimeoutError):
+            await clock.wait_for(clock.sleep(10), timeout=2)
+        self.assertEqual(clock.time(), 5)
+
+    async def test_shared_virtual_clock(self) -> None:
+        """Share a clock with the event loop of another thread."""
+        clock = VirtualClock(start_tai=0, step_delay=0.01, idle_delay=0.1)
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=loop.run_forever, daemon=True)
+        thread.start()
+        try:
+            done = asyncio.Event()
+
+            async def work() -> None:
+                await clock.sleep(30)
+                main_loop.call_soon_threadsafe(done.set)
+
+            main_loop = asyncio.get_running_loop()
+            future = asyncio.run_coroutine_threadsafe(work(), loop)
+            await clock.wait_for(done.wait(), timeout=60)
+            await asyncio.wrap_future(future)
+            self.assertEqual(clock.time(), 30)
+            # Assert a hung wait times out once no sleep is pending.
+            with self.assertRaises(asyncio.TimeoutError):
+                await clock.wait_for(asyncio.Event().wait(), timeout=1)
+            self.assertEqual(clock.time(), 31)
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
+
+    def test_default_clock(self) -> None:
+        clock = VirtualClock()
+        set_default_clock(clock)
+        try:
+            self.assertIs(get_default_clock(), clock)
+        finally:
+            set_default_clock(None)
+        self.assertNotIsInstance(get_default_clock(), VirtualClock)
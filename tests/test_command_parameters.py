@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# This file is part of ts_IntegrationTests.
+#
+# Developed for the Vera C. Rubin Observatory Telescope & Site Software system.
+# This product includes software developed by the Vera C. Rubin Observatory
+# Project (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import unittest
+import unittest.mock
+
+from lsst.ts.IntegrationTests import (
+    ParameterParser,
+    command_parameters,
+    get_parameter_parser,
+    split_parameters,
+)
+
+
+class CommandParametersTestCase(unittest.TestCase):
+    """Test the RunCommand parameter parser."""
+
+    def test_split_parameters(self) -> None:
+        """Split parameters with quoted values and arrays."""
+        self.assertEqual(
+            split_parameters("axis:all, name:'a, b:c', values:[1, 'x,y'], n:\"57\""),
+            [
+                ("axis", "all", False),
+                ("name", "a, b:c", True),
+                ("values", "[1, 'x,y']", False),
+                ("n", "57", True),
+            ],
+        )
+        for parameters in ("axis", "name:'a", "values:[1, 2"):
+            with self.subTest(parameters=parameters):
+                with self.assertRaises(ValueError):
+                    split_parameters(parameters)
+
+    def test_parse_with_fields(self) -> None:
+        """Convert the parameters to the types of the command fields."""
+        parser = ParameterParser(
+            name="Test setArrays",
+            fields={
+                "boolean0": ("boolean", 1),
+                "int0": ("int", 5),
+                "double0": ("double", 1),
+                "string0": ("string", 1),
+            },
+        )
+        self.assertEqual(
+            parser.parse("boolean0:TRUE,int0:[1, 2, 3],double0:4,string0:57"),
+            dict(boolean0=True, int0=[1, 2, 3], double0=4.0, string0="57"),
+        )
+        for parameters in (
+            "boolean0:yes",
+            "int0:1",
+            "int0:[1, 2, 3, 4, 5, 6]",
+            "double0:high",
+            "float0:1.5",
+        ):
+            with self.subTest(parameters=parameters):
+                with self.assertRaises(ValueError):
+                    parser.parse(parameters)
+
+    def test_parse_without_fields(self) -> None:
+        """Guess the parameter types of an unknown command."""
+        parser = ParameterParser(name="Test unknown")
+        self.assertEqual(
+            parser.parse(
+                "boolean0:False,int0:42,float0:47.5,string0:Peekaboo,"
+                "quoted:'42',values:[1, 2.5, 'x,y']"
+            ),
+            dict(
+                boolean0=False,
+                int0=42,
+                float0=47.5,
+                string0="Peekaboo",
+                quoted="42",
+                values=[1, 2.5, "x,y"],
+            ),
+        )
+        # Assert a dictionary is used as given.
+        self.assertEqual(parser.parse(dict(axis="all")), dict(axis="all"))
+        self.assertEqual(parser.parse(""), {})
+
+    def test_parser_cache(self) -> None:
+        """Read the command fields once per CSC and command."""
+        get_parameter_parser.cache_clear()
+        self.addCleanup(get_parameter_parser.cache_clear)
+        with unittest.mock.patch.object(
+            command_parameters,
+            "get_command_fields",
+            return_value={"axis": ("string", 1)},
+        ) as get_command_fields:
+            parser = get_parameter_parser("ATAOS", "resetOffset")
+            self.assertIs(get_parameter_parser("ATAOS", "resetOffset"), parser)
+            get_command_fields.assert_called_once_with("ATAOS", "resetOffset")
+        self.assertEqual(parser.parse("axis:1"), dict(axis="1"))
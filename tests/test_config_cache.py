@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# This file is part of ts_IntegrationTests.
+#
+# Developed for the Vera C. Rubin Observatory Telescope & Site Software system.
+# This product includes software developed by the Vera C. Rubin Observatory
+# Project (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+# The code run in a new interpreter, to read the registry from a cold start.
+READ_REGISTRY_CODE = """
+import json
+import sys
+
+from lsst.ts.IntegrationTests.configs.config_registry import registry
+
+configs = {name: registry[name] for name in registry}
+modules = [name for name in sys.modules if name.endswith("_configs")]
+print(json.dumps({"configs": configs, "modules": modules}))
+"""
+
+
+class ConfigCacheTestCase(unittest.TestCase):
+    """Test the on-disk cache of the rendered configurations."""
+
+    def read_registry(self, cache_dir: str) -> dict:
+        env = dict(os.environ, TS_INTEGRATION_TESTS_CONFIG_CACHE=cache_dir)
+        result = subprocess.run(
+            [sys.executable, "-c", READ_REGISTRY_CODE],
+            capture_output=True,
+            check=True,
+            env=env,
+            text=True,
+        )
+        return json.loads(result.stdout)
+
+    def test_config_cache(self) -> None:
+        """Read the registry with an empty cache, then with the cache
+        written by the first read, and compare.
+
+        """
+        with tempfile.TemporaryDirectory() as cache_dir:
+            uncached = self.read_registry(cache_dir)
+            cached = self.read_registry(cache_dir)
+            assert len(uncached["configs"]) > 0
+            assert cached["configs"] == uncached["configs"]
+            # Ensure the configuration modules were only imported
+            # when the cache was empty.
+            assert len(uncached["modules"]) > 0
+            assert cached["modules"] == []
+
+    def test_stale_config_cache(self) -> None:
+        """Ensure a cache written for other configurations is ignored
+        and rewritten.
+
+        """
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache_path = os.path.join(cache_dir, "config_registry.json")
+            with open(cache_path, "w") as cache_file:
+                json.dump({"key": "stale", "configs": {"stale": "---"}}, cache_file)
+            configs = self.read_registry(cache_dir)["configs"]
+            assert "stale" not in configs
+            assert len(configs) > 0
+            with open(cache_path) as cache_file:
+                assert json.load(cache_file)["configs"] == configs
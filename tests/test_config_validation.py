@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# This file is part of ts_IntegrationTests.
+#
+# Developed for the Vera C. Rubin Observatory Telescope & Site Software system.
+# This product includes software developed by the Vera C. Rubin Observatory
+# Project (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import unittest
+
+import yaml
+from lsst.ts.IntegrationTests import (
+    get_config_script,
+    validate_config,
+    validate_registry,
+)
+
+
+class ConfigValidationTestCase(unittest.TestCase):
+    """Test the registry configurations against the script schemas."""
+
+    def test_registry(self) -> None:
+        """Check every registry configuration, in worker processes."""
+        report = validate_registry(max_workers=2)
+        assert len(report.results) > 0
+        assert report.valid, report.format()
+        for result in report.results:
+            assert result.script is not None
+            assert result.duration >= 0
+
+    def test_invalid_configs(self) -> None:
+        """Ensure the problems in bad configurations are reported."""
+        bad_state = yaml.safe_dump({"data": [["ATDome", "ENABLE"]]})
+        report = validate_registry(
+            {
+                "auxtel_standby_disabled": bad_state,
+                "unknown_config": "---\na: 1\n",
+                "auxtel_offline_standby": "\tHello\nWorld",
+            },
+            max_workers=1,
+        )
+        assert not report.valid
+        assert [result.name for result in report.invalid] == [
+            "auxtel_standby_disabled",
+            "unknown_config",
+            "auxtel_offline_standby",
+        ]
+        assert "data/0/1" in report.invalid[0].errors[0]
+        assert report.invalid[1].script is None
+        assert "Invalid YAML" in report.invalid[2].errors[0]
+
+    def test_config_script(self) -> None:
+        """Test the script of a configuration is found by name."""
+        assert get_config_script("mtcs_enabled_offline") == "maintel/offline_mtcs.py"
+        assert get_config_script("eas_enabled_offline") == "set_summary_state.py"
+        assert get_config_script("auxtel_visit_config1") == (
+            "auxtel/take_image_latiss.py"
+        )
+        result = validate_config(
+            "atdome_home", "run_command.py", yaml.safe_dump({"cmd": "homeAzimuth"})
+        )
+        assert result.errors == ["<root>: 'component' is a required property"]
@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# This file is part of ts_IntegrationTests.
+#
+# Developed for the Vera C. Rubin Observatory Telescope & Site Software system.
+# This product includes software developed by the Vera C. Rubin Observatory
+# Project (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import os
+import unittest
+from unittest import mock
+
+from base_test import BaseTestClass, ControllerPool
+from lsst.ts.IntegrationTests import AuxTelStop, VirtualClock, get_default_clock
+
+
+class ControllerPoolTestCase(unittest.TestCase):
+    """Test the topic subnames of the shared controllers."""
+
+    def test_worker_subnames(self) -> None:
+        """Ensure each pytest-xdist worker uses its own subnames."""
+        subnames = []
+        for worker in ("gw0", "gw1"):
+            with mock.patch.dict(os.environ, PYTEST_XDIST_WORKER=worker):
+                pool = ControllerPool()
+                subnames += [pool.new_subname(), pool.new_subname()]
+                self.assertTrue(subnames[-1].endswith(f"_{worker}_1"))
+                self.assertEqual(os.environ["LSST_TOPIC_SUBNAME"], subnames[-1])
+        self.assertEqual(len(set(subnames)), len(subnames))
+
+
+class RealTimeTestCase(BaseTestClass):
+    """Test a test case timed by the wall clock gets controllers
+    timed by the wall clock too.
+    """
+
+    # Use AuxTel ScriptQueue, on the wall clock.
+    index = 2
+    virtual_time = False
+
+    async def test_real_time_controller(self) -> None:
+        self.assertNotIsInstance(get_default_clock(), VirtualClock)
+        self.assertNotIsInstance(self.controller.clock, VirtualClock)
+        script_class = AuxTelStop()
+        await script_class.run()
+        self.assertEqual(script_class.script_states, [8] * len(AuxTelStop.scripts))
+
+
+class VirtualTimeTestCase(BaseTestClass):
+    """Test a test case shares the virtual clock of its controllers."""
+
+    # Use AuxTel ScriptQueue, on a virtual clock.
+    index = 2
+    virtual_time = True
+
+    async def test_shared_clock(self) -> None:
+        self.assertIsInstance(self.controller.clock, VirtualClock)
+        self.assertIs(get_default_clock(), self.controller.clock)
+        script_class = AuxTelStop()
+        script_class.timeout = 60
+        await script_class.run()
+        self.assertEqual(script_class.script_states, [8] * len(AuxTelStop.scripts))
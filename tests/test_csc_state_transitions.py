@@ -21,8 +21,9 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import yaml
 from base_test import BaseTestClass
-from lsst.ts.IntegrationTests import CSCStateTransition
+from lsst.ts.IntegrationTests import CSCStateTransition, expand_csc_patterns, utils
 
 
 class CSCStateTransitionTestCase(BaseTestClass):
@@ -100,3 +101,45 @@ class CSCStateTransitionTestCase(BaseTestClass):
         self.assertEqual(script_class.script_states, [8])
         # Assert script config contains mute_alarms:true.
         self.assertEqual(script_class.mute_alarms, True)
+
+    async def test_many_cscs(self) -> None:
+        """Transition several CSCs, given by name and pattern,
+        in one script.
+        """
+        # Instantiate the CSCStateTransition integration tests.
+        script_class = CSCStateTransition(
+            csc=["ESS:1", "ESS:104", "ATDome*"],
+            state="Disabled",
+            sq_index=CSCStateTransitionTestCase.index,
+        )
+        # Assert one config row per CSC.
+        self.assertEqual(
+            yaml.safe_load(script_class.configs[0])["data"],
+            [
+                ["ESS:1", "Disabled"],
+                ["ESS:104", "Disabled"],
+                ["ATDome", "Disabled"],
+                ["ATDomeTrajectory", "Disabled"],
+            ],
+        )
+        # Execute the scripts.
+        await script_class.run()
+        # Assert one script was added to ScriptQueue, and passed.
+        self.assertEqual(len(self.controller.queue_list), 1)
+        self.assertEqual(script_class.script_states, [8])
+
+    def test_expand_csc_patterns(self) -> None:
+        """Expand the CSC name patterns against utils.cscs."""
+        self.assertEqual(
+            expand_csc_patterns(["AT*:1", "Test:42"]),
+            [f"{csc}:1" for csc in sorted(utils.cscs) if csc.startswith("AT")]
+            + ["Test:42"],
+        )
+        # Assert duplicates are dropped.
+        self.assertEqual(expand_csc_patterns(["ATDome", "ATDom?"]), ["ATDome"])
+        # Assert a pattern matching no CSC is rejected.
+        with self.assertRaises(ValueError):
+            expand_csc_patterns(["NoSuchCSC*"])
+        # Assert an index pattern is rejected, asking for the indexes.
+        with self.assertRaisesRegex(ValueError, "Index patterns are not supported"):
+            expand_csc_patterns(["ESS:*"])
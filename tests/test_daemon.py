@@ -0,0 +1,145 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# This file is part of ts_IntegrationTests.
+#
+# Developed for the Vera C. Rubin Observatory Telescope & Site Software system.
+# This product includes software developed by the Vera C. Rubin Observatory
+# Project (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import asyncio
+import json
+import os
+import socket
+import stat
+import tempfile
+import unittest.mock
+
+from base_test import BaseTestClass
+from lsst.ts.IntegrationTests import (
+    AuxTelStop,
+    IntegrationTestsDaemon,
+    get_socket_path,
+    send_request,
+)
+
+
+class DaemonTestCase(BaseTestClass):
+    """Test running integration test commands on the daemon."""
+
+    # Use AuxTel ScriptQueue.
+    index = 2
+
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.temp_dir = temp_dir.name
+        self.socket_path = os.path.join(temp_dir.name, "daemon.sock")
+        self.daemon = IntegrationTestsDaemon(
+            socket_path=self.socket_path, indexes=[self.index]
+        )
+        await self.daemon.start()
+
+    async def asyncTearDown(self) -> None:
+        await self.daemon.close()
+        await super().asyncTearDown()
+
+    async def send_request(self, invocation: list[str]) -> dict:
+        """Send the invocation from a thread, as the client does."""
+        return await asyncio.to_thread(
+            send_request, invocation, socket_path=self.socket_path
+        )
+
+    def test_get_socket_path(self) -> None:
+        """Get the socket path from the environment."""
+        with unittest.mock.patch.dict(
+            os.environ, {"TS_INTEGRATION_TESTS_SOCKET": "/tmp/test.sock"}
+        ):
+            self.assertEqual(get_socket_path(), "/tmp/test.sock")
+
+    async def test_run_commands(self) -> None:
+        """Run several commands, sharing the ScriptQueue Remote."""
+        # Assert the Remote was created when the daemon started.
+        remote = self.daemon.session.remotes[self.index]
+        for _ in range(2):
+            response = await self.send_request(["auxtel_stop"])
+            self.assertTrue(response["succeeded"], response)
+            self.assertIsNone(response["error"])
+            self.assertIn("AuxTel Stop", response["output"])
+            self.assertIn("AuxTelStop: PASSED", response["report"])
+        self.assertIs(self.daemon.session.remotes[self.index], remote)
+        # Assert scripts were added to ScriptQueue.
+        self.assertEqual(len(self.controller.queue_list), 2 * len(AuxTelStop.scripts))
+
+    async def test_invalid_requests(self) -> None:
+        """Report an invalid request without running anything."""
+        for invocation in (
+            ["auxtel_go"],
+            ["run_command", "2", "ATAOS"],
+            [],
+        ):
+            with self.subTest(invocation=invocation):
+                response = await self.send_request(invocation)
+                self.assertFalse(response["succeeded"])
+                self.assertIsNotNone(response["error"])
+        self.assertEqual(len(self.controller.queue_list), 0)
+
+    async def test_invalid_request_line(self) -> None:
+        """Report a request that is too long or not JSON."""
+        for line in (b"x" * 2**17 + b"\n", b"not json\n"):
+            with self.subTest(length=len(line)):
+                reader, writer = await asyncio.open_unix_connection(self.socket_path)
+                writer.write(line)
+                await writer.drain()
+                response = json.loads(await reader.readline())
+                writer.close()
+                await writer.wait_closed()
+                self.assertFalse(response["succeeded"])
+                self.assertIsNotNone(response["error"])
+        self.assertEqual(len(self.controller.queue_list), 0)
+
+    async def test_socket(self) -> None:
+        """Only the user may connect, and a second daemon does not start
+        on the same socket.
+        """
+        self.assertEqual(stat.S_IMODE(os.stat(self.socket_path).st_mode), 0o600)
+        daemon = IntegrationTestsDaemon(
+            socket_path=self.socket_path, indexes=[self.index]
+        )
+        with self.assertRaises(RuntimeError):
+            await daemon.start()
+        await daemon.close()
+        # Assert the running daemon still serves requests.
+        response = await self.send_request(["auxtel_go"])
+        self.assertIn("auxtel_go", response["error"])
+
+    async def test_stale_socket(self) -> None:
+        """Remove the socket left by a daemon that did not exit cleanly."""
+        socket_path = os.path.join(self.temp_dir, "stale.sock")
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stale_socket:
+            stale_socket.bind(socket_path)
+        daemon = IntegrationTestsDaemon(socket_path=socket_path, indexes=[self.index])
+        await daemon.start()
+        try:
+            response = await asyncio.to_thread(
+                send_request, ["auxtel_go"], socket_path=socket_path
+            )
+            self.assertFalse(response["succeeded"])
+        finally:
+            await daemon.close()
+        self.assertFalse(os.path.exists(socket_path))
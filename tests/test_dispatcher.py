@@ -0,0 +1,183 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# This file is part of ts_IntegrationTests.
+#
+# Developed for the Vera C. Rubin Observatory Telescope & Site Software system.
+# This product includes software developed by the Vera C. Rubin Observatory
+# Project (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import argparse
+import asyncio
+import contextlib
+import contextvars
+import io
+import os
+import tempfile
+import tomllib
+import unittest.mock
+
+from base_test import BaseTestClass
+from lsst.ts.IntegrationTests import (
+    AuxTelShutdown,
+    AuxTelStop,
+    commands,
+    dispatcher,
+    read_batch_file,
+    redirect_output,
+    run_invocations,
+)
+
+PYPROJECT = os.path.join(os.path.dirname(__file__), "..", "pyproject.toml")
+
+
+class DispatcherTestCase(BaseTestClass):
+    """Test the integration_tests dispatcher."""
+
+    # Use AuxTel ScriptQueue.
+    index = 2
+
+    def write_batch_file(self, text: str) -> str:
+        """Write a batch file, removed after the test, and return its path."""
+        with tempfile.NamedTemporaryFile(
+            "w", suffix=".txt", delete=False
+        ) as batch_file:
+            batch_file.write(text)
+        self.addCleanup(os.remove, batch_file.name)
+        return batch_file.name
+
+    def test_commands(self) -> None:
+        """Ensure every console script is an integration_tests command."""
+        with open(PYPROJECT, "rb") as pyproject:
+            scripts = tomllib.load(pyproject)["project"]["scripts"]
+        # The dispatcher does not run itself, nor the daemon and its client.
+        for command in (
+            "integration_tests",
+            "integration_tests_client",
+            "integration_tests_daemon",
+        ):
+            del scripts[command]
+        self.assertEqual(
+            {
+                command: f"lsst.ts.IntegrationTests.{module}:{function}"
+                for command, (module, function) in commands.items()
+            },
+            scripts,
+        )
+
+    def test_read_batch_file(self) -> None:
+        """Read a batch file with comments and quoted arguments."""
+        path = self.write_batch_file(
+            "# Reset the offsets.\n"
+            "\n"
+            "run_command 2 ATAOS resetOffset -p axis:all\n"
+            "auxtel_stop  # Stop the telescope.\n"
+            "csc_state_transition ESS enabled -a 'with spaces'\n"
+        )
+        self.assertEqual(
+            read_batch_file(path),
+            [
+                ["run_command", "2", "ATAOS", "resetOffset", "-p", "axis:all"],
+                ["auxtel_stop"],
+                ["csc_state_transition", "ESS", "enabled", "-a", "with spaces"],
+            ],
+        )
+
+    def test_read_batch_file_unknown_command(self) -> None:
+        """Reject a batch file with an unknown command."""
+        path = self.write_batch_file("auxtel_stop\nauxtel_go\n")
+        with self.assertRaises(KeyError):
+            read_batch_file(path)
+
+    def test_main_invalid_invocations(self) -> None:
+        """Verify an unknown command or batch file exits with an error."""
+        path = self.write_batch_file("auxtel_stop\nauxtel_go\n")
+        for opts in (
+            argparse.Namespace(command="auxtel_go", arguments=[], batch=None),
+            argparse.Namespace(command=None, arguments=[], batch=path),
+            argparse.Namespace(command=None, arguments=[], batch=path + ".bad"),
+        ):
+            with self.subTest(opts=opts):
+                with self.assertRaises(SystemExit) as cm:
+                    dispatcher.main(opts)
+                self.assertEqual(cm.exception.code, 1)
+
+    def test_collect_scripts_entry_point(self) -> None:
+        """Record the command of the collected scripts in the results."""
+        (script,) = dispatcher.collect_scripts(["auxtel_stop"])
+        self.assertIsInstance(script, AuxTelStop)
+        self.assertEqual(script.entry_point, "auxtel_stop")
+
+    def test_redirect_output(self) -> None:
+        """Redirect what the current context prints, and only that."""
+        stdout = io.StringIO()
+        output = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            with redirect_output(output):
+                print("request")
+                contextvars.Context().run(print, "other")
+            print("after")
+        self.assertEqual(output.getvalue(), "request\n")
+        self.assertEqual(stdout.getvalue(), "other\nafter\n")
+
+    async def test_run_invocations(self) -> None:
+        """Run several commands in one event loop and Domain."""
+        report = await asyncio.to_thread(
+            run_invocations, [["auxtel_stop"], ["auxtel_shutdown"]]
+        )
+        # Assert the scripts of both commands were added and passed.
+        self.assertEqual(
+            [run.name for run in report.runs], ["AuxTelStop", "AuxTelShutdown"]
+        )
+        self.assertTrue(report.succeeded, report.format())
+        self.assertEqual(
+            len(self.controller.queue_list),
+            len(AuxTelStop.scripts) + len(AuxTelShutdown.scripts),
+        )
+
+    async def test_run_invocations_invalid_arguments(self) -> None:
+        """Report an invocation with invalid arguments as a failed run."""
+        report = await asyncio.to_thread(
+            run_invocations, [["run_command", "2", "ATAOS"]]
+        )
+        self.assertFalse(report.succeeded)
+        self.assertEqual(len(self.controller.queue_list), 0)
+
+    async def test_run_invocations_entry_point_error(self) -> None:
+        """Report an entry point raising an exception as a failed run,
+        and go on with the next invocations.
+        """
+        collect_scripts = dispatcher.collect_scripts
+
+        def fail_shutdown(invocation: list[str]) -> list:
+            if invocation[0] == "auxtel_shutdown":
+                raise ValueError("Invalid configuration")
+            return collect_scripts(invocation)
+
+        with unittest.mock.patch.object(
+            dispatcher, "collect_scripts", side_effect=fail_shutdown
+        ):
+            report = await asyncio.to_thread(
+                run_invocations, [["auxtel_shutdown"], ["auxtel_stop"]]
+            )
+        self.assertFalse(report.succeeded)
+        self.assertEqual(
+            [run.name for run in report.runs], ["auxtel_shutdown", "AuxTelStop"]
+        )
+        self.assertIn("Invalid configuration", report.runs[0].error)
+        self.assertTrue(report.runs[1].succeeded, report.format())
+        self.assertEqual(len(self.controller.queue_list), len(AuxTelStop.scripts))
@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# This file is part of ts_IntegrationTests.
+#
+# Developed for the Vera C. Rubin Observatory Telescope & Site Software system.
+# This product includes software developed by the Vera C. Rubin Observatory
+# Project (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import importlib
+import json
+import subprocess
+import sys
+import unittest
+
+import lsst.ts.IntegrationTests
+
+# The code run in a new interpreter, to measure a cold import.
+IMPORT_CODE = """
+import json
+import sys
+import time
+
+start_time = time.perf_counter()
+import lsst.ts.IntegrationTests
+package_time = time.perf_counter() - start_time
+from lsst.ts.IntegrationTests import AuxTelStop
+modules = sorted(
+    name for name in sys.modules if name.startswith("lsst.ts.IntegrationTests.")
+)
+print(json.dumps({"package_time": package_time, "modules": modules}))
+"""
+
+
+class ImportTimeTestCase(unittest.TestCase):
+    """Test the package imports its modules only when they are used.
+
+    Attributes
+    ----------
+    import_budget : `float`
+        The maximum time, in seconds, to import the package.
+    """
+
+    # See Attributes for the definition.
+    import_budget: float = 0.5
+
+    def test_import_time(self) -> None:
+        """Import the package and the AuxTelStop class in a new interpreter,
+        and check the package import time and the modules imported.
+
+        """
+        result = subprocess.run(
+            [sys.executable, "-c", IMPORT_CODE],
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+        imports = json.loads(result.stdout)
+        assert imports["package_time"] < self.import_budget
+        modules = [name.split(".")[3] for name in imports["modules"]]
+        assert "auxtel_stop" in modules
+        # Ensure the other integration test scripts were not imported.
+        for module_name in ("auxtel_visit", "maintel_housekeeping", "run_command"):
+            assert module_name not in modules
+        assert "script_queue_controller" not in modules
+
+    def test_exports(self) -> None:
+        """Test every public name of every module is exported by the
+        package.
+        """
+        for module_name, names in lsst.ts.IntegrationTests._module_names.items():
+            module = importlib.import_module(f"lsst.ts.IntegrationTests.{module_name}")
+            assert tuple(module.__all__) == names
+            for name in names:
+                assert getattr(lsst.ts.IntegrationTests, name) is getattr(module, name)
+        with self.assertRaises(AttributeError):
+            lsst.ts.IntegrationTests.NotAScript
+
+    def test_exports_after_submodule_import(self) -> None:
+        """Test a public name with the name of its module is still bound to
+        the exported object once that module is imported.
+        """
+        exports = lsst.ts.IntegrationTests._exports
+        names = [name for name, module_name in exports.items() if name == module_name]
+        assert "run_command" in names
+        for name in names:
+            module = importlib.import_module(f"lsst.ts.IntegrationTests.{name}")
+            value = getattr(lsst.ts.IntegrationTests, name)
+            assert callable(value)
+            assert value is getattr(module, name)
@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# This file is part of ts_IntegrationTests.
+#
+# Developed for the Vera C. Rubin Observatory Telescope & Site Software system.
+# This product includes software developed by the Vera C. Rubin Observatory
+# Project (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from base_test import BaseTestClass
+from lsst.ts.IntegrationTests import AuxTelHousekeeping, RunCommand
+
+
+class InjectTestCase(BaseTestClass):
+    """Test adding scripts to the running ScriptQueue, without pausing it."""
+
+    # Use AuxTel ScriptQueue.
+    index = 2
+
+    async def test_inject_command(self) -> None:
+        """Execute a command without pausing the ScriptQueue."""
+        script_class = RunCommand(
+            sq_index=2,
+            csc="ATAOS",
+            command="resetOffset",
+            parameters="axis:all",
+            inject=True,
+        )
+        await script_class.run()
+        # Assert the ScriptQueue was never paused, nor resumed.
+        self.assertTrue(self.controller.running)
+        self.assertIsNone(script_class.timing.pause_duration)
+        self.assertIsNone(script_class.timing.resume_duration)
+        self.assertEqual(len(self.controller.queue_list), 1)
+        self.assertEqual(script_class.script_states, [8])
+
+    async def test_inject_first(self) -> None:
+        """Execute several scripts at the top of the running ScriptQueue,
+        and check they run in the order of the scripts list.
+        """
+        script_class = AuxTelHousekeeping()
+        script_class.queue_placement = "FIRST"
+        script_class.inject = True
+        num_scripts = len(script_class.scripts)
+        await script_class.run()
+        self.assertTrue(self.controller.running)
+        self.assertEqual(len(self.controller.queue_list), num_scripts)
+        self.assertEqual(script_class.script_states, [8] * num_scripts)
+        running_times = [
+            timing.state_times["RUNNING"] for timing in script_class.timing.scripts
+        ]
+        self.assertEqual(running_times, sorted(running_times))
@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# This file is part of ts_IntegrationTests.
+#
+# Developed for the Vera C. Rubin Observatory Telescope & Site Software system.
+# This product includes software developed by the Vera C. Rubin Observatory
+# Project (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import argparse
+import unittest
+import unittest.mock
+
+from base_test import BaseTestClass, controller_pool
+from lsst.ts.IntegrationTests import (
+    AuxTelOfflineStandby,
+    MainTelStandbyDisabled,
+    OrchestratorReport,
+    ScriptQueueController,
+    ScriptRunReport,
+    orchestrator,
+    run_in_parallel,
+)
+
+
+class OrchestratorTestCase(BaseTestClass):
+    """Test running integration test scripts on several ScriptQueues."""
+
+    # Use MainTel ScriptQueue.
+    index = 1
+
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        # Get the AuxTel ScriptQueue Controller.
+        self.auxtel_controller = await controller_pool.get_controller(
+            ScriptQueueController,
+            index=2,
+            virtual_time=self.virtual_time,
+            step_delay=self.step_delay,
+        )
+
+    async def test_run_in_parallel(self) -> None:
+        """Execute the MainTel and AuxTel state transitions concurrently."""
+        report = await run_in_parallel(
+            [MainTelStandbyDisabled, AuxTelOfflineStandby, AuxTelOfflineStandby]
+        )
+        # Assert scripts were added to both ScriptQueues.
+        self.assertEqual(
+            len(self.controller.queue_list), len(MainTelStandbyDisabled.scripts)
+        )
+        self.assertEqual(
+            len(self.auxtel_controller.queue_list),
+            2 * len(AuxTelOfflineStandby.scripts),
+        )
+        # Assert the report is in the given order, and all scripts passed.
+        self.assertEqual(
+            [(run.name, run.index) for run in report.runs],
+            [
+                ("MainTelStandbyDisabled", 1),
+                ("AuxTelOfflineStandby", 2),
+                ("AuxTelOfflineStandby", 2),
+            ],
+        )
+        self.assertTrue(report.succeeded, report.format())
+
+
+class OrchestratorMainTestCase(unittest.TestCase):
+    """Test the exit status of the parallel_checkout command."""
+
+    def test_invalid_script_class(self) -> None:
+        with self.assertRaises(SystemExit) as cm:
+            orchestrator.main(argparse.Namespace(script_classes=["NoSuchScript"]))
+        self.assertEqual(cm.exception.code, 1)
+
+    def test_failed_run(self) -> None:
+        report = OrchestratorReport(
+            runs=[ScriptRunReport(name="AuxTelStop", index=2, num_scripts=1)]
+        )
+        with unittest.mock.patch.object(
+            orchestrator,
+            "run_in_parallel",
+            new=unittest.mock.AsyncMock(return_value=report),
+        ):
+            with self.assertRaises(SystemExit) as cm:
+                orchestrator.main(argparse.Namespace(script_classes=["AuxTelStop"]))
+        self.assertEqual(cm.exception.code, 1)
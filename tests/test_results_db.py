@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# This file is part of ts_IntegrationTests.
+#
+# Developed for the Vera C. Rubin Observatory Telescope & Site Software system.
+# This product includes software developed by the Vera C. Rubin Observatory
+# Project (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import argparse
+import os
+import tempfile
+import unittest
+
+from lsst.ts.IntegrationTests import ResultsDatabase, RunTiming, ScriptTiming
+from lsst.ts.IntegrationTests import results_db as results_db_module
+
+# The seconds in a day.
+DAY = 24 * 60 * 60
+
+
+def make_run(start_time: float, run_duration: float) -> RunTiming:
+    """Make the timing of a run of one take_image_latiss.py script."""
+    return RunTiming(
+        name="AuxTelImageTaking",
+        index=2,
+        start_time=start_time,
+        end_time=start_time + run_duration + 2,
+        pause_duration=0.01,
+        resume_duration=0.01,
+        scripts=[
+            ScriptTiming(
+                script_index=1,
+                path="auxtel/take_image_latiss.py",
+                is_standard=True,
+                add_time=start_time,
+                ack_time=start_time + 0.1,
+                state_times=dict(
+                    LOADING=start_time,
+                    CONFIGURED=start_time + 1,
+                    RUNNING=start_time + 2,
+                    DONE=start_time + 2 + run_duration,
+                ),
+                config_hash="0123456789abcdef",
+                script_state=8,
+            )
+        ],
+    )
+
+
+class ResultsDatabaseTestCase(unittest.TestCase):
+    """Test the results database statistics and regressions."""
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.temp_dir.name, "results.sqlite3")
+        self.now = 2_000_000_000.0
+        # Ten nights of 10 s runs, then a night of 20 s runs.
+        with ResultsDatabase(self.db_path) as results_db:
+            for night in range(10, 0, -1):
+                results_db.add_run(
+                    make_run(self.now - (night + 0.5) * DAY, 10), entry_point="test"
+                )
+            results_db.add_run(make_run(self.now - DAY / 2, 20), entry_point="test")
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def test_stats(self) -> None:
+        with ResultsDatabase(self.db_path) as results_db:
+            (stats,) = results_db.get_stats("run", days=30, now=self.now)
+            (load_stats,) = results_db.get_stats(
+                "load", days=30, path="auxtel/%", now=self.now
+            )
+            self.assertEqual(results_db.get_stats("run", path="maintel/%"), [])
+            with self.assertRaises(ValueError):
+                results_db.get_stats("bad_phase")
+        self.assertEqual(stats.path, "auxtel/take_image_latiss.py")
+        self.assertEqual(stats.count, 11)
+        self.assertEqual(stats.p50, 10)
+        self.assertEqual(stats.max, 20)
+        self.assertAlmostEqual(stats.p90, 10)
+        self.assertAlmostEqual(stats.p99, 19)
+        self.assertEqual(load_stats.count, 11)
+        self.assertAlmostEqual(load_stats.p50, 1)
+
+    def test_regressions(self) -> None:
+        with ResultsDatabase(self.db_path) as results_db:
+            (regression,) = results_db.find_regressions("run", now=self.now)
+            self.assertEqual(results_db.find_regressions("load", now=self.now), [])
+            # Ensure a threshold above the slow down is not reported.
+            self.assertEqual(
+                results_db.find_regressions("run", threshold=2.5, now=self.now), []
+            )
+        self.assertEqual(regression.path, "auxtel/take_image_latiss.py")
+        self.assertEqual(regression.baseline.count, 10)
+        self.assertEqual(regression.recent.count, 1)
+        self.assertAlmostEqual(regression.ratio, 2)
+
+    def test_main_missing_db(self) -> None:
+        """Verify a missing database exits with an error, and is not
+        created.
+        """
+        db_path = os.path.join(self.temp_dir.name, "missing.sqlite3")
+        opts = argparse.Namespace(db=db_path, phase="run", days=30, script=None)
+        with self.assertRaises(SystemExit) as cm:
+            results_db_module.main(opts)
+        self.assertEqual(cm.exception.code, 1)
+        self.assertFalse(os.path.exists(db_path))
@@ -21,8 +21,15 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import contextlib
+import io
+import os
+import tempfile
+import unittest.mock
+
+import yaml
 from base_test import BaseTestClass
-from lsst.ts.IntegrationTests import RunCommand
+from lsst.ts.IntegrationTests import RunCommand, read_commands_file, split_parameters
 
 
 class RunCommandTestCase(BaseTestClass):
@@ -136,3 +143,146 @@ class RunCommandTestCase(BaseTestClass):
         self.assertEqual(len(self.controller.queue_list), num_scripts)
         # Assert scripts passed.
         self.assertEqual(script_class.script_states, [8])
+
+    async def test_batched_commands(self) -> None:
+        """Execute several commands in one ScriptQueue submission."""
+        # Instantiate the RunCommand integration test.
+        script_class = RunCommand(
+            sq_index=1,
+            csc="ATAOS",
+            command="resetOffset",
+            parameters="axis:all",
+            commands=[
+                ("ATAOS", "enableCorrection", "enableAll:True"),
+                ("MTAirCompressor:2", "powerOn", ""),
+            ],
+        )
+        # Assert there is one script and config per command, in order.
+        self.assertEqual(len(script_class.scripts), 3)
+        self.assertEqual(
+            [yaml.safe_load(config)["cmd"] for config in script_class.configs],
+            ["resetOffset", "enableCorrection", "powerOn"],
+        )
+        print("Executing three commands.")
+        # Execute the scripts, capturing the results they print.
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            await script_class.run()
+        # Assert scripts were added to ScriptQueue.
+        self.assertEqual(len(self.controller.queue_list), 3)
+        # Assert scripts passed, and the results follow the commands.
+        self.assertEqual(script_class.script_states, [8, 8, 8])
+        self.assertEqual(
+            script_class.results,
+            [
+                ("ATAOS", "resetOffset", 8),
+                ("ATAOS", "enableCorrection", 8),
+                ("MTAirCompressor:2", "powerOn", 8),
+            ],
+        )
+        for csc, command, state in script_class.results:
+            self.assertIn(f"{csc} {command}: Script State {state}\n", output.getvalue())
+
+    async def test_batched_commands_middle_failure(self) -> None:
+        """Report the results of each command when the middle one
+        fails to be added.
+        """
+        # Instantiate the RunCommand integration test.
+        script_class = RunCommand(
+            sq_index=1,
+            csc="ATAOS",
+            command="resetOffset",
+            parameters="axis:all",
+            commands=[
+                ("ATAOS", "enableCorrection", "enableAll:True"),
+                ("MTAirCompressor:2", "powerOn", ""),
+            ],
+        )
+        # Fail the add command of the middle script.
+        add_script = script_class.add_script
+
+        async def add_all_but_middle(
+            script: tuple, config: str, *args: object
+        ) -> int | None:
+            if config == script_class.configs[1]:
+                return None
+            return await add_script(script, config, *args)
+
+        with unittest.mock.patch.object(
+            script_class, "add_script", side_effect=add_all_but_middle
+        ):
+            await script_class.run()
+        # Assert only the first and last scripts were added, and passed.
+        self.assertEqual(len(self.controller.queue_list), 2)
+        self.assertEqual(script_class.script_states, [8, 8])
+        # Assert each result belongs to its command.
+        self.assertEqual(
+            script_class.results,
+            [
+                ("ATAOS", "resetOffset", 8),
+                ("ATAOS", "enableCorrection", None),
+                ("MTAirCompressor:2", "powerOn", 8),
+            ],
+        )
+
+    def test_read_commands_file(self) -> None:
+        """Read a file of commands, and reject a malformed one."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "commands.txt")
+            with open(path, "w") as commands_file:
+                commands_file.write(
+                    "# Reset the ATAOS.\n"
+                    "ATAOS resetOffset axis:all\n"
+                    "\n"
+                    "MTAirCompressor:2 powerOn\n"
+                    'Test setScalars string0:"Peek, a boo",int0:42  # Quoted.\n'
+                )
+            commands = read_commands_file(path)
+            self.assertEqual(
+                commands,
+                [
+                    ("ATAOS", "resetOffset", "axis:all"),
+                    ("MTAirCompressor:2", "powerOn", ""),
+                    ("Test", "setScalars", 'string0:"Peek, a boo",int0:42'),
+                ],
+            )
+            # Assert the parameter parser gets the quoted value whole.
+            self.assertEqual(
+                split_parameters(commands[-1][2]),
+                [("string0", "Peek, a boo", True), ("int0", "42", False)],
+            )
+            with open(path, "a") as commands_file:
+                commands_file.write("ATAOS\n")
+            with self.assertRaises(ValueError):
+                read_commands_file(path)
+
+    def test_no_command(self) -> None:
+        """Reject a RunCommand without a command."""
+        with self.assertRaises(ValueError):
+            RunCommand(sq_index=1)
+        with self.assertRaises(ValueError):
+            RunCommand(sq_index=1, csc="ATAOS")
+
+    async def test_command_with_dict_parameters(self) -> None:
+        """Execute a command with quoted, array and dictionary parameters."""
+        # Instantiate the RunCommand integration test.
+        script_class = RunCommand(
+            sq_index=1,
+            csc="Test",
+            command="setArrays",
+            parameters="int0:[1, 2, 3],string0:'a, b:c'",
+            commands=[("Test", "setScalars", dict(string0="57", int0=42))],
+        )
+        # Assert the parameters are in the configs, without text round trip.
+        self.assertEqual(
+            [yaml.safe_load(config)["parameters"] for config in script_class.configs],
+            [
+                dict(int0=[1, 2, 3], string0="a, b:c"),
+                dict(string0="57", int0=42),
+            ],
+        )
+        # Execute the scripts.
+        await script_class.run()
+        # Assert scripts were added to ScriptQueue, and passed.
+        self.assertEqual(len(self.controller.queue_list), 2)
+        self.assertEqual(script_class.script_states, [8, 8])
@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# This file is part of ts_IntegrationTests.
+#
+# Developed for the Vera C. Rubin Observatory Telescope & Site Software system.
+# This product includes software developed by the Vera C. Rubin Observatory
+# Project (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import types
+import unittest
+
+from lsst.ts.IntegrationTests import AuxTelHousekeeping
+from lsst.ts.xml.enums.Script import ScriptState
+from lsst.ts.xml.enums.ScriptQueue import ScriptProcessState
+
+
+def make_script_event(
+    script_index: int, script_state: ScriptState = ScriptState.DONE
+) -> types.SimpleNamespace:
+    """Make a terminal ScriptQueue Script Event for the given script."""
+    return types.SimpleNamespace(
+        scriptSalIndex=script_index,
+        processState=ScriptProcessState.DONE,
+        scriptState=script_state,
+        timestampProcessEnd=99999,
+    )
+
+
+class ScriptEventsTestCase(unittest.IsolatedAsyncioTestCase):
+    """Test the completion tracking of the Script Events,
+    keyed by script index.
+    """
+
+    async def test_out_of_order(self) -> None:
+        """Complete the scripts out of order, interleaved with the
+        events of scripts added by others.
+        """
+        script_class = AuxTelHousekeeping()
+        script_class.script_indexes = [100001, 100002, 100003]
+        script_class.pending_indexes = set(script_class.script_indexes)
+        for script_index in (100003, 99999, 100001, 100003, 100004):
+            await script_class.wait_for_done(make_script_event(script_index))
+            self.assertFalse(script_class.all_scripts_done)
+        await script_class.wait_for_done(make_script_event(100002))
+        self.assertTrue(script_class.all_scripts_done)
+        self.assertEqual(
+            script_class.final_states,
+            {
+                100001: ScriptState.DONE,
+                100002: ScriptState.DONE,
+                100003: ScriptState.DONE,
+            },
+        )
+
+    async def test_done_while_adding(self) -> None:
+        """Complete a script before its add command is acknowledged."""
+        script_class = AuxTelHousekeeping()
+        script_class.adding = True
+        await script_class.wait_for_done(make_script_event(100001))
+        # The script is not known yet, so it is kept, but not pending.
+        self.assertEqual(script_class.final_states, {100001: ScriptState.DONE})
+        self.assertEqual(script_class.pending_indexes, set())
+        self.assertFalse(script_class.all_scripts_done)
+        # Repeated events are ignored.
+        await script_class.wait_for_done(make_script_event(100001, ScriptState.FAILED))
+        self.assertEqual(script_class.final_states, {100001: ScriptState.DONE})
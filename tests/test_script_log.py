@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# This file is part of ts_IntegrationTests.
+#
+# Developed for the Vera C. Rubin Observatory Telescope & Site Software system.
+# This product includes software developed by the Vera C. Rubin Observatory
+# Project (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import io
+import json
+import logging
+import unittest
+
+from lsst.ts.IntegrationTests import configure_logging, stop_logging
+
+
+class ScriptLogTestCase(unittest.TestCase):
+    """Test the output of the package logger."""
+
+    def setUp(self) -> None:
+        self.stream = io.StringIO()
+        self.log = logging.getLogger("lsst.ts.IntegrationTests.ScriptLogTest")
+
+    def tearDown(self) -> None:
+        stop_logging()
+
+    def log_progress(self) -> None:
+        for script_index in range(1, 4):
+            self.log.info(
+                "Waiting for script ID %s to finish...",
+                script_index,
+                extra=dict(progress=True, script_index=script_index),
+            )
+        self.log.info("Script %s done", 3, extra=dict(script_index=3))
+        self.log.warning("Resuming the ScriptQueue")
+
+    def test_json_format(self) -> None:
+        configure_logging(json_format=True, quiet=False, stream=self.stream)
+        self.log_progress()
+        stop_logging()
+        records = [json.loads(line) for line in self.stream.getvalue().splitlines()]
+        # Ensure the progress lines are rate limited.
+        self.assertEqual(
+            [record["message"] for record in records],
+            [
+                "Waiting for script ID 1 to finish...",
+                "Script 3 done",
+                "Resuming the ScriptQueue",
+            ],
+        )
+        self.assertEqual(records[0]["script_index"], 1)
+        self.assertEqual(records[0]["level"], "INFO")
+        self.assertNotIn("progress", records[0])
+        self.assertEqual(records[2]["level"], "WARNING")
+
+    def test_progress_interval(self) -> None:
+        configure_logging(
+            json_format=False, quiet=False, progress_interval=0, stream=self.stream
+        )
+        self.log_progress()
+        stop_logging()
+        lines = self.stream.getvalue().splitlines()
+        self.assertEqual(len(lines), 5)
+        self.assertEqual(lines[1], "Waiting for script ID 2 to finish...")
+
+    def test_quiet(self) -> None:
+        configure_logging(json_format=False, quiet=True, stream=self.stream)
+        self.log_progress()
+        stop_logging()
+        self.assertEqual(self.stream.getvalue(), "Resuming the ScriptQueue\n")
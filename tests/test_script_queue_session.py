@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# This file is part of ts_IntegrationTests.
+#
+# Developed for the Vera C. Rubin Observatory Telescope & Site Software system.
+# This product includes software developed by the Vera C. Rubin Observatory
+# Project (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from base_test import BaseTestClass
+from lsst.ts.IntegrationTests import (
+    AuxTelDisabledEnabled,
+    AuxTelOfflineStandby,
+    AuxTelStandbyDisabled,
+    ScriptQueueSession,
+)
+
+
+class ScriptQueueSessionTestCase(BaseTestClass):
+    """Test running several integration test scripts in one session."""
+
+    # Use AuxTel ScriptQueue.
+    index = 2
+
+    async def test_chained_state_transitions(self) -> None:
+        """Execute the AuxTel Offline to Enabled state transitions,
+        sharing the Domain and ScriptQueue Remote.
+        """
+        async with ScriptQueueSession() as session:
+            # Execute the scripts.
+            script_classes = []
+            for script_class in (
+                AuxTelOfflineStandby(),
+                AuxTelStandbyDisabled(),
+                AuxTelDisabledEnabled(),
+            ):
+                await script_class.run(session=session)
+                script_classes.append(script_class)
+            # Assert the scripts shared the ScriptQueue Remote.
+            self.assertEqual(list(session.remotes), [self.index])
+            remote = session.remotes[self.index]
+            for script_class in script_classes:
+                self.assertIs(script_class.remote, remote)
+            # Assert the callbacks were unregistered.
+            self.assertEqual(session.script_callbacks[self.index], [])
+        # Assert scripts were added to ScriptQueue.
+        self.assertEqual(len(self.controller.queue_list), 5)
+        # Assert scripts passed.
+        self.assertEqual(
+            [script_class.script_states for script_class in script_classes],
+            [[8], [8, 8], [8, 8]],
+        )
+        # Assert the session closed.
+        self.assertIsNone(session.domain)
+        self.assertEqual(session.remotes, {})
@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# This file is part of ts_IntegrationTests.
+#
+# Developed for the Vera C. Rubin Observatory Telescope & Site Software system.
+# This product includes software developed by the Vera C. Rubin Observatory
+# Project (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import time
+import unittest
+
+from base_test import BaseTestClass, controller_pool
+from lsst.ts.IntegrationTests import (
+    AuxTelHousekeeping,
+    FixedTimingModel,
+    NormalTimingModel,
+    ReplayTimingModel,
+    ScriptDurations,
+    SimulatedScriptQueueController,
+    VirtualClock,
+)
+
+
+class TimingModelTestCase(unittest.TestCase):
+    """Test the timing models of the simulated ScriptQueue."""
+
+    def test_fixed(self) -> None:
+        slow = ScriptDurations(load=5, configure=1, run=600)
+        model = FixedTimingModel(by_path={"auxtel/point_azel.py": slow})
+        self.assertEqual(model.get_durations("auxtel/point_azel.py"), slow)
+        self.assertEqual(model.get_durations("run_command.py"), ScriptDurations())
+
+    def test_normal(self) -> None:
+        mean = ScriptDurations(load=5, configure=1, run=60)
+        stddev = ScriptDurations(load=1, configure=2, run=10)
+        durations = [
+            NormalTimingModel(mean, stddev, seed=1).get_durations("run_command.py")
+            for _ in range(2)
+        ]
+        # Assert the same seed gives the same durations.
+        self.assertEqual(durations[0], durations[1])
+        model = NormalTimingModel(mean, stddev, seed=2)
+        for _ in range(100):
+            self.assertGreaterEqual(model.get_durations("run_command.py").configure, 0)
+
+    def test_replay(self) -> None:
+        model = ReplayTimingModel(
+            load={"run_command.py": [2, 3]},
+            run={"run_command.py": [10, 20, 30]},
+        )
+        self.assertEqual(
+            [model.get_durations("run_command.py").run for _ in range(4)],
+            [10, 20, 30, 10],
+        )
+        self.assertEqual(model.get_durations("auxtel/point_azel.py"), ScriptDurations())
+
+
+class SimulatedScriptQueueTestCase(BaseTestClass):
+    """Test the integration test scripts against the simulated ScriptQueue."""
+
+    async def asyncSetUp(self) -> None:
+        # Define LSST_TOPIC_SUBNAME. This controller is not shared,
+        # but its topics are deleted with those of the shared controllers.
+        controller_pool.new_subname()
+
+        # Create the simulated ScriptQueue Controller, with
+        # half an hour per script in virtual time.
+        self.clock = VirtualClock()
+        self.controller = SimulatedScriptQueueController(
+            index=2,
+            timing_model=FixedTimingModel(
+                ScriptDurations(load=60, configure=30, run=1800)
+            ),
+            clock=self.clock,
+        )
+        controller_pool.components.add(self.controller.salinfo.name)
+
+        # Start the controller and wait for it be ready.
+        await self.controller.start_task
+
+    async def asyncTearDown(self) -> None:
+        await self.controller.close()
+
+    async def test_simulated_night(self) -> None:
+        """Execute the AuxTelHousekeeping integration test script,
+        taking hours of simulated time.
+        """
+        script_class = AuxTelHousekeeping()
+        num_scripts = len(script_class.scripts)
+        start_time = time.monotonic()
+        await script_class.run()
+        # Assert the run took hours in simulated time, but not in real time.
+        self.assertGreaterEqual(
+            self.clock.time() - self.clock.start_tai, num_scripts * 1800
+        )
+        self.assertLess(time.monotonic() - start_time, 60)
+        self.assertEqual(script_class.script_states, [8] * num_scripts)
@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# This file is part of ts_IntegrationTests.
+#
+# Developed for the Vera C. Rubin Observatory Telescope & Site Software system.
+# This product includes software developed by the Vera C. Rubin Observatory
+# Project (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import asyncio
+
+from base_test import BaseTestClass
+from lsst.ts.IntegrationTests import AuxTelStop, FailingScriptQueueController
+
+
+class ScriptTimeoutTestCase(BaseTestClass):
+    """Test when a script never finishes."""
+
+    # Use the AuxTel ScriptQueue, with scripts ending UNFINISHED.
+    index = 2
+    controller_class = FailingScriptQueueController
+    controller_kwargs = dict(test_type="UNFINISHED")
+
+    async def test_script_timeout(self) -> None:
+        """Execute the AuxTelStop integration test script,
+        but leave the script RUNNING.
+        """
+        # Instantiate the AuxTelStop integration test.
+        script_class = AuxTelStop()
+        script_class.script_timeout = 2
+        # Execute the scripts.
+        # The script never finishes, so the run times out.
+        with self.assertRaises(asyncio.TimeoutError):
+            await script_class.run()
+        # Assert script was added to ScriptQueue.
+        self.assertEqual(len(self.controller.queue_list), 1)
+        # Assert no script finished.
+        self.assertEqual(script_class.script_states, [])
+
+    async def test_total_timeout(self) -> None:
+        """Execute the AuxTelStop integration test script, with an overall
+        timeout, but leave the script RUNNING.
+        """
+        # Instantiate the AuxTelStop integration test.
+        script_class = AuxTelStop()
+        script_class.timeout = 2
+        # Execute the scripts.
+        # The script never finishes, so the run times out.
+        with self.assertRaises(asyncio.TimeoutError):
+            await script_class.run()
+        self.assertFalse(script_class.all_scripts_done)
@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# This file is part of ts_IntegrationTests.
+#
+# Developed for the Vera C. Rubin Observatory Telescope & Site Software system.
+# This product includes software developed by the Vera C. Rubin Observatory
+# Project (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import json
+import os
+import tempfile
+
+from base_test import BaseTestClass
+from lsst.ts.IntegrationTests import AuxTelStandbyDisabled, ResultsDatabase
+
+
+class ScriptTimingTestCase(BaseTestClass):
+    """Test the timing recorded by the BaseScript runs."""
+
+    # Use AuxTel ScriptQueue.
+    index = 2
+
+    async def test_script_timing(self) -> None:
+        """Execute the AuxTelStandbyDisabled integration test script,
+        and check the timeline of each script and the JSON lines written.
+        """
+        script_class = AuxTelStandbyDisabled()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            script_class.timing_file = os.path.join(temp_dir, "timing.jsonl")
+            script_class.results_db = os.path.join(temp_dir, "results.sqlite3")
+            await script_class.run()
+            with open(script_class.timing_file) as timing_file:
+                records = [json.loads(line) for line in timing_file]
+            with ResultsDatabase(script_class.results_db) as results_db:
+                durations = results_db.get_durations("run")
+                entry_points = results_db.connection.execute(
+                    "SELECT entry_point FROM runs"
+                ).fetchall()
+        # Assert the run is recorded with the class name, as it is not
+        # started by a command.
+        self.assertEqual(entry_points, [("AuxTelStandbyDisabled",)])
+        timing = script_class.timing
+        self.assertEqual(timing.name, "AuxTelStandbyDisabled")
+        self.assertEqual(timing.index, self.index)
+        self.assertGreaterEqual(timing.pause_duration, 0)
+        self.assertGreaterEqual(timing.resume_duration, 0)
+        self.assertGreater(timing.duration, 0)
+        # Assert each script has a full timeline, in the scripts order.
+        self.assertEqual(
+            [script.script_index for script in timing.scripts],
+            script_class.script_indexes,
+        )
+        for script, (path, is_standard) in zip(timing.scripts, script_class.scripts):
+            self.assertEqual(script.path, path)
+            self.assertEqual(script.is_standard, is_standard)
+            self.assertEqual(script.script_state, 8)
+            for state in ("LOADING", "CONFIGURED", "RUNNING", "DONE"):
+                self.assertIn(state, script.state_times)
+            self.assertGreaterEqual(script.add_duration, 0)
+            self.assertGreaterEqual(script.load_duration, 0)
+            self.assertGreater(script.run_duration, 0)
+        # Assert one JSON line is written per script.
+        self.assertEqual(len(records), len(script_class.scripts))
+        for record, script in zip(records, timing.scripts):
+            self.assertEqual(record["run_id"], timing.run_id)
+            self.assertEqual(record["script_index"], script.script_index)
+            self.assertEqual(record["script_state"], "DONE")
+            self.assertEqual(record["run_duration"], script.run_duration)
+        # Assert the run is added to the results database.
+        self.assertEqual(
+            durations,
+            {
+                "set_summary_state.py": [
+                    script.run_duration for script in timing.scripts
+                ]
+            },
+        )
+
+    async def test_timing_rerun(self) -> None:
+        """Run the same integration test script twice, and check the
+        second timeline holds only the scripts of the second run.
+        """
+        script_class = AuxTelStandbyDisabled()
+        await script_class.run()
+        first_indexes = list(script_class.script_indexes)
+        await script_class.run()
+        timing = script_class.timing
+        self.assertEqual(
+            [script.script_index for script in timing.scripts],
+            script_class.script_indexes,
+        )
+        self.assertTrue(set(first_indexes).isdisjoint(script_class.script_indexes))
+        for script in timing.scripts:
+            self.assertEqual(script.script_state, 8)
+            self.assertLessEqual(timing.start_time, script.state_times["LOADING"])
+        # Assert no state is left waiting for an acknowledgement.
+        self.assertEqual(script_class.early_states, {})
+
+    async def test_timing_write_error(self) -> None:
+        """Ensure failing to write the timing does not fail the run."""
+        script_class = AuxTelStandbyDisabled()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            # A directory cannot be opened as the timing file.
+            script_class.timing_file = temp_dir
+            with self.assertLogs(script_class.log, level="WARNING"):
+                await script_class.run()
+        self.assertEqual(
+            script_class.script_states, [8] * len(AuxTelStandbyDisabled.scripts)
+        )
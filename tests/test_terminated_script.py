@@ -22,22 +22,16 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 from base_test import BaseTestClass
-from lsst.ts import salobj
 from lsst.ts.IntegrationTests import AuxTelHousekeeping, FailingScriptQueueController
 
 
 class TerminatedScriptTestCase(BaseTestClass):
     """Test when a script is TERMINATED."""
 
-    async def asyncSetUp(self) -> None:
-        # Define LSST_TOPIC_SUBNAME.
-        salobj.set_test_topic_subname()
-
-        # Create the ScriptQueue Controller.
-        self.controller = FailingScriptQueueController(index=2, test_type="TERMINATED")
-
-        # Start the controller and wait for it be ready.
-        await self.controller.start_task
+    # Use the AuxTel ScriptQueue, with scripts ending TERMINATED.
+    index = 2
+    controller_class = FailingScriptQueueController
+    controller_kwargs = dict(test_type="TERMINATED")
 
     async def test_failed_script(self) -> None:
         """Execute the AuxTelHousekeeping integration test script,
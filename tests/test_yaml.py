@@ -21,11 +21,10 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import subprocess
 import unittest
 
 from lsst.ts import IntegrationTests
-from lsst.ts.IntegrationTests.configs.config_registry import registry
+from lsst.ts.IntegrationTests.configs.config_registry import ConfigRegistry, registry
 
 
 class YamlTestCase(unittest.TestCase):
@@ -48,19 +47,20 @@ class YamlTestCase(unittest.TestCase):
 
         """
         bad_yaml = IntegrationTests.bad_yaml()
-        args = ["yamllint", "-"]
-        byte_string = bytes(bad_yaml, "utf-8")
-        child_proccess = subprocess.Popen(
-            args, stdin=subprocess.PIPE, stdout=subprocess.PIPE
+        assert any(
+            "error" in problem for problem in IntegrationTests.lint_yaml(bad_yaml)
         )
-        child_proccess.stdin.write(byte_string)  # type: ignore
-        result = child_proccess.communicate()[0]  # type: bytes
-        result_str = result.decode("utf-8")  # type: str
-        child_proccess.stdin.close()  # type: ignore
-        if any(exception in result_str for exception in ("warning", "error")):
-            assert True
-        else:
-            assert False
+        with self.assertRaises(AssertionError):
+            IntegrationTests.assert_yaml_formatted("bad", bad_yaml)
+        # Ensure every bad string is reported by the batch check.
+        with self.assertRaisesRegex(AssertionError, "(?s)bad1.*bad2"):
+            IntegrationTests.assert_all_yaml_formatted(
+                {
+                    "bad1": bad_yaml,
+                    "test": IntegrationTests.yaml_test_string1(),
+                    "bad2": bad_yaml,
+                }
+            )
 
     def test_script_configs(self) -> None:
         """Test the IntegrationTests.configs are
@@ -73,6 +73,36 @@ class YamlTestCase(unittest.TestCase):
         length = len(registry_keys)
         assert length > 0
         # Verify the configurations are properly YAML-formatted.
-        for key in registry_keys:
-            yaml_string = registry[key]
-            IntegrationTests.assert_yaml_formatted(key, yaml_string)
+        IntegrationTests.assert_all_yaml_formatted(registry)
+
+    def test_lazy_rendering(self) -> None:
+        """Test the configurations are rendered once, on first access,
+        whether they are stored as strings, dictionaries or functions.
+
+        """
+        calls = []
+
+        def config() -> dict:
+            calls.append(None)
+            return {"component": "ATDome", "cmd": "homeAzimuth"}
+
+        test_registry = ConfigRegistry()
+        test_registry[
+            "string"
+        ] = """
+            component: "ATDome"
+            cmd: "homeAzimuth"
+            """
+        test_registry["dict"] = {"component": "ATDome", "cmd": "homeAzimuth"}
+        test_registry["function"] = config
+        # Ensure the function is not called until the configuration is read.
+        assert "function" in test_registry
+        assert calls == []
+        config_yamls = [test_registry[key] for key in ("string", "dict", "function")]
+        assert config_yamls[0] == config_yamls[1] == config_yamls[2]
+        assert config_yamls[0].startswith("---")
+        # Ensure the rendered configuration is reused.
+        assert test_registry["function"] is config_yamls[2]
+        assert len(calls) == 1
+        with self.assertRaises(ValueError):
+            test_registry["dict"] = {}